@@ -2,6 +2,100 @@
 Advent of Code 2023: Day 1
 """
 import re
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
+
+
+DIGITS = {str(d).encode(): d for d in range(10)}
+DIGIT_WORDS = {b'one': 1, b'two': 2, b'three': 3, b'four': 4, b'five': 5,
+               b'six': 6, b'seven': 7, b'eight': 8, b'nine': 9}
+
+
+def _build_automaton(patterns: dict[bytes, int]) -> tuple[bytes, bytes]:
+    """
+    Aho-Corasick automaton over `patterns`, flattened to a DFA. Returns the
+    transition table indexed by state << 8 | byte, and per state the value + 1
+    of the pattern that ends on entering it (0 for none).
+    """
+    goto, out = [{}], [0]
+    for word, value in patterns.items():
+        state = 0
+        for b in word:
+            if b not in goto[state]:
+                goto[state][b] = len(goto)
+                goto.append({})
+                out.append(0)
+            state = goto[state][b]
+        out[state] = value + 1
+    assert len(goto) <= 256, 'states must fit in a byte'
+
+    delta = bytearray(len(goto) * 256)
+    fail = [0] * len(goto)
+    queue = deque()
+    for b, state in goto[0].items():
+        delta[b] = state
+        queue.append(state)
+    while queue:
+        state = queue.popleft()
+        # a pattern ending at the failure state also ends here
+        out[state] = out[state] or out[fail[state]]
+        for b in range(256):
+            if b in goto[state]:
+                child = goto[state][b]
+                fail[child] = delta[fail[state] << 8 | b]
+                delta[state << 8 | b] = child
+                queue.append(child)
+            else:
+                delta[state << 8 | b] = delta[fail[state] << 8 | b]
+
+    return bytes(delta), bytes(out)
+
+
+def _build_scanner(patterns: dict[bytes, int]) -> tuple:
+    """Automata matching the patterns forwards and, reversed, backwards."""
+    return _build_automaton(patterns), _build_automaton({w[::-1]: v for w, v in patterns.items()})
+
+
+# no digit word contains another, so the match that ends first also starts first
+WORD_SCANNER = _build_scanner(DIGITS | DIGIT_WORDS)
+
+
+def _calibration_sum(data: bytes, scanner: tuple) -> int:
+    """
+    Sum of first and last digit per line of a buffer of whole lines. Each line
+    is scanned from its start up to the first match and from its end back to
+    the last, so the middle of a line is never read.
+    """
+    (fwd, fwd_out), (bwd, bwd_out) = scanner
+    total = 0
+    pos, size = 0, len(data)
+    while pos < size:
+        end = data.find(b'\n', pos)
+        if end < 0:
+            end = size
+        if end > pos:
+            state, i = 0, pos
+            while i < end:
+                state = fwd[state << 8 | data[i]]
+                if fwd_out[state]:
+                    break
+                i += 1
+            else:
+                raise ValueError(f'no digit in line at byte {pos}')
+            first = fwd_out[state] - 1
+
+            state, i = 0, end - 1
+            while not bwd_out[state]:
+                state = bwd[state << 8 | data[i]]
+                i -= 1
+            total += 10 * first + bwd_out[state] - 1
+        pos = end + 1
+
+    return total
 
 
 def part1(input_list: list) -> int:
@@ -43,9 +137,64 @@ def part2(input_list: list) -> int:
     return total_sum
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2023/day01/input.txt', 'r') as f:
+def part1_stream(filename: str) -> int:
+    """part1 over lines read straight from the file."""
+    return part1(stream.text_lines(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 over lines read straight from the file."""
+    return part2(stream.text_lines(filename))
+
+
+def _scan_range(filename: str, start: int, end: int) -> int:
+    total = 0
+    with stream.LineSource(filename, start, end) as source:
+        for chunk in source.chunks():
+            total += _calibration_sum(chunk.tobytes(), WORD_SCANNER)
+            chunk.release()
+
+    return total
+
+
+def _digits_range(filename: str, start: int, end: int) -> int:
+    # without digit words a single regex finds both ends of every line in C
+    pattern = re.compile(rb"^\D*(\d)(?:.*(\d))?", re.MULTILINE)
+    total = 0
+    with stream.LineSource(filename, start, end) as source:
+        for chunk in source.chunks():
+            for first, last in pattern.findall(chunk):
+                total += 10 * (first[0] - 48) + (last or first)[0] - 48
+            chunk.release()
+
+    return total
+
+
+def part2_scan(filename: str) -> int:
+    """part2 running the digit word automaton over the mapped file."""
+    return _scan_range(filename, 0, None)
+
+
+def part1_parallel(filename: str, workers: int | None = None) -> int:
+    """part1 summed over line-aligned ranges of the file on a process pool."""
+    return sum(stream.map_ranges(_digits_range, filename, workers))
+
+
+def part2_parallel(filename: str, workers: int | None = None) -> int:
+    """part2 summed over line-aligned ranges of the file on a process pool."""
+    return sum(stream.map_ranges(_scan_range, filename, workers))
+
+
+def parse_input(filename: str) -> dict:
+    """Read calibration document lines."""
+    with open(filename, 'r') as f:
         inputs = f.readlines()
 
-    print(part1(inputs))
-    print(part2(inputs))
\ No newline at end of file
+    return {'input_list': inputs}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2023/day01/input.txt')
+
+    print(part1(**puzzle_input))
+    print(part2(**puzzle_input))
@@ -1,61 +1,189 @@
 """
 Advent of Code 2023: Day 2
 """
+import operator
 import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice
+from math import prod
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
 
 
 N_RED = 12
 N_GREEN = 13
 N_BLUE = 14
 
+DRAW = re.compile(r"(\d+)\s+(red|green|blue)")
+
+# largest prefix sum table BagIndex builds, beyond it the table gets coarser
+MAX_INDEX_CELLS = 1 << 20
+
+
+def coarse_axis(values, k: int) -> list[int]:
+    """At most k boundary values, the largest included, splitting values into even runs."""
+    values = sorted(values)
+    return sorted({values[(len(values) - 1) * j // k] for j in range(1, k + 1)})
+
+
+class BagIndex:
+    """
+    Answers "sum of the ids of games possible with this bag" for many bags.
+
+    Each color's maxima are compressed to boundary values and a 3D prefix sum
+    table holds, for every (red, green, blue) corner, the sum of ids of games
+    with all maxima within it. While the table fits in MAX_INDEX_CELLS every
+    distinct value is a boundary, and a query is three bisects and a lookup.
+
+    Past that, an axis keeps only k boundaries at even quantiles, with k^3
+    cells fitting the budget. The table answers for the boundary corner below
+    the bag, and the games between that corner and the bag lie in three
+    slabs, one per color, each holding the games between two neighbouring
+    boundaries. A query scans about 3n/k games, from slabs sorted by color.
+    """
+
+    def __init__(self, ids, max_red, max_green, max_blue):
+        columns = (max_red, max_green, max_blue)
+        self.axes = [sorted(set(values)) for values in columns]
+        self.slabs = None
+
+        if prod(len(axis) + 1 for axis in self.axes) > MAX_INDEX_CELLS:
+            k = max(1, round(MAX_INDEX_CELLS ** (1 / 3)) - 1)
+            while k > 1 and (k + 1) ** 3 > MAX_INDEX_CELLS:
+                k -= 1
+            self.axes = [axis if len(axis) <= k else coarse_axis(values, k)
+                         for axis, values in zip(self.axes, columns)]
 
-def part1(gmap: dict) -> int:
+        # cell 0 on each axis stands for limits below every boundary, and
+        # a game counts at the first boundary not below its maximum
+        n_red, n_green, n_blue = (len(axis) + 1 for axis in self.axes)
+        plane, row = n_green * n_blue, n_blue
+        table = [0] * (n_red * plane)
+        red_axis, green_axis, blue_axis = self.axes
+        cells = [(bisect_left(red_axis, r), bisect_left(green_axis, g), bisect_left(blue_axis, b))
+                 for r, g, b in zip(max_red, max_green, max_blue)]
+        for i, (r, g, b) in zip(ids, cells):
+            table[(r + 1) * plane + (g + 1) * row + b + 1] += i
+
+        # prefix sums along blue, then green, then red
+        for start in range(0, len(table), row):
+            table[start:start + row] = accumulate(table[start:start + row])
+        for r in range(n_red):
+            for start in range(r * plane + row, (r + 1) * plane, row):
+                table[start:start + row] = map(operator.add, table[start:start + row],
+                                               table[start - row:start])
+        for start in range(plane, len(table), plane):
+            table[start:start + plane] = map(operator.add, table[start:start + plane],
+                                             table[start - plane:start])
+        self.table, self.plane, self.row = table, plane, row
+
+        # games strictly below their boundary on a coarse axis, by color and boundary
+        if any(len(axis) < len(set(values)) for axis, values in zip(self.axes, columns)):
+            games = list(zip(max_red, max_green, max_blue, ids))
+            self.slabs = []
+            for color, axis in enumerate(self.axes):
+                slabs = [[] for _ in range(len(axis) + 1)]
+                for game, cell in zip(games, cells):
+                    if game[color] != axis[cell[color]]:
+                        slabs[cell[color]].append(game)
+                self.slabs.append([(sorted(slab, key=operator.itemgetter(color)),
+                                    sorted(game[color] for game in slab)) for slab in slabs])
+
+    def query(self, red: int, green: int, blue: int) -> int:
+        """Sum of the ids of games whose maxima all fit in the bag."""
+        red_axis, green_axis, blue_axis = self.axes
+        r, g, b = bisect_right(red_axis, red), bisect_right(green_axis, green), \
+            bisect_right(blue_axis, blue)
+        total = self.table[r * self.plane + g * self.row + b]
+        if self.slabs is None:
+            return total
+
+        # the corner the table answered for (counts are never negative, so -1
+        # is below every game) and the slabs from there out to the bag
+        red_lim = red_axis[r - 1] if r else -1
+        green_lim = green_axis[g - 1] if g else -1
+        (reds, red_keys), (greens, green_keys), (blues, blue_keys) = (
+            slabs[cell] for slabs, cell in zip(self.slabs, (r, g, b)))
+        total += sum(i for _, gg, bb, i in islice(reds, bisect_right(red_keys, red))
+                     if gg <= green and bb <= blue)
+        total += sum(i for rr, _, bb, i in islice(greens, bisect_right(green_keys, green))
+                     if rr <= red_lim and bb <= blue)
+        total += sum(i for rr, gg, _, i in islice(blues, bisect_right(blue_keys, blue))
+                     if rr <= red_lim and gg <= green_lim)
+        return total
+
+    def query_many(self, bags) -> list[int]:
+        return [self.query(*bag) for bag in bags]
+
+
+def part1(ids: array, max_red: array, max_green: array, max_blue: array) -> int:
     """Evaluate valid results."""
-    # to determine if a given game is valid, need max of each color and compare to upper limit
-    total = 0
-    for id, res in gmap.items():
-        max_red = max(d.get("red", 0) for d in res)
-        max_green = max(d.get("green", 0) for d in res)
-        max_blue = max(d.get("blue", 0) for d in res)
-
-        if max_red <= N_RED and max_green <= N_GREEN and max_blue <= N_BLUE:
-            total += id
-    
-    return total
+    # a game is valid if the max of each color is within the upper limit
+    return sum(i for i, r, g, b in zip(ids, max_red, max_green, max_blue)
+               if r <= N_RED and g <= N_GREEN and b <= N_BLUE)
 
 
-def part2(gmap: dict) -> int:
+def part2(max_red: array, max_green: array, max_blue: array) -> int:
     """Find lcd of colors and sum product over all games."""
-    total = 0
-    for id, res in gmap.items():
-        max_red = max(d.get("red", 0) for d in res)
-        max_green = max(d.get("green", 0) for d in res)
-        max_blue = max(d.get("blue", 0) for d in res)
+    return sum(r * g * b for r, g, b in zip(max_red, max_green, max_blue))
+
+
+def part1_index(ids: array, max_red: array, max_green: array, max_blue: array) -> int:
+    """part1 as a single query of a BagIndex."""
+    return BagIndex(ids, max_red, max_green, max_blue).query(N_RED, N_GREEN, N_BLUE)
 
-        total += max_red * max_green * max_blue
+
+def part1_stream(filename: str) -> int:
+    """part1 one game at a time, straight from the file."""
+    total = 0
+    for g in stream.text_lines(filename):
+        i, r, gr, b = game_maxima(g)
+        if r <= N_RED and gr <= N_GREEN and b <= N_BLUE:
+            total += i
 
     return total
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2023/day02/input.txt', 'r') as f:
-        raw_games = f.readlines()
+def part2_stream(filename: str) -> int:
+    """part2 one game at a time, straight from the file."""
+    total = 0
+    for g in stream.text_lines(filename):
+        _, r, gr, b = game_maxima(g)
+        total += r * gr * b
+
+    return total
 
+
+def game_maxima(g: str) -> tuple[int, int, int, int]:
+    """Reduce one game record to its id and the most cubes of each color drawn."""
     # game structure is id: subsets
     # subset structure is X red Y blue Z green
-    # games_map {1: [{red: , green: , blue }, {red: , green: , blue: }]}
-
-    games_map = {}
-    for g in raw_games:
-        gameid, results = g.split(':')
-        id = int(gameid.split(' ')[-1])
-        games_map[id] = []
-
-        subsets = results.split(';')
-        for subset in subsets:
-            colors = re.findall(r"\d+\s+\w+", subset)
-            subset_result = {i.split(" ")[-1]: int(i.split(" ")[0]) for i in colors}
-            games_map[id].append(subset_result)
-
-    print(part1(games_map))
-    print(part2(games_map))
+    gameid, results = g.split(':')
+    maxima = {'red': 0, 'green': 0, 'blue': 0}
+    for n, color in DRAW.findall(results):
+        maxima[color] = max(maxima[color], int(n))
+
+    return int(gameid.split(' ')[-1]), maxima['red'], maxima['green'], maxima['blue']
+
+
+def parse_input(filename: str) -> dict:
+    """Parse game records into columns of game id and max cubes drawn per color."""
+    columns = {'ids': array('q'), 'max_red': array('q'), 'max_green': array('q'),
+               'max_blue': array('q')}
+    with open(filename, 'r') as f:
+        for g in f:
+            for column, value in zip(columns.values(), game_maxima(g)):
+                column.append(value)
+
+    return columns
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2023/day02/input.txt')
+
+    print(part1(**puzzle_input))
+    print(part2(puzzle_input['max_red'], puzzle_input['max_green'], puzzle_input['max_blue']))
@@ -2,6 +2,17 @@
 Advent of Code 2023: Day 3
 """
 import re
+import sys
+from array import array
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
+
+
+# 1 for every byte part1 treats as a symbol, the complement of [.\d\n]
+SYMBOLS = bytes(0 if chr(c) in '.0123456789\n' else 1 for c in range(256))
 
 
 def part1(schem: list) -> int:
@@ -47,6 +58,27 @@ def part1(schem: list) -> int:
     return total
 
 
+def symbol_mask(grid: Grid) -> bytes:
+    """
+    Per cell 1 if it is a symbol or next to one (diagonals included), else 0.
+    Each cell is a byte of one big int, so the dilation is four shifts: one
+    cell left and right, then one row up and down.
+    """
+    n_bits = 8 * len(grid.cells)
+    near = int.from_bytes(grid.cells.translate(SYMBOLS), 'little')
+    near |= near << 8 | near >> 8
+    near |= near << 8 * grid.stride | near >> 8 * grid.stride
+    return (near & ((1 << n_bits) - 1)).to_bytes(n_bits // 8, 'little')
+
+
+def part1_mask(grid: Grid) -> int:
+    """part1 accepting each number by looking for a 1 in the mask over its span."""
+    mask = symbol_mask(grid)
+    # the '.' border keeps numbers on neighbouring rows apart
+    return sum(int(m.group()) for m in re.finditer(rb"\d+", grid.cells)
+               if mask.find(1, m.start(), m.end()) >= 0)
+
+
 def part2(schem: list) -> int:
     """
     Find gear ratios!
@@ -72,7 +104,7 @@ def part2(schem: list) -> int:
             potential_lines += raw_nums.get(i)
             if i > 0:
                 potential_lines += raw_nums.get(i-1)
-            if i < len(schem):
+            if i < len(schem) - 1:
                 potential_lines += raw_nums.get(i+1)
 
             for num in potential_lines:
@@ -86,9 +118,126 @@ def part2(schem: list) -> int:
     return gear_ratio
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2023/day03/input.txt', 'r') as f:
+class _Row:
+    """One slot of the streaming ring buffer, reloaded with each new row."""
+    __slots__ = ('cells', 'symbols', 'labels', 'numbers')
+
+    def __init__(self, width: int):
+        # padded with '.' so neighbours of the first and last column exist
+        self.cells = bytearray(b'.' * (width + 2))
+        self.symbols = 0
+        self.labels = array('l', [0]) * (width + 2)
+        self.numbers = []
+
+    def load(self, line: bytes):
+        if len(line) != len(self.cells) - 2:
+            raise ValueError(f'schematic row of width {len(line)}, expected {len(self.cells) - 2}')
+        self.cells[1:-1] = line
+        # symbol cells as one big int, a byte per cell as in symbol_mask
+        self.symbols = int.from_bytes(self.cells.translate(SYMBOLS), 'little')
+        for start, end, _ in self.numbers:
+            self.labels[start:end] = array('l', [0]) * (end - start)
+        self.numbers.clear()
+        for m in re.finditer(rb"\d+", self.cells):
+            self.numbers.append((m.start(), m.end(), int(m.group())))
+            self.labels[m.start():m.end()] = array('l', [len(self.numbers)]) * (m.end() - m.start())
+
+
+def _finalize(prev: _Row, mid: _Row, nxt: _Row) -> tuple[int, int]:
+    """Part number and gear ratio sums of the middle row, now that its neighbours are known."""
+    n_bits = 8 * len(mid.cells)
+    near = prev.symbols | mid.symbols | nxt.symbols
+    near |= near << 8 | near >> 8
+    mask = (near & ((1 << n_bits) - 1)).to_bytes(n_bits // 8, 'little')
+    part_sum = sum(value for start, end, value in mid.numbers if mask.find(1, start, end) >= 0)
+
+    gear_sum = 0
+    rows = (prev, mid, nxt)
+    for m in re.finditer(rb"\*", mid.cells):
+        col = m.start()
+        adjacent = {(r, label) for r, row in enumerate(rows)
+                    for label in row.labels[col - 1:col + 2] if label}
+        if len(adjacent) == 2:
+            (r1, a), (r2, b) = adjacent
+            gear_sum += rows[r1].numbers[a - 1][2] * rows[r2].numbers[b - 1][2]
+
+    return part_sum, gear_sum
+
+
+def stream_rows(filename: str):
+    """
+    Yield (part number sum, gear ratio sum) for each row of the schematic as
+    soon as the row below it has been read. Rows go through a ring of three
+    preallocated slots, so memory does not depend on the number of rows.
+    """
+    ring = None
+    n_rows = 0
+    for line in stream.lines(filename):
+        if not line:
+            continue
+        if ring is None:
+            # slot 3 stays blank and stands in above the first and below the last row
+            ring = [_Row(len(line)) for _ in range(4)]
+        ring[n_rows % 3].load(line)
+        n_rows += 1
+        if n_rows >= 2:
+            prev = ring[(n_rows - 3) % 3] if n_rows >= 3 else ring[3]
+            yield _finalize(prev, ring[(n_rows - 2) % 3], ring[(n_rows - 1) % 3])
+    if n_rows:
+        prev = ring[(n_rows - 2) % 3] if n_rows >= 2 else ring[3]
+        yield _finalize(prev, ring[(n_rows - 1) % 3], ring[3])
+
+
+def part1_stream(filename: str) -> int:
+    """part1 holding only three rows of the schematic at a time."""
+    return sum(part_sum for part_sum, _ in stream_rows(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 holding only three rows of the schematic at a time."""
+    return sum(gear_sum for _, gear_sum in stream_rows(filename))
+
+
+def number_labels(grid: Grid) -> tuple[array, list[int]]:
+    """
+    Label grid over the padded cells: each digit holds the id + 1 of the
+    number it belongs to, every other cell 0. Also returns the numbers by id.
+    """
+    labels = array('l', bytes(len(grid.cells) * array('l').itemsize))
+    numbers = []
+    for m in re.finditer(rb"\d+", grid.cells):
+        numbers.append(int(m.group()))
+        labels[m.start():m.end()] = array('l', [len(numbers)]) * (m.end() - m.start())
+
+    return labels, numbers
+
+
+def part2_labels(grid: Grid) -> int:
+    """part2 resolving each gear's neighbours through the label grid."""
+    labels, numbers = number_labels(grid)
+    surrounding = grid.surrounding
+    gear_ratio = 0
+    for m in re.finditer(rb"\*", grid.cells):
+        # a number touching the gear in several cells is counted once
+        adjacent = {labels[m.start() + offset] for offset in surrounding}
+        adjacent.discard(0)
+        if len(adjacent) == 2:
+            a, b = adjacent
+            gear_ratio += numbers[a - 1] * numbers[b - 1]
+
+    return gear_ratio
+
+
+def parse_input(filename: str) -> dict:
+    """Read engine schematic lines."""
+    with open(filename, 'r') as f:
         schematic = f.readlines()
 
-    print(f"Sum of part numbers {part1(schematic)}")
-    print(f"Gear ratio: {part2(schematic)}")
+    return {'schem': schematic, 'grid': Grid(schematic, border='.')}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2023/day03/input.txt')
+
+    print(f"Sum of part numbers {part1(puzzle_input['schem'])}")
+    print(f"Gear ratio: {part2(puzzle_input['schem'])}")
@@ -1,53 +1,116 @@
 """
 Advent of Code 2023: Day 4
 """
+from array import array
+from collections import deque
+import sys
+from pathlib import Path
 
-def part1(cards: list) -> int:
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
+
+
+# card numbers are below 100, so a set of them fits in two 64 bit words
+WORDS = 2
+WORD_MASK = (1 << 64) - 1
+
+
+def card_masks(card: str) -> tuple[int, int]:
+    """Winning numbers and entries of one card as bitmasks, bit n set for number n."""
+    winners, entries = card.split(':')[1].split('|')
+    masks = []
+    for numbers in (winners, entries):
+        mask = 0
+        for n in numbers.split():
+            mask |= 1 << int(n)
+        if mask >> 64 * WORDS:
+            raise ValueError(f'card number over {64 * WORDS - 1}: {card.strip()!r}')
+        masks.append(mask)
+
+    return masks[0], masks[1]
+
+
+def match_counts(winners: array, entries: array) -> list[int]:
+    """Matches per card: popcount of winners AND entries, summed over the card's words."""
+    bits = [(w & e).bit_count() for w, e in zip(winners, entries)]
+    return [sum(bits[k:k + WORDS]) for k in range(0, len(bits), WORDS)]
+
+
+def part1(winners: array, entries: array) -> int:
     """Sum scores per card."""
-    total_tally = 0
-    for card in cards:
-        numbers = card.split(':')[1]
-        winners, entries = numbers.split('|')
-        winners = winners.split()
-        entries = entries.split()
+    return sum(1 << (n - 1) for n in match_counts(winners, entries) if n)
 
-        matches = [e for e in entries if e in winners]
-        if matches:
-            total_tally += 1 * max(1, 2**(len(matches)-1))
 
-    return total_tally
+def part2(winners: array, entries: array) -> int:
+    """
+    Find copies of cards and see how many total cards you collect at the end.
+    Card k with n wins adds its copy count to cards k+1..k+n, so the counts
+    are a running sum over a difference array: +copies at k+1, -copies past
+    k+n. Linear in the number of cards however many copies are won.
+    """
+    wins = match_counts(winners, entries)
+    n_orig = len(wins) # make sure not to go past end of table
+
+    diff = [0] * (n_orig + 1)
+    running = 0
+    total_cards = 0
+    for k, n_wins in enumerate(wins):
+        running += diff[k]
+        copies = 1 + running
+        total_cards += copies
+        if n_wins:
+            diff[k + 1] += copies
+            diff[min(n_orig, k + 1 + n_wins)] -= copies
+
+    return total_cards
 
 
-def part2(cards: list) -> int:
-    """Find copies of cards and see how many total cards you collect at the end."""
-    n_orig = len(cards) # make sure not to go past end of table
+def part1_stream(filename: str) -> int:
+    """part1 over cards read straight from the file."""
+    total_tally = 0
+    for card in stream.text_lines(filename):
+        winners, entries = card_masks(card)
+        n_wins = (winners & entries).bit_count()
+        if n_wins:
+            total_tally += 1 << (n_wins - 1)
+
+    return total_tally
+
 
-    # build map of number of winners per card to avoid recomputation
-    card_wins = {}
-    for card in cards:
-        i, numbers = card.split(':')
-        i = int(i.replace('Card', ''))
+def part2_stream(filename: str) -> int:
+    """
+    Count cards in one pass. A card only hands copies to the next few cards,
+    so only the pending copy counts for those are kept.
+    """
+    total = 0
+    pending = deque()
+    for card in stream.text_lines(filename):
+        winners, entries = card_masks(card)
+        n_wins = (winners & entries).bit_count()
 
-        winners, entries = numbers.split('|')
-        winners = winners.split()
-        entries = entries.split()
+        copies = 1 + (pending.popleft() if pending else 0)
+        total += copies
+        while len(pending) < n_wins:
+            pending.append(0)
+        for k in range(n_wins):
+            pending[k] += copies
 
-        matches = [e for e in entries if e in winners]
-        card_wins[i] = len(matches)
+    return total
 
-    cards_to_proc = list(card_wins.keys())
-    for card in cards_to_proc:
-        n_wins = card_wins[card]
 
-        cards_to_add = cards_to_proc[card:min(n_orig, card+n_wins)]
-        cards_to_proc += cards_to_add
+def parse_input(filename: str) -> dict:
+    """Read scratch cards as winner and entry bitmasks, WORDS uint64 per card each."""
+    winners, entries = array('Q'), array('Q')
+    with open(filename, 'r') as f:
+        for card in f:
+            for column, mask in zip((winners, entries), card_masks(card)):
+                column.extend((mask >> 64 * k) & WORD_MASK for k in range(WORDS))
 
-    return len(cards_to_proc)
+    return {'winners': winners, 'entries': entries}
 
 
 if __name__ == '__main__':
-    with open('advent_of_code/2023/day04/input.txt', 'r') as f:
-        scratch_cards = f.readlines()
+    puzzle_input = parse_input('advent_of_code/2023/day04/input.txt')
 
-    print(f"Scratch cards score: {part1(scratch_cards)}")
-    print(f"Scratch card count: {part2(scratch_cards)}")
+    print(f"Scratch cards score: {part1(**puzzle_input)}")
+    print(f"Scratch card count: {part2(**puzzle_input)}")
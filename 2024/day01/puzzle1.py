@@ -3,31 +3,157 @@ Advent of Code 2024: Day 1
 Historian Hysteria
 """
 import collections
+import operator
+import os
+import sys
+from array import array
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import extsort, stream  # pylint: disable=wrong-import-position
+from aoc.memo import memoize  # pylint: disable=wrong-import-position
 
-def part1(left: list, right: list) -> int:
+
+def part1(left: array, right: array) -> int:
     """Calculate pairwise difference"""
-    lens = [abs(i[0] - i[1]) for i in zip(left, right)]
+    # map chains run the subtraction and abs in C, element by element
+    return sum(map(abs, map(operator.sub, left, right)))
 
-    return sum(lens)
 
+def part2(left: array, right: array) -> int:
+    """
+    Return similarity score. Both columns are sorted, so they are merge-joined:
+    the right cursor only moves forward, and repeated ids on the left reuse
+    the score of the first.
+    """
+    score = 0
+    j, n = 0, len(right)
+    prev, prev_score = None, 0
+    for i in left:
+        if i != prev:
+            while j < n and right[j] < i:
+                j += 1
+            k = j
+            while k < n and right[k] == i:
+                k += 1
+            prev, prev_score = i, i * (k - j)
+            j = k
+        score += prev_score
 
-def part2(left: list, right: list) -> int:
-    """Return similarity score."""
-    right_map = collections.Counter(right)
-    sim_scores = [i * right_map[i] for i in left if i in right_map]
+    return score
 
-    return sum(sim_scores)
 
+def part1_numpy(left: array, right: array) -> int:
+    """part1 as one vector subtraction over the typed columns, without copying them."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day01/input.txt', 'r', encoding='utf-8') as f:
-        locations = f.readlines()
+    return int(np.abs(np.frombuffer(left, dtype=np.int64) - np.frombuffer(right, dtype=np.int64)).sum())
+
+
+def part2_numpy(left: array, right: array) -> int:
+    """part2 with the merge-join done as two vectorised searches of the right column."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    left, right = np.frombuffer(left, dtype=np.int64), np.frombuffer(right, dtype=np.int64)
+    counts = np.searchsorted(right, left, side='right') - np.searchsorted(right, left, side='left')
+    return int((left * counts).sum())
+
+
+def part1_stream(filename: str) -> int:
+    """
+    part1 from the file. Sorting needs every value, so they are held in
+    8 byte typed arrays rather than lists of int objects.
+    """
+    left, right = array('q'), array('q')
+    for line in stream.lines(filename):
+        l, r = line.split()
+        left.append(int(l))
+        right.append(int(r))
+
+    return part1(array('q', sorted(left)), array('q', sorted(right)))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 in one pass, keeping a count per distinct location id."""
+    left, right = collections.Counter(), collections.Counter()
+    for line in stream.lines(filename):
+        l, r = line.split()
+        left[int(l)] += 1
+        right[int(r)] += 1
+
+    return sum(i * n * right[i] for i, n in left.items() if i in right)
+
+
+def merge_pass(filename: str, budget: int | str | None = None) -> tuple[int, int]:
+    """
+    Distance and similarity score for location lists larger than memory. Each
+    column is sorted into runs on disk within half the budget, then a single
+    merge pass walks both sorted columns in step for the distance while a
+    second cursor over the right column merge-joins the similarity. The
+    budget defaults to AOC_SORT_BUDGET. The answers for the last file and
+    budget are kept, so part1_external and part2_external share one pass.
+    """
+    stat = os.stat(filename)
+    return _merge_pass(str(filename), extsort.resolve_budget(budget), stat.st_size, stat.st_mtime_ns)
 
-    # convert to list(list(int))
-    locations = [[int(l.split(' ')[0]), int(l.split(' ')[-1].strip())] for l in locations]
-    left_list = sorted([l[0] for l in locations])
-    right_list = sorted([l[1] for l in locations])
 
-    print(part1(left_list, right_list))
-    print(part2(left_list, right_list))
+@memoize(maxsize=1)
+def _merge_pass(filename: str, budget: int,
+                size: int, mtime_ns: int) -> tuple[int, int]:  # pylint: disable=unused-argument
+    # size and mtime_ns only key the memo, so a rewritten file is sorted again
+    # a share of 0 would read as "no budget" and fall back to the default
+    half, third = max(1, budget // 2), max(1, budget // 3)
+    with extsort.ExternalSorter(half) as left, extsort.ExternalSorter(half) as right:
+        for line in stream.lines(filename):
+            l, r = line.split()
+            left.add(int(l))
+            right.add(int(r))
+
+        # three cursors read the runs back, each within a third of the budget
+        join = right.merged(third)
+        j = next(join, None)
+        distance = similarity = 0
+        prev, prev_score = None, 0
+        for l, r in zip(left.merged(third), right.merged(third)):
+            distance += abs(l - r)
+            if l != prev:
+                count = 0
+                while j is not None and j < l:
+                    j = next(join, None)
+                while j is not None and j == l:
+                    count += 1
+                    j = next(join, None)
+                prev, prev_score = l, l * count
+            similarity += prev_score
+
+    return distance, similarity
+
+
+def part1_external(filename: str, budget: int | str | None = None) -> int:
+    """part1 within a memory budget, see merge_pass."""
+    return merge_pass(filename, budget)[0]
+
+
+def part2_external(filename: str, budget: int | str | None = None) -> int:
+    """part2 within a memory budget, see merge_pass."""
+    return merge_pass(filename, budget)[1]
+
+
+def parse_input(filename: str) -> dict:
+    """
+    Read both location columns as sorted int64 typed arrays. The stdlib has no
+    sort for typed storage, so each column is sorted once as a list of ints and
+    packed back; the parts and the parse cache only ever see the packed arrays.
+    """
+    with open(filename, 'rb') as f:
+        values = array('q', map(int, f.read().split()))
+
+    # the file alternates left, right; strided slices split the columns
+    return {'left': array('q', sorted(values[0::2])), 'right': array('q', sorted(values[1::2]))}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day01/input.txt')
+
+    print(part1(**puzzle_input))
+    print(part2(**puzzle_input))
@@ -2,6 +2,11 @@
 Advent of Code 2024: Day 2
 Red-Nosed Reports
 """
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
 
 
 MIN_INC = 1     # minimum step size
@@ -102,11 +107,33 @@ def part2(reports_: list) -> int:
     return safe_reports
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day02/input.txt', 'r', encoding='utf-8') as f:
+def _stream_reports(filename: str):
+    for line in stream.lines(filename):
+        yield [int(i) for i in line.split()]
+
+
+def part1_stream(filename: str) -> int:
+    """part1 over reports read one at a time from the file."""
+    return part1(_stream_reports(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 over reports read one at a time from the file."""
+    return part2(_stream_reports(filename))
+
+
+def parse_input(filename: str) -> dict:
+    """Read each report as a list of levels."""
+    with open(filename, 'r', encoding='utf-8') as f:
         reports = f.readlines()
     reports = [level.replace('\n', '').split(' ') for level in reports]
     reports = [[int(i) for i in level] for level in reports]
 
-    print('Part 1: ', part1(reports))
-    print('Part 2: ', part2(reports))
+    return {'reports_': reports}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day02/input.txt')
+
+    print('Part 1: ', part1(**puzzle_input))
+    print('Part 2: ', part2(**puzzle_input))
@@ -3,6 +3,11 @@ Advent of Code 2024: Day 3
 Mull It Over
 """
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
 
 
 def part1(instrs: list) -> int:
@@ -39,9 +44,47 @@ def part2(instrs: list) -> int:
     return product
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day03/input.txt', 'r', encoding='utf-8') as f:
+def part1_stream(filename: str) -> int:
+    """part1 scanning the mapped file in chunks of whole lines."""
+    pattern = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+    product = 0
+    with stream.LineSource(filename) as source:
+        for chunk in source.chunks():
+            product += sum(int(a) * int(b) for a, b in pattern.findall(chunk))
+            chunk.release()
+
+    return product
+
+
+def part2_stream(filename: str) -> int:
+    """part2 scanning the mapped file in chunks of whole lines."""
+    pattern = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(don't\(\))|(do\(\))")
+    product = 0
+    enable_mult = True
+    with stream.LineSource(filename) as source:
+        for chunk in source.chunks():
+            for a, b, dont, do in pattern.findall(chunk):
+                if dont:
+                    enable_mult = False
+                elif do:
+                    enable_mult = True
+                elif enable_mult:
+                    product += int(a) * int(b)
+            chunk.release()
+
+    return product
+
+
+def parse_input(filename: str) -> dict:
+    """Read corrupted memory lines."""
+    with open(filename, 'r', encoding='utf-8') as f:
         instructions = f.readlines()
 
-    print(f"Part 1 Product is {part1(instructions)}")
-    print(f"Part 2 Product is {part2(instructions)}")
+    return {'instrs': instructions}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day03/input.txt')
+
+    print(f"Part 1 Product is {part1(**puzzle_input)}")
+    print(f"Part 2 Product is {part2(**puzzle_input)}")
@@ -2,103 +2,72 @@
 Advent of Code 2024: Day 4
 Ceres Search
 """
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
-def find_xmas(input_matrix, row, col):
+
+M, A, S = ord('M'), ord('A'), ord('S')
+
+
+def find_xmas(word_grid: Grid, idx: int) -> int:
     """
     Find instances of XMAS string.
 
     Given a start character, search in each direction for remaining characters.
-    Make eight new strings and check them for XMAS. Can search only in the
-    directions open confined to grid
+    The grid is padded three cells deep so walking off the edge only ever
+    lands on border cells.
     """
-    n_rows = len(input_matrix)
-    n_cols = len(input_matrix[0])
-
-    possible_lines = []
-    iteration_amounts = [
-        (0, 1), (0, -1), (-1, 0), (1, 0),
-        (1, 1), (-1, -1), (-1, 1), (1, -1)]
-
-    for direction in iteration_amounts:
-        # if string would exceed the grid, skip it
-        max_row = row + 3 * direction[0]
-        max_col = col + 3 * direction[1]
-        if max_row < 0 or max_row > (n_rows - 1):
-            continue
-        if max_col < 0 or max_col > (n_cols - 1):
-            continue
-
-        s = ''
-        for i in range(4):
-            r = row + i * direction[0]
-            c = col + i * direction[1]
-            s += input_matrix[r][c]
-        possible_lines.append(s)
-
-    matches = sum(1 for s in possible_lines if s == 'XMAS')
+    cells = word_grid.cells
+    matches = 0
+    for offset in word_grid.surrounding:
+        if (cells[idx + offset] == M
+                and cells[idx + 2 * offset] == A
+                and cells[idx + 3 * offset] == S):
+            matches += 1
 
     return matches
 
 
-def find_mas(input_matrix, row, col):
+def find_mas(word_grid: Grid, idx: int) -> int:
     """Find MAS string in an X shape."""
-    n_rows = len(input_matrix)
-    n_cols = len(input_matrix[0])
-
-    matches = 0
-    match_strings = ['MAS', 'SAM']
+    cells = word_grid.cells
+    up_left, up_right, down_right, down_left = word_grid.diagonal
 
     # only one orientation that results in valid string: x
-    if 0 < col < (n_cols-1) and 0 < row < (n_rows-1):
-        s_1 = input_matrix[row-1][col-1] + 'A' + input_matrix[row+1][col+1]
-        s_2 = input_matrix[row-1][col+1] + 'A' + input_matrix[row+1][col-1]
-        if s_1 in match_strings and s_2 in match_strings:
-            matches += 1
+    diag_1 = {cells[idx + up_left], cells[idx + down_right]}
+    diag_2 = {cells[idx + up_right], cells[idx + down_left]}
 
-    return matches
+    return int(diag_1 == diag_2 == {M, S})
 
 
-def part1(word_puzzle: list) -> int:
+def part1(word_puzzle: Grid) -> int:
     """
     Search for all XMAS words within puzzle.
 
     Find the anchor X character. Search around it in each direction finding the
-    rest of the chars. Create a matrix of the word puzzle.
+    rest of the chars.
     """
-    word_matrix = [list(l.strip()) for l in word_puzzle]
-
-    total = 0
-
-    n_rows = len(word_matrix)
-    n_cols = len(word_matrix[0])
-
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if word_matrix[i][j] == 'X':
-                total += find_xmas(word_matrix, i, j)
+    return sum(find_xmas(word_puzzle, idx) for idx in word_puzzle.indices('X'))
 
-    return total
 
-
-def part2(word_puzzle: list) -> int:
+def part2(word_puzzle: Grid) -> int:
     """Find MAS X."""
-    word_matrix = [list(l.strip()) for l in word_puzzle]
-    total = 0
+    return sum(find_mas(word_puzzle, idx) for idx in word_puzzle.indices('A'))
+
 
-    n_rows = len(word_matrix)
-    n_cols = len(word_matrix[0])
+def parse_input(filename: str) -> dict:
+    """Read word search into a grid padded deep enough for a four letter word."""
+    with open(filename, 'r') as f:
+        puzzle = f.readlines()
 
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if word_matrix[i][j] == 'A':
-                total += find_mas(word_matrix, i, j)
+    return {'word_puzzle': Grid(puzzle, pad=3)}
 
-    return total
 
 if __name__ == '__main__':
-    with open('advent_of_code/2024/day04/input.txt', 'r') as f:
-        puzzle = f.readlines()
+    puzzle_input = parse_input('advent_of_code/2024/day04/input.txt')
 
-    print(f"XMAS count: {part1(puzzle)}")
-    print(f"MAS in X count: {part2(puzzle)}")
+    print(f"XMAS count: {part1(**puzzle_input)}")
+    print(f"MAS in X count: {part2(**puzzle_input)}")
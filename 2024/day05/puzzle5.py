@@ -16,8 +16,8 @@ def is_sorted(order_map: dict, pagenums: list) -> bool:
 
 
 
-def part1(orders: list, print_req: list) -> tuple[int, list]:
-    """Figure out what is printing correctly."""
+def build_order_map(orders: list) -> dict:
+    """Map each page to the pages that must be printed after it."""
     order_map = {}
     for o in orders:
         f, s = o[0], o[1]
@@ -25,27 +25,25 @@ def part1(orders: list, print_req: list) -> tuple[int, list]:
             order_map[f].append(s)
         else:
             order_map[f] = [s]
+    return order_map
+
+
+def part1(orders: list, print_req: list) -> int:
+    """Figure out what is printing correctly."""
+    order_map = build_order_map(orders)
 
     running_total = 0
-    incorrect_pagenums = []
     for pagenums in print_req:
         if is_sorted(order_map, pagenums):
             running_total += pagenums[len(pagenums) // 2]
-        else:
-            incorrect_pagenums.append(pagenums)
 
-    return running_total, incorrect_pagenums
+    return running_total
 
 
-def part2(orders: list, to_sort: list) -> int:
+def part2(orders: list, print_req: list) -> int:
     """Take incorrectly sorted pages and re-sort them."""
-    order_map = {}
-    for o in orders:
-        f, s = o[0], o[1]
-        if f in order_map:
-            order_map[f].append(s)
-        else:
-            order_map[f] = [s]
+    order_map = build_order_map(orders)
+    to_sort = [pagenums for pagenums in print_req if not is_sorted(order_map, pagenums)]
 
     for pagenums in to_sort:
         while not is_sorted(order_map, pagenums): # interate algo until sorted
@@ -63,11 +61,12 @@ def part2(orders: list, to_sort: list) -> int:
     return running_total
 
 
-if __name__ == '__main__':
+def parse_input(filename: str) -> dict:
+    """Read page ordering rules and print requests."""
     page_orders = []
     pages_to_print = []
 
-    with open('advent_of_code/2024/day05/input.txt', 'r') as f:
+    with open(filename, 'r') as f:
         list_to_update = page_orders
         for l in f.readlines():
             if l == '\n':
@@ -81,6 +80,11 @@ if __name__ == '__main__':
     pages_to_print = [i.strip().split(',') for i in pages_to_print]
     pages_to_print = [[int(i) for i in l] for l in pages_to_print]
 
-    n_correct, incorrect_results = part1(page_orders, pages_to_print)
-    print(f'Correctly ordered reqs: {n_correct}')
-    print(f'Incorrectly ordered reqs: {part2(page_orders, incorrect_results)}')
+    return {'orders': page_orders, 'print_req': pages_to_print}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day05/input.txt')
+
+    print(f'Correctly ordered reqs: {part1(**puzzle_input)}')
+    print(f'Incorrectly ordered reqs: {part2(**puzzle_input)}')
@@ -3,13 +3,18 @@ Advent of Code 2024: Day 7
 Bridge Repair
 """
 import time
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
 
-def part1(input_eqs: dict) -> tuple[int, dict]:
+
+def calibrate(input_eqs: list) -> tuple[int, list]:
     """Determine if + or * operators can be used to achieve result."""
     total_calibrations = 0
-    no_match = {}
-    for key, vals in input_eqs.items():
+    no_match = []
+    for key, vals in input_eqs:
         w = [[vals[0]]]
         for i in vals[1:]:
             next_iteration = []
@@ -20,15 +25,25 @@ def part1(input_eqs: dict) -> tuple[int, dict]:
         if key in w[-1]:
             total_calibrations += key
         else:
-            no_match[key] = vals
+            no_match.append((key, vals))
 
     return total_calibrations, no_match
 
 
-def part2(input_eqs: dict) -> int:
-    """Adding a new operator."""
-    total_calibrations = 0
-    for key, vals in input_eqs.items():
+def part1(input_eqs: list) -> int:
+    """Sum results achievable with + and * operators."""
+    total_calibrations, _ = calibrate(input_eqs)
+
+    return total_calibrations
+
+
+def part2(input_eqs: list) -> int:
+    """
+    Adding a new operator. Equations already solved with + and * stay solved,
+    so only the remainder is searched with ||.
+    """
+    total_calibrations, no_match = calibrate(input_eqs)
+    for key, vals in no_match:
         w = [[vals[0]]]
         for i in vals[1:]:
             next_iteration = []
@@ -43,19 +58,43 @@ def part2(input_eqs: dict) -> int:
     return total_calibrations
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day07/input.txt', 'r') as f:
+def _stream_equations(filename: str):
+    for line in stream.lines(filename):
+        res, inputs = line.split(b':')
+        yield [(int(res), [int(i) for i in inputs.split()])]
+
+
+def part1_stream(filename: str) -> int:
+    """part1 one equation at a time, straight from the file."""
+    return sum(part1(eq) for eq in _stream_equations(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 one equation at a time, straight from the file."""
+    return sum(part2(eq) for eq in _stream_equations(filename))
+
+
+def parse_input(filename: str) -> dict:
+    """
+    Read equations as (result, operands) pairs. Results can repeat, and every
+    line counts.
+    """
+    with open(filename, 'r') as f:
         raw_equations = f.readlines()
 
-    equations = {}
+    equations = []
     for l in raw_equations:
         res, inputs = l.split(':')[0], l.split(':')[1]
-        equations[int(res)] = [int(i) for i in inputs.split()]
+        equations.append((int(res), [int(i) for i in inputs.split()]))
+
+    return {'input_eqs': equations}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day07/input.txt')
 
     s = time.time()
-    cal_sum, no_match = part1(equations)
-    print(f"+ * : {cal_sum} in {time.time() - s}")
+    print(f"+ * : {part1(**puzzle_input)} in {time.time() - s}")
 
     s = time.time()
-    addl_sum = part2(no_match)
-    print(f"+ * || : {cal_sum + addl_sum} in {time.time() - s}")
+    print(f"+ * || : {part2(**puzzle_input)} in {time.time() - s}")
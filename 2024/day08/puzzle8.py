@@ -2,9 +2,14 @@
 Advent of Code 2024: Day 8
 Resonant Collinearity
 """
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
-def part1(input_map, n_rows, n_cols):
+
+def part1(antenna_grid: Grid) -> int:
     """
     Find antinodes within map.
 
@@ -12,6 +17,8 @@ def part1(input_map, n_rows, n_cols):
     elem is X away and the nex is 2x away is there an open cell that is in a
     direction of line from an antenna
     """
+    input_map = antenna_grid.group_by_char(skip='.')
+    n_rows, n_cols = antenna_grid.n_rows, antenna_grid.n_cols
     antinodes = set()
     for ants in input_map.values():
         for ant_1 in ants:
@@ -28,11 +35,13 @@ def part1(input_map, n_rows, n_cols):
                 if -1 < tgt_y < n_rows and -1 < tgt_x < n_cols:
                     antinodes.add((tgt_y, tgt_x))
 
-    return antinodes
+    return len(antinodes)
 
 
-def part2(input_map, n_rows, n_cols):
+def part2(antenna_grid: Grid) -> int:
     """Find antinodes within map ignoring distance requirement."""
+    input_map = antenna_grid.group_by_char(skip='.')
+    n_rows, n_cols = antenna_grid.n_rows, antenna_grid.n_cols
     antinodes = set()
     for ants in input_map.values():
         for ant_1 in ants:
@@ -62,29 +71,19 @@ def part2(input_map, n_rows, n_cols):
                         antinodes.add((tgt_y, tgt_x))
                     n += 1
 
-    return antinodes
+    return len(antinodes)
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day08/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read antenna map into a grid."""
+    with open(filename, 'r') as f:
         coors = f.readlines()
 
-    # convert to dict of antenna type and matrix index
-    coors = [list(l.strip()) for l in coors]
-    n_rows = len(coors)
-    n_cols = len(coors[0])
-    coors_map = {}
-    for i in range(n_rows):
-        for j in range(n_cols):
-            check_char = coors[i][j]
-            if check_char == '.':
-                continue
-            if check_char in coors_map:
-                coors_map[check_char].append((i, j))
-            else:
-                coors_map[check_char] = [(i, j)]
-
-    res = part1(coors_map, n_rows, n_cols)
-    print(f'Number of antinodes: {len(res)}')
-    res = part2(coors_map, n_rows, n_cols)
-    print(f'Number of antinodes with resonance: {len(res)}')
+    return {'antenna_grid': Grid(l.strip() for l in coors)}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day08/input.txt')
+
+    print(f'Number of antinodes: {part1(**puzzle_input)}')
+    print(f'Number of antinodes with resonance: {part2(**puzzle_input)}')
@@ -143,15 +143,21 @@ def part2_optimized(fragmented_disk: str) -> int:
     return sum(i * f_id for i, f_id in enumerate(converted_disk) if f_id != '.')
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day09/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read the single line disk map."""
+    with open(filename, 'r') as f:
         disk_map = f.readlines()
     assert len(disk_map) == 1
-    disk_map = disk_map[0].strip()
+
+    return {'fragmented_disk': disk_map[0].strip()}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day09/input.txt')
 
     s = time.time()
-    print(f'Filesystem checksum: {part1(disk_map)} in {time.time() - s}')
+    print(f'Filesystem checksum: {part1(**puzzle_input)} in {time.time() - s}')
     s = time.time()
-    print(f'Defragged checksum: {part2(disk_map)} in {time.time() - s}')
+    print(f'Defragged checksum: {part2(**puzzle_input)} in {time.time() - s}')
     s = time.time()
-    print(f'Defragged checksum (opt): {part2_optimized(disk_map)} in {time.time() - s}')
+    print(f'Defragged checksum (opt): {part2_optimized(**puzzle_input)} in {time.time() - s}')
@@ -2,19 +2,24 @@
 Advent of Code 2024: Day 10
 Hoof It
 """
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
 
 KNOWN_PEAKS = set()
+ZERO = ord('0')
 
 
-def evaluate_trailhead(top_input: list[list[int]], y: int, x: int, peak: int, distinct_paths=False) -> int:
+def evaluate_trailhead(top_input: Grid, idx: int, peak: int, distinct_paths=False) -> int:
     """
-    Given a topographic map and coordinates, trace through path to a peak.
+    Given a topographic map and cell index, trace through path to a peak.
 
     Args:
-        input (list[list[int]]): topographic map
-        y (int): row index
-        x (int): col index
+        top_input (Grid): topographic map
+        idx (int): flat cell index
         peak (int): search altitude
         distinct_peaks (bool, optional): whether distinct matter. Defaults to True.
 
@@ -26,30 +31,22 @@ def evaluate_trailhead(top_input: list[list[int]], y: int, x: int, peak: int, di
     if peak == 10:
         if distinct_paths:
             return 1
-        if (y, x) in KNOWN_PEAKS:
+        if idx in KNOWN_PEAKS:
             return 0
-        KNOWN_PEAKS.add((y, x))
+        KNOWN_PEAKS.add(idx)
         return 1
 
-    n_rows = len(top_input)
-    n_cols = len(top_input[0])
-
-    candidates = []
-    if y > 0 and 0 <= x < n_cols and top_input[y-1][x] == peak:
-        candidates.append([y-1, x])
-    if x > 0 and 0 <= y < n_rows and top_input[y][x-1] == peak:
-        candidates.append([y, x-1])
-    if y < (n_rows - 1) and 0 <= x < n_cols and top_input[y+1][x] == peak:
-        candidates.append([y+1, x])
-    if x < (n_cols - 1) and 0 <= y < n_rows and top_input[y][x+1] == peak:
-        candidates.append([y, x+1])
+    # the padded border never holds a digit so no bounds checks are needed
+    cells = top_input.cells
+    target = ZERO + peak
+    candidates = [idx + offset for offset in top_input.orthogonal if cells[idx + offset] == target]
     if not candidates:
         return 0
 
-    return sum([evaluate_trailhead(top_input, i[0], i[1], peak+1, distinct_paths) for i in candidates])
+    return sum([evaluate_trailhead(top_input, i, peak+1, distinct_paths) for i in candidates])
 
 
-def part1(topography: list[list[int]]) -> int:
+def part1(topography: Grid) -> int:
     """
     Return sum of trailhead scores. Trailhead scores are determined by how
     many peaks are reached from a given trailhead.
@@ -59,47 +56,38 @@ def part1(topography: list[list[int]]) -> int:
     Iterative of keeping a pointer of where to go back to at each fork
 
     Args:
-        topography (list): list of list of string
+        topography (Grid): grid of height digits
 
     Returns:
         int: Sum of each trailhead score.
     """
     global KNOWN_PEAKS
 
-    trailheads = set()
-    n_rows = len(topography)
-    n_cols = len(topography[0])
-    for y in range(n_rows):
-        for x in range(n_cols):
-            if topography[y][x] == 0: # potential trailhead
-                score = evaluate_trailhead(topography, y, x, 1)
-                trailheads.add((y, x, score))
-                KNOWN_PEAKS = set()
+    total = 0
+    for idx in topography.indices('0'): # potential trailhead
+        total += evaluate_trailhead(topography, idx, 1)
+        KNOWN_PEAKS = set()
 
-    return sum(i[2] for i in trailheads)
+    return total
 
 
-def part2(topography: list[list[int]]) -> int:
+def part2(topography: Grid) -> int:
     """
     Return similar to part1 but with different call to find all distinct paths.
     """
-    trailheads = set()
-    n_rows = len(topography)
-    n_cols = len(topography[0])
-    for y in range(n_rows):
-        for x in range(n_cols):
-            if topography[y][x] == 0: # potential trailhead
-                score = evaluate_trailhead(topography, y, x, 1, True)
-                trailheads.add((y, x, score))
+    return sum(evaluate_trailhead(topography, idx, 1, True) for idx in topography.indices('0'))
+
 
-    return sum(i[2] for i in trailheads)
+def parse_input(filename: str) -> dict:
+    """Read topographic map into a grid of height digits."""
+    with open(filename, 'r') as f:
+        raw_topography = f.readlines()
+
+    return {'topography': Grid(l.strip() for l in raw_topography)}
 
 
 if __name__ == '__main__':
-    with open('advent_of_code/2024/day10/input.txt', 'r') as f:
-        raw_topography = f.readlines()
+    puzzle_input = parse_input('advent_of_code/2024/day10/input.txt')
 
-    # convert to list(list(char))
-    raw_topography = [[int(i) for i in l.strip()] for l in raw_topography]
-    print(f'Trailhead scores: {part1(raw_topography)}')
-    print(f'Trailhead scores (distinct): {part2(raw_topography)}')
+    print(f'Trailhead scores: {part1(**puzzle_input)}')
+    print(f'Trailhead scores (distinct): {part2(**puzzle_input)}')
@@ -2,9 +2,13 @@
 Advent of Code 2024: Day 11
 Plutonian Pebbles
 """
+import sys
 import time
-from functools import lru_cache
-from line_profiler import profile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.memo import memoize  # pylint: disable=wrong-import-position
+from aoc.profiling import profile  # pylint: disable=wrong-import-position
 
 
 @profile
@@ -46,35 +50,37 @@ def part1(stones: list[str], blinks: int = 25) -> int:
     return len(stones)
 
 
-def part2(stones: list[str], blinks: int = 25) -> int:
-    """
-    Part1 approach is too slow and mem intensive for Part2.
-    """
+@memoize
+def expand_stone(input_s):
+    """Memoized function to return next stone output."""
+    if input_s == '0':
+        return '1'
+    elif len(input_s) % 2 == 0:
+        left = input_s[0:len(input_s) // 2]
+        right = input_s[len(input_s) // 2:]
+        return (str(int(left)), str(int(right)))
+    else:
+        new_val = int(input_s) * 2024
+        return str(new_val)
+
+
+@memoize
+def dfs(input_c, n_blink) -> int:
+    """Recursive function to calculate given final len of a char and blink."""
+    if not isinstance(input_c, tuple):
+        input_c = [input_c]
+
+    if n_blink == 0:
+        return len(input_c)
+
+    return sum(dfs(expand_stone(i), n_blink-1) for i in input_c)
 
-    @lru_cache(maxsize=None)
-    def expand_stone(input_s):
-        """Memoized function to return next stone output."""
-        if input_s == '0':
-            return '1'
-        elif len(input_s) % 2 == 0:
-            left = input_s[0:len(input_s) // 2]
-            right = input_s[len(input_s) // 2:]
-            return (str(int(left)), str(int(right)))
-        else:
-            new_val = int(input_s) * 2024
-            return str(new_val)
-
-    @lru_cache(maxsize=None)
-    def dfs(input_c, n_blink) -> int:
-        """Recursive function to calculate given final len of a char and blink."""
-        if not isinstance(input_c, tuple):
-            input_c = [input_c]
-
-        if n_blink == 0:
-            return len(input_c)
-
-        return sum(dfs(expand_stone(i), n_blink-1) for i in input_c)
 
+def part2(stones: list[str], blinks: int = 75) -> int:
+    """
+    Part1 approach is too slow and mem intensive for Part2. The memo tables live at
+    module level so they stay warm across calls in a long running process.
+    """
     stone_len = 0
     for c in stones:
         stone_len += dfs(c, blinks)
@@ -82,13 +88,19 @@ def part2(stones: list[str], blinks: int = 25) -> int:
     return stone_len
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day11/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read engraved stones from the first line."""
+    with open(filename, 'r') as f:
         raw_stones = f.readlines()[0]
-    raw_stones = raw_stones.strip().split()
+
+    return {'stones': raw_stones.strip().split()}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day11/input.txt')
 
     s = time.time()
-    print(f'Number of stones: {part1(raw_stones, 25)} in {time.time() - s}')
+    print(f'Number of stones: {part1(**puzzle_input, blinks=25)} in {time.time() - s}')
 
     s = time.time()
-    print(f'Number of stones: {part2(raw_stones, 75)} in {time.time() - s}')
+    print(f'Number of stones: {part2(**puzzle_input, blinks=75)} in {time.time() - s}')
@@ -2,74 +2,47 @@
 Advent of Code 2024: Day 12
 Garden Groups
 """
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
-def check_adjacent(coords, eval_region):
-    """Helper function to check if any adjacent coords in list."""
-    # coords are adjacent if they share a row and are one apart on col
-    # or share a col and are one apart on row
-    for eval_coord in eval_region:
-        delta = eval_coord - coords
-        if abs(delta) == 1:
-            return True
-    return False
 
-
-def get_regions(garden: list[list[str]]) -> dict:
+def get_regions(garden: Grid) -> dict:
     """
     Helper function to generate dict of regions with plant key
 
     Args:
-        garden (list[list[str]]): raw input
+        garden (Grid): raw input
 
     Returns:
-        dict: regions by key
+        dict: regions by key, each region a list of flat cell indices
     """
-    # go through the whole garden, build a map of plant to locations
-    # then go through each plant and find the adjacent regions
-    plant_map = {}
-    for i, row in enumerate(garden):
-        for j, plant in enumerate(row):
-            if plant in plant_map:
-                plant_map[plant].append(complex(i, j))
-            else:
-                plant_map[plant] = [complex(i, j)]
-
+    # flood fill from every unassigned cell over orthogonal neighbours with
+    # the same plant; the padded border never matches a plant
+    cells = garden.cells
+    assigned = bytearray(len(cells))
     region_map = {}
-    for plant, coors in plant_map.items():
-        regions = []
-        # loop through coords and find regions
-        while coors:
-            new_region = True
-            curr = coors.pop(0)
-            for region in regions:
-                if check_adjacent(curr, region):
-                    region.add(curr)
-                    new_region = False
-            if new_region:
-                regions.append(set([curr]))
-        # edge case can arise with leftmost being loose
-        # maybe define it via set operations to re-unify
-        for i in range(len(regions)):
-            for j in range(len(regions)):
-                if i == j:
-                    continue
-                lead_region, lag_region = regions[i], regions[j]
-                if lead_region and lag_region and set(lead_region) & set(lag_region):
-                    regions[i] = lead_region | lag_region
-                    regions[j] = None
-        # convert to list and order by row/col
-        region_map[plant] = []
-        for region in regions:
-            if region:
-                s_r = list(region)
-                s_r.sort(key=lambda x: (x.real, x.imag))
-                region_map[plant].append(s_r)
+    for i in range(garden.n_rows):
+        for idx in range(garden.index(i, 0), garden.index(i, garden.n_cols)):
+            if assigned[idx]:
+                continue
+            plant = cells[idx]
+            assigned[idx] = 1
+            region = [idx]
+            for curr in region: # region grows while we iterate it
+                for offset in garden.orthogonal:
+                    neighbor = curr + offset
+                    if cells[neighbor] == plant and not assigned[neighbor]:
+                        assigned[neighbor] = 1
+                        region.append(neighbor)
+            region_map.setdefault(chr(plant), []).append(region)
 
     return region_map
 
 
-def part1(garden: list[list[str]]) -> int:
+def part1(garden: Grid) -> int:
     """
     Given a garden, find the relevant plots and return sum of area * perim
     for all garden regions.
@@ -77,150 +50,79 @@ def part1(garden: list[list[str]]) -> int:
     A region is an unbroken string of the same char.
 
     Args:
-        garden (list[list[str]]): grid of plants (represented by char)
+        garden (Grid): grid of plants (represented by char)
 
     Returns:
         int: sum of all area * perims for each region
     """
+    cells = garden.cells
 
     def calculate_perim(local_region):
-        # project onto a grid and then iterate through it to see where the edges are
-        x_offset= min(x.imag for x in local_region)
-        x_max = max(x.imag for x in local_region)
-        y_offset = min(x.real for x in local_region)
-        y_max = max(x.real for x in local_region)
-        grid_width = int(x_max - x_offset)+1
-        grid_height = int(y_max - y_offset)+1
-
-        # create empty grid [['', ''], ['', '']]
-        grid = [[0 for _ in range(grid_width)] for _ in range(grid_height)]
-        for c in local_region:
-            y = int(c.real - y_offset)
-            x = int(c.imag - x_offset)
-            grid[y][x] = 1
-
-        n_rows = len(grid)
-        n_cols = len(grid[0])
+        # every side not shared with the same plant is fence
         perim = 0
-        for i in range(n_rows):
-            for j in range(n_cols):
-                if grid[i][j] == 1:
-                    cell_perim = 4
-                    if i > 0 and grid[i-1][j] == 1: # check left
-                        cell_perim -= 1
-                    if i < (n_rows - 1) and grid[i+1][j] == 1: # check right
-                        cell_perim -= 1
-                    if j > 0 and grid[i][j-1] == 1: # check above
-                        cell_perim -= 1
-                    if j < (n_cols - 1) and grid[i][j+1] == 1: # check below
-                        cell_perim -= 1
-                    perim += cell_perim
-
+        for idx in local_region:
+            plant = cells[idx]
+            for offset in garden.orthogonal:
+                if cells[idx + offset] != plant:
+                    perim += 1
         return perim
 
     region_map = get_regions(garden)
 
     # calculate perims and areas
-    # add up all the side lengths along a row/col in the region
     measurements = []
     for plant, regions in region_map.items():
         for region in regions:
             area = len(region)
             perim = calculate_perim(region)
-            #print(f'Region {plant} has area {area} and perimeter {perim}')
             measurements.append((area, perim))
 
     return sum(a * p for a, p in measurements)
 
 
-def part2(garden: list[list[str]]) -> int:
+def part2(garden: Grid) -> int:
     """Return number of sides instead of perim."""
+    cells = garden.cells
+    up, right, down, left = garden.orthogonal
+    # each corner of a cell is checked via the two sides that meet there
+    corner_pairs = ((up, right), (right, down), (down, left), (left, up))
 
     def calculate_sides(local_region):
-        # project onto a grid and then iterate through it to see where the edges are
-        x_offset= min(x.imag for x in local_region)
-        x_max = max(x.imag for x in local_region)
-        y_offset = min(x.real for x in local_region)
-        y_max = max(x.real for x in local_region)
-        grid_width = int(x_max - x_offset)+1
-        grid_height = int(y_max - y_offset)+1
-
-        # create empty grid [['', ''], ['', '']]
-        grid = [[0 for _ in range(grid_width)] for _ in range(grid_height)]
-        for c in local_region:
-            y = int(c.real - y_offset)
-            x = int(c.imag - x_offset)
-            grid[y][x] = 1
-
-        n_rows = len(grid)
-        n_cols = len(grid[0])
         corners = 0 # the number of corners == number of sides
-        # corners exist when three of the cells surrounding the corner are the same
-        for i in range(n_rows):
-            for j in range(n_cols):
-                if grid[i][j] == 1:
-                    if i == 0:
-                        for cond in ((j == 0), (j == (n_cols-1)), (j > 0 and grid[i][j-1] == 0),
-                                     (j < (n_cols-1) and grid[i][j+1] == 0)):
-                            if cond:
-                                corners += 1
-                    if i == n_rows-1:
-                        for cond in ((j == 0), (j == (n_cols-1)),(j > 0 and grid[i][j-1] == 0),
-                                     (j < (n_cols-1) and grid[i][j+1] == 0)):
-                            if cond:
-                                corners += 1
-                    if j == 0:
-                        for cond in ((i > 0 and grid[i-1][j] == 0), (i < (n_rows-1) and grid[i+1][j] == 0)):
-                            if cond:
-                                corners += 1
-                    if j == (n_cols-1):
-                        for cond in  ((i > 0 and grid[i-1][j] == 0), (i < (n_rows-1) and grid[i+1][j] == 0)):
-                            if cond:
-                                corners += 1
-                    if i > 0:
-                        if j > 0:
-                            if ((grid[i][j-1] == grid[i-1][j] == 1 and grid[i-1][j-1] == 0) # bottom right outside
-                                | (grid[i][j-1] == grid[i-1][j-1] == grid[i-1][j] == 0)): # upper left inside
-                                corners += 1
-                        if j < n_cols-1:
-                            if ((grid[i-1][j] == grid[i][j+1] == 1 and grid[i-1][j+1] == 0) # bottom left outside
-                                | (grid[i-1][j] == grid[i-1][j+1] == grid[i][j+1] == 0)): # upper right inside
-                                corners += 1
-                            if grid[i-1][j+1] == 1 and grid[i-1][j] == grid[i][j+1] == 0: # kissing diag
-                                corners += 2
-                    if i < n_rows-1:
-                        if j > 0:
-                            if ((grid[i][j-1] == grid[i+1][j-1] == grid[i+1][j] == 0) # bottom left inside
-                                | (grid[i][j-1] == grid[i+1][j] == 1 and grid[i+1][j-1] == 0)): # upper right outside
-                                corners += 1
-                        if j < n_cols-1:
-                            if ((grid[i][j+1] == grid[i+1][j] == grid[i+1][j+1] == 0) # bottom right outside
-                                | (grid[i+1][j] == grid[i][j+1] == 1 and grid[i+1][j+1] == 0)): # upper left outside
-                                corners += 1
-                            if grid[i+1][j+1] == 1 and grid[i][j+1] == grid[i+1][j] == 0: # kissing diag
-                                corners += 2
-
+        for idx in local_region:
+            plant = cells[idx]
+            for side_1, side_2 in corner_pairs:
+                same_1 = cells[idx + side_1] == plant
+                same_2 = cells[idx + side_2] == plant
+                if not same_1 and not same_2: # outside corner
+                    corners += 1
+                elif same_1 and same_2 and cells[idx + side_1 + side_2] != plant: # inside corner
+                    corners += 1
         return corners
 
     region_map = get_regions(garden)
 
-    # calculate perims and areas
-    # add up all the side lengths along a row/col in the region
+    # calculate sides and areas
     measurements = []
     for plant, regions in region_map.items():
         for region in regions:
             area = len(region)
             sides = calculate_sides(region)
-            # print(f'Region {plant} has area {area} and sides {sides}')
             measurements.append((area, sides))
 
     return sum(a * s for a, s in measurements)
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day12/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read garden plots into a grid."""
+    with open(filename, 'r') as f:
         input_garden = f.readlines()
-    input_garden = [list(l.strip()) for l in input_garden]
 
-    print(f'Cost of fence (perim): {part1(input_garden)}')
-    print(f'Cost of fence (sides): {part2(input_garden)}')
+    return {'garden': Grid(l.strip() for l in input_garden)}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day12/input.txt')
+
+    print(f'Cost of fence (perim): {part1(**puzzle_input)}')
+    print(f'Cost of fence (sides): {part2(**puzzle_input)}')
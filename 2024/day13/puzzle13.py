@@ -3,7 +3,6 @@ Advent of Code 2024: Day 13
 Claw Contraption
 """
 import time
-import numpy as np
 
 
 def part1(in_games) -> int:
@@ -27,6 +26,8 @@ def part1(in_games) -> int:
 
 def part1_matrix(in_games) -> int:
     """Just for fun, do it with the matrices."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
     token_cost = 0
     for game in in_games:
         matA = np.matrix(list(zip(*[game['A'], game['B']])))
@@ -59,11 +60,11 @@ def part2(in_games) -> int:
     return int(token_cost)
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day13/test.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Transform each claw machine into a system of equations."""
+    with open(filename, 'r') as f:
         raw_games = f.readlines()
 
-    # transform each game into a system of equations
     games = []
     game = {}
     for l in raw_games:
@@ -81,11 +82,17 @@ if __name__ == '__main__':
                 games.append(game)
                 game = {}
 
+    return {'in_games': games}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day13/test.txt')
+
     s = time.time()
-    print(f'Tokens needed: {part1(games)} in {time.time() - s}')
+    print(f'Tokens needed: {part1(**puzzle_input)} in {time.time() - s}')
 
     s = time.time()
-    print(f'Tokens needed (matrix): {part1_matrix(games)} in {time.time() - s}')
+    print(f'Tokens needed (matrix): {part1_matrix(**puzzle_input)} in {time.time() - s}')
 
     s = time.time()
-    print(f'Tokens needed for larger machine: {part2(games)} in {time.time() - s}')
+    print(f'Tokens needed for larger machine: {part2(**puzzle_input)} in {time.time() - s}')
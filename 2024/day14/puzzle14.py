@@ -3,7 +3,6 @@ Advent of Code 2024: Day 14
 Restroom Redoubt
 """
 import pprint
-import numpy as np
 
 
 MODE = 'PROD'
@@ -51,6 +50,11 @@ def part1(robots: list[list[tuple]], n_seconds: int = 100) -> int:
     return product
 
 
+def _spread(values: list[int]) -> int:
+    """Variance scaled by n**2, exact in integers (same argmin as np.var)."""
+    return len(values) * sum(v * v for v in values) - sum(values) ** 2
+
+
 def part2(robots: list[list[tuple]]) -> int:
     """
     Find when the robots assemble into a tree.
@@ -64,8 +68,8 @@ def part2(robots: list[list[tuple]]) -> int:
     n_width = PUZZLE_PARAMS[MODE]['width']
     n_height = PUZZLE_PARAMS[MODE]['height']
 
-    bx = min(range(n_width), key=lambda t: np.var([(s[0]+t*v[0]) % n_width for (s,v) in robots]))
-    by = min(range(n_height), key=lambda t: np.var([(s[1]+t*v[1]) % n_height for (s,v) in robots]))
+    bx = min(range(n_width), key=lambda t: _spread([(s[0]+t*v[0]) % n_width for (s,v) in robots]))
+    by = min(range(n_height), key=lambda t: _spread([(s[1]+t*v[1]) % n_height for (s,v) in robots]))
 
     return bx + ((pow(n_width, -1, n_height) * (by - bx)) % n_height) * n_width
 
@@ -124,14 +128,21 @@ def part2(robots: list[list[tuple]]) -> int:
 #        n_seconds += 1
 
 
-if __name__ == '__main__':
+def parse_input(filename: str) -> dict:
+    """Read robot starting positions and velocities."""
     robot_details = []
-    with open(f'advent_of_code/2024/day14/{PUZZLE_PARAMS[MODE]["file"]}', 'r') as f:
+    with open(filename, 'r') as f:
         for l in f.readlines():
             pos, vel = l.split(' ')
             xpos, ypos = pos[2:].split(',')
             xvel, yvel = vel[2:].split(',')
             robot_details.append([(int(xpos), int(ypos)), (int(xvel), int(yvel))])
 
-    print(f'Safety score: {part1(robot_details)}')
-    print(f'Seconds until tree: {part2(robot_details)}')
+    return {'robots': robot_details}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input(f'advent_of_code/2024/day14/{PUZZLE_PARAMS[MODE]["file"]}')
+
+    print(f'Safety score: {part1(**puzzle_input)}')
+    print(f'Seconds until tree: {part2(**puzzle_input)}')
@@ -3,55 +3,63 @@ Advent of Code 2024: Day 16
 Reindeer Maze
 """
 import heapq
+import sys
 from collections import defaultdict
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import counters  # pylint: disable=wrong-import-position
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
-def maze_to_graph(maze, include_interm=False):
+
+WALL = ord('#')
+WALKABLE = {ord('.'), ord('S'), ord('E')}
+
+
+def maze_to_graph(maze: Grid, include_interm=False):
     """Helper function to convert maze to nodes of graph."""
-    n_rows, n_cols = len(maze), len(maze[0])
+    cells = maze.cells
     graph = {}
 
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    offsets = [di * maze.stride + dj for di, dj in directions]
 
-    def _is_walkable(i, j):
-        return 0 <= i < n_rows and 0 <= j < n_cols and maze[i][j] in '.SE'
+    def _is_walkable(idx):
+        # the padded border is not walkable, so no bounds checks are needed
+        return cells[idx] in WALKABLE
 
-    def _is_node(i, j):
-        if not _is_walkable(i, j):
+    def _is_node(idx):
+        if not _is_walkable(idx):
             return False
 
         # nodes will either terminate with deadend (no path neighbors) or they
         # are at a fork within the maze (two neighbors with paths)
-        neighbors = []
-        for di, dj in directions:
-            if _is_walkable(i + di, j + dj):
-                neighbors.append((di, dj))
+        neighbors = [offset for offset in offsets if _is_walkable(idx + offset)]
 
         if len(neighbors) != 2:
             return True
 
         # check for a corner or straight line
-        return neighbors[0][0] != neighbors[1][0] and neighbors[0][1] != neighbors[1][1]
+        return neighbors[0] + neighbors[1] != 0
 
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if (include_interm and maze[i][j] != '#') or _is_node(i, j):
+    for i in range(maze.n_rows):
+        for j in range(maze.n_cols):
+            idx = maze.index(i, j)
+            if (include_interm and cells[idx] != WALL) or _is_node(idx):
                 graph[(i, j)] = {}
 
-                for di, dj in directions:
-                    i_new, j_new = i + di, j + dj
+                for (di, dj), offset in zip(directions, offsets):
+                    i_new, j_new, idx_new = i + di, j + dj, idx + offset
                     path_len = 0
-                    while _is_walkable(i_new, j_new):
+                    while _is_walkable(idx_new):
                         path_len += 1
-                        # if only_terminal and _is_node(i_new, j_new):
                         if not include_interm:
-                            if _is_node(i_new, j_new):
+                            if _is_node(idx_new):
                                 graph[(i, j)][(i_new, j_new)] = path_len
                                 break
-                            # else:
-                                # graph[(i, j)][(i_new, j_new)] = path_len
                             i_new += di
                             j_new += dj
+                            idx_new += offset
                         else:
                             graph[(i, j)][(i_new, j_new)] = path_len
                             break
@@ -68,24 +76,20 @@ class Node:
         self.travel_dir = None
 
 
-def part1(maze: list[list[str]]) -> int:
+def part1(maze: Grid) -> int:
     """
     Find the shortest path from S to E through the maze while incurring a cost
     for turns in direction. Represent the maze as a graph of connected nodes.
 
     Args:
-        maze (list[list[str]]): maze input
+        maze (Grid): maze input
 
     Returns:
         int: score of the best path
     """
     graph = maze_to_graph(maze)
-    start_node = next(
-        (i, j) for i, row in enumerate(maze) for j, c in enumerate(row) if c == 'S'
-    )
-    exit_node = next(
-        (i, j) for i, row in enumerate(maze) for j, c in enumerate(row) if c == 'E'
-    )
+    start_node = maze.find('S')
+    exit_node = maze.find('E')
 
     nodes = {}
     for node in graph:
@@ -94,12 +98,16 @@ def part1(maze: list[list[str]]) -> int:
     nodes[start_node].travel_dir = (0, 1)
 
     pq = [(0, start_node)]
+    probe = counters.probe(__name__, 'part1')
 
     while pq:
         dist, node = heapq.heappop(pq)
+        probe.pop()
         if nodes[node].visited:
+            probe.skip()
             continue
         nodes[node].visited = True
+        probe.expand()
         for neighbor in graph[node]:
             if nodes[neighbor].visited:
                 continue
@@ -120,37 +128,36 @@ def part1(maze: list[list[str]]) -> int:
                 nodes[neighbor].dist = new_dist
                 nodes[neighbor].parent = node
                 heapq.heappush(pq, (new_dist, neighbor))
+                probe.push(len(pq))
 
     return nodes[exit_node].dist
 
 
-def part2(maze: list[list[str]]) -> int:
+def part2(maze: Grid) -> int:
     """
     Modified path finding algorithm to represent (node, direction) as the vertex
     rather than just node.
 
     Args:
-        maze (list[list[str]]): input maze
+        maze (Grid): input maze
 
     Returns:
         int: score of the best path
     """
     graph = maze_to_graph(maze, include_interm=True)
-    start_node = next(
-        (i, j) for i, row in enumerate(maze) for j, c in enumerate(row) if c == 'S'
-    )
-    exit_node = next(
-        (i, j) for i, row in enumerate(maze) for j, c in enumerate(row) if c == 'E'
-    )
+    start_node = maze.find('S')
+    exit_node = maze.find('E')
 
     shortest_paths = []
     best_dist = float('inf')
     path_dists = defaultdict(lambda: float('inf')) | {(start_node, (0, 1)): 0}
 
     pq = [(0, start_node, (0, 1), [start_node])]
+    probe = counters.probe(__name__, 'part2')
 
     while pq:
         dist, node, (di, dj), path = heapq.heappop(pq)
+        probe.pop()
 
         if node == exit_node:
             if dist < best_dist:
@@ -161,6 +168,7 @@ def part2(maze: list[list[str]]) -> int:
 
         i, j = node
         if dist < best_dist:
+            probe.expand()
             for dist, (i_new, j_new), (di_new, dj_new) in (
                 (dist + 1, (i + di, j + dj), (di, dj)), # straight ahead
                 (dist + 1000, (i, j), (dj, -di)),
@@ -172,14 +180,21 @@ def part2(maze: list[list[str]]) -> int:
                     if path_dists.get((neighbor, neighbor_dir), dist + 1) >= dist:
                         path_dists[(neighbor, neighbor_dir)] = dist
                         heapq.heappush(pq, (dist, neighbor, neighbor_dir, path + [neighbor]))
+                        probe.push(len(pq))
 
     return len(set().union(*shortest_paths))
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day16/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read maze into a grid."""
+    with open(filename, 'r') as f:
         raw_maze = f.readlines()
-    raw_maze = [l.strip() for l in raw_maze]
 
-    print(f'Lowest score possible: {part1(raw_maze)}')
-    print(f'Number of seats: {part2(raw_maze)}')
+    return {'maze': Grid(l.strip() for l in raw_maze)}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day16/input.txt')
+
+    print(f'Lowest score possible: {part1(**puzzle_input)}')
+    print(f'Number of seats: {part2(**puzzle_input)}')
@@ -96,14 +96,13 @@ def run_program(registers, program_inputs) -> list[int]:
     return stdout
 
 
-def part1(registers, program):
-    """Run program and print output"""
+def part1(registers, program) -> str:
+    """Run program and return comma joined output"""
     # store the registers as lists so we can access them
     program_inputs = [int(i) for i in program.split(': ')[1].split(',')]
     res = run_program(registers, program_inputs)
-    print(','.join(str(i) for i in res))
 
-    return 0
+    return ','.join(str(i) for i in res)
 
 
 def part2(registers, program):
@@ -128,8 +127,9 @@ def part2(registers, program):
     return 0
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day17/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read starting registers and raw program line."""
+    with open(filename, 'r') as f:
         registers, program = f.read().split('\n\n')
     registers = registers.split('\n')
 
@@ -137,6 +137,12 @@ if __name__ == '__main__':
     register_b = int(registers[1].split(': ')[1])
     register_c = int(registers[2].split(': ')[1])
 
-    part1([register_a, register_b, register_c], program)
-    correct_a = part2([register_a, register_b, register_c], program)
+    return {'registers': [register_a, register_b, register_c], 'program': program.strip()}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day17/input.txt')
+
+    print(part1(**puzzle_input))
+    correct_a = part2(**puzzle_input)
     print(f'Correct A register is: {correct_a}')
@@ -3,6 +3,12 @@ Advent of Code 2024: Day 18
 RAM Run
 """
 import heapq
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import counters  # pylint: disable=wrong-import-position
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
 
 MODE = 'PROD'
@@ -15,110 +21,96 @@ else:
     N_GRID = 7
     FILENAME = 'test.txt'
 
+WALL = ord('#')
 
-def _in_bounds(node, maze_grid, maze_size):
-    """Helper function to determine if in bounds or wall."""
-    i, j = node
-    if i < 0 or i >= maze_size:
-        return False
-    if j < 0 or j >= maze_size:
-        return False
-    if maze_grid[i][j] == '#':
-        return False
-    return True
-
-
-def part1(falling_bytes: list[tuple[int]]) -> tuple[int, list[list[str]]]:
-    """
-    Given a list of falling bytes, create grid and find shortest path to
-    exit node.
-
-    Args:
-        falling_bytes (list[tuple[int]]): items that appear on grid to block
-
-    Returns:
-        tuple[int, list[list[str]]]: returns shortest path len and grid state
-    """
-
-    maze_grid = [['.' for _ in range(N_GRID)] for _ in range(N_GRID)]
-    directions = {(1, 0), (-1, 0), (0, 1), (0, -1)}
 
+def drop_bytes(falling_bytes: list[tuple[int]]) -> Grid:
+    """Build the grid state after the first N_BYTES_SIM bytes have fallen."""
+    maze_grid = Grid.blank(N_GRID, N_GRID, '.', border='#')
     for x, y in falling_bytes[:N_BYTES_SIM]:
-        maze_grid[y][x] = '#'
+        maze_grid[y, x] = '#'
+    return maze_grid
+
 
-    start_node = (N_GRID - 1, N_GRID - 1)
-    exit_node = (0, 0)
+def _shortest_path(maze_grid: Grid) -> dict:
+    """Distances from the bottom right corner to every reachable cell."""
+    cells = maze_grid.cells
+    start = maze_grid.index(N_GRID - 1, N_GRID - 1)
     visited = set()
-    distances = {start_node: 0}
+    distances = {start: 0}
 
-    pq = [(0, (start_node))]
+    pq = [(0, start)]
+    probe = counters.probe(__name__, '_shortest_path')
 
     while pq:
         dist, node = heapq.heappop(pq)
+        probe.pop()
         # see if we can advance in a given direction without hitting a wall
         if node in visited:
+            probe.skip()
             continue
         visited.add(node)
-        for di, dj in directions:
-            neighbor = (node[0] + di, node[1] + dj)
-            if not _in_bounds(neighbor, maze_grid, N_GRID):
+        probe.expand()
+        for offset in maze_grid.orthogonal:
+            neighbor = node + offset
+            # the border is walled off so only real cells are reachable
+            if cells[neighbor] == WALL:
                 continue
-            if neighbor not in distances:
-                distances[neighbor] = float('inf')
             new_dist = dist + 1
-            if new_dist < distances[neighbor]:
+            if new_dist < distances.get(neighbor, float('inf')):
                 distances[neighbor] = new_dist
-                heapq.heappush(pq ,(new_dist, neighbor))
+                heapq.heappush(pq, (new_dist, neighbor))
+                probe.push(len(pq))
+
+    return distances
+
+
+def part1(falling_bytes: list[tuple[int]]) -> int:
+    """
+    Given a list of falling bytes, create grid and find shortest path to
+    exit node.
 
-    return distances[exit_node], maze_grid
+    Args:
+        falling_bytes (list[tuple[int]]): items that appear on grid to block
 
+    Returns:
+        int: returns shortest path len
+    """
+    maze_grid = drop_bytes(falling_bytes)
+
+    return _shortest_path(maze_grid)[maze_grid.index(0, 0)]
 
-def part2(falling_bytes, maze_grid):
+
+def part2(falling_bytes, maze_grid=None):
     """
     Given a grid state and remainding bytes, find first instance where a 
     path to the exit cannot be found.
     """
+    if maze_grid is None:
+        maze_grid = drop_bytes(falling_bytes)
+
     # from here on out, we need to drop a byte in and verify if there is
     # still a path to the exit. if not we return that byte
-    directions = {(1, 0), (-1, 0), (0, 1), (0, -1)}
-
-    start = (N_GRID - 1, N_GRID - 1)
-    exit = (0, 0)
+    exit = maze_grid.index(0, 0)
 
     for x, y in falling_bytes[N_BYTES_SIM:]:
-        maze_grid[y][x] = '#'
-
-        visited = set()
-        distances = {start: 0}
-        pq = [(0, (start))]
-
-        while pq:
-            dist, node = heapq.heappop(pq)
-            # see if we can advance in a given direction without hitting a wall
-            if node in visited:
-                continue
-            visited.add(node)
-            for di, dj in directions:
-                neighbor = (node[0] + di, node[1] + dj)
-                if not _in_bounds(neighbor, maze_grid, N_GRID):
-                    continue
-                if neighbor not in distances:
-                    distances[neighbor] = float('inf')
-                new_dist = dist + 1
-                if new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    heapq.heappush(pq ,(new_dist, neighbor))
-        if exit not in distances:
+        maze_grid[y, x] = '#'
+        if exit not in _shortest_path(maze_grid):
             return x, y
 
     return (-1, -1)
 
 
-if __name__ == '__main__':
-    with open(f'advent_of_code/2024/day18/{FILENAME}', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read falling byte coordinates."""
+    with open(filename, 'r') as f:
         falling_bytes = f.readlines()
-    falling_bytes = [(int(l.split(',')[0]), int(l.split(',')[1])) for l in falling_bytes]
 
-    shortest_path, maze_state = part1(falling_bytes)
-    print(f'Shortest path: {shortest_path}')
-    print(f'Path ends with: {part2(falling_bytes, maze_state)}')
+    return {'falling_bytes': [(int(l.split(',')[0]), int(l.split(',')[1])) for l in falling_bytes]}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input(f'advent_of_code/2024/day18/{FILENAME}')
+
+    print(f'Shortest path: {part1(**puzzle_input)}')
+    print(f'Path ends with: {part2(**puzzle_input)}')
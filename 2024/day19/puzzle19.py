@@ -2,12 +2,16 @@
 Advent of Code 2024: Day 19
 Linen Layout
 """
+import sys
 import time
-from functools import lru_cache
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.memo import memoize  # pylint: disable=wrong-import-position
 
-@lru_cache(maxsize=None)
-def build_pattern(target_pattern: str, towels: tuple(str)):
+
+@memoize
+def build_pattern(target_pattern: str, towels: tuple[str]):
     """Recursive helper function to determine if pattern can be made from strings."""
     if target_pattern == '':
         return 1
@@ -63,14 +67,19 @@ def part2(towels: tuple[str], pattern_requests: list[str]) -> int:
     return possible_patterns
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day19/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read available towels and requested patterns."""
+    with open(filename, 'r') as f:
         towels, pattern_requests = f.read().split('\n\n')
 
-    towels = tuple(towels.replace(' ', '').split(','))
-    pattern_requests = pattern_requests.split()
+    return {'towels': tuple(towels.replace(' ', '').split(',')),
+            'pattern_requests': pattern_requests.split()}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day19/input.txt')
 
     s = time.time()
-    print(f'Possible matches: {part1(towels, pattern_requests)} in {time.time() - s}')
+    print(f'Possible matches: {part1(**puzzle_input)} in {time.time() - s}')
     s = time.time()
-    print(f'Total orientations: {part2(towels, pattern_requests)} in {time.time() - s}')
+    print(f'Total orientations: {part2(**puzzle_input)} in {time.time() - s}')
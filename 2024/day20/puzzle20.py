@@ -1,33 +1,44 @@
 """ Advent of Code 2024: Day 20 Race Condition """
+import sys
 from collections import defaultdict
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # pylint: disable=wrong-import-position
 
-def part1(racetrack: list[list[str]]) -> int:
-    """Given a racetrack, find the path through and then check for possible shortcuts."""
 
-    # find the intial set of tiles that get you through the racetrack
-    start = next(
-        (i, j) for i, row in enumerate(racetrack) for j, c in enumerate(row) if c == 'S'
-    )
-    end = next(
-        (i, j) for i, row in enumerate(racetrack) for j, c in enumerate(row) if c == 'E'
-    )
+WALL = ord('#')
 
-    exit_path = [start] # tiles accessed to get to end
-    directions = {(0, 1), (0, -1), (1, 0), (-1, 0)}
-    prev_dir = (0, 0)
+# variants aoc.verify should not expect to agree with the plain part
+KNOWN_DIVERGENT = {
+    'part2_hard': 'abandoned approach, only counts cheats through a single wall cluster',
+}
 
-    i, j = start
-    while (i, j) != end:
-        for di, dj in directions - {prev_dir}:
-            i_next, j_next = i + di, j + dj
-            if racetrack[i_next][j_next] == '#':
+
+def find_exit_path(racetrack: Grid) -> list[tuple[int, int]]:
+    """Find the intial set of tiles that get you through the racetrack."""
+    cells = racetrack.cells
+    idx = racetrack.find_index('S')
+    end = racetrack.find_index('E')
+
+    exit_path = [idx] # tiles accessed to get to end
+    prev_offset = 0
+
+    while idx != end:
+        for offset in racetrack.orthogonal:
+            if offset == prev_offset or cells[idx + offset] == WALL:
                 continue
-            else:
-                prev_dir = (-di, -dj)
-                i, j = i_next, j_next
-                exit_path.append((i, j))
-                break
+            prev_offset = -offset
+            idx += offset
+            exit_path.append(idx)
+            break
+
+    return [racetrack.coords(idx) for idx in exit_path]
+
+
+def part1(racetrack: Grid) -> int:
+    """Given a racetrack, find the path through and then check for possible shortcuts."""
+    exit_path = find_exit_path(racetrack)
 
     cheat_paths = {}
     for lead_idx, lead in enumerate(exit_path):
@@ -39,14 +50,14 @@ def part1(racetrack: list[list[str]]) -> int:
             horz_shift = abs(i_2 - i_1) == 0 and abs(j_2 - j_1) == 2
             i_btw, j_btw = (i_1 + i_2) // 2, (j_1 + j_2) // 2
 
-            if (vert_shift or horz_shift) and racetrack[i_btw][j_btw] == '#':
+            if (vert_shift or horz_shift) and racetrack[i_btw, j_btw] == '#':
                 dist_skipped = (exit_path.index(lag) - exit_path.index(lead)) - 2
                 cheat_paths[(lead, lag)] = dist_skipped
 
-    return sum(1 for k, v in cheat_paths.items() if v >= 100), exit_path
+    return sum(1 for k, v in cheat_paths.items() if v >= 100)
 
 
-def part2_hard(racetrack: list[list[str]]) -> int:
+def part2_hard(racetrack: Grid) -> int:
     """
     The idea here was to only move through a valid cheat if all points in the cheat were wall
     and not wall + open space.
@@ -57,14 +68,8 @@ def part2_hard(racetrack: list[list[str]]) -> int:
 
     # cheats need to have solid wall between entry and exit
     # for each wall loc - find other accessible wall locs
-    start = next(
-        (i, j) for i, row in enumerate(racetrack) for j, c in enumerate(row) if c == 'S'
-    )
-    end = next(
-        (i, j) for i, row in enumerate(racetrack) for j, c in enumerate(row) if c == 'E'
-    )
-
-    n_rows, n_cols = len(racetrack), len(racetrack[0])
+    start = racetrack.find('S')
+    end = racetrack.find('E')
 
     exit_path = [start] # tiles accessed to get to end
     directions = {(0, 1), (0, -1), (1, 0), (-1, 0)}
@@ -74,8 +79,7 @@ def part2_hard(racetrack: list[list[str]]) -> int:
     while (i, j) != end:
         for di, dj in directions:
             i_next, j_next = i + di, j + dj
-            if racetrack[i_next][j_next] == '#':
-                # if 0 < i_next < n_rows-1 and 0 < j_next < n_cols-1:
+            if racetrack[i_next, j_next] == '#':
                 wall_to_tile[(i_next, j_next)].append((i, j))
                 tile_to_wall[(i, j)].append((i_next, j_next))
             elif (di, dj) != prev_dir:
@@ -85,11 +89,7 @@ def part2_hard(racetrack: list[list[str]]) -> int:
 
     # build out wall clusters
     wall_clusters = [set()]
-    wall_tiles = []
-    for i, row in enumerate(racetrack):
-        for j, c in enumerate(row):
-            if c == '#': # and (0 < i < n_rows-1) and (0 < j < n_cols-1):
-                wall_tiles.append((i, j))
+    wall_tiles = [racetrack.coords(idx) for idx in racetrack.indices('#')]
 
     def _adjacent(tile, cluster):
         for adj in cluster:
@@ -146,8 +146,9 @@ def part2_hard(racetrack: list[list[str]]) -> int:
     return sum(1 for k, v in cheat_paths.items() if v >= 100)
 
 
-def part2(exit_path):
+def part2(racetrack: Grid) -> int:
     """Find additional exit paths given cheat window."""
+    exit_path = find_exit_path(racetrack)
     cheat_paths = {}
     for i in range(len(exit_path)):
         for j in range(i+1, len(exit_path)):
@@ -163,10 +164,16 @@ def part2(exit_path):
     return sum(1 for k, v in cheat_paths.items() if v >= 100)
 
 
+def parse_input(filename: str) -> dict:
+    """Read racetrack into a grid."""
+    with open(filename, 'r') as f:
+        racetrack = f.read().strip().split('\n')
+
+    return {'racetrack': Grid(racetrack)}
+
+
 if __name__ == '__main__':
-    with open('advent_of_code/2024/day20/input.txt', 'r') as f:
-        racetrack = f.read().split('\n')
-    racetrack = [list(l) for l in racetrack]
-    cheat_count, exit_path = part1(racetrack)
-    print(f'Cheating paths > 100 picos: {cheat_count}')
-    print(f'Longer cheat window paths: {part2(exit_path)}')
+    puzzle_input = parse_input('advent_of_code/2024/day20/input.txt')
+
+    print(f'Cheating paths > 100 picos: {part1(**puzzle_input)}')
+    print(f'Longer cheat window paths: {part2(**puzzle_input)}')
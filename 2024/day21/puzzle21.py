@@ -33,10 +33,15 @@ v<<A^>>AvA^Av<A<AA^>>AAvA^<A>AAvA^Av<A^>AA<A>Av<<A>A^>AAAvA^<A>A
 string length=64
 Complexity: 379 x 64 = 24256
 """
-from enum import Enum
-from functools import lru_cache
-import time
 import heapq
+import sys
+import time
+from enum import Enum
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import counters  # pylint: disable=wrong-import-position
+from aoc.memo import memoize  # pylint: disable=wrong-import-position
 
 
 DPAD_GRID = {
@@ -68,7 +73,7 @@ class KeypadType(Enum):
     DPAD = 2
 
 
-@lru_cache(maxsize=None)
+@memoize
 def _find_shortest_path(pad_type: KeypadType, start: str,
                         target: str, append_a=True) -> list[list[str]]:
     """
@@ -95,11 +100,15 @@ def _find_shortest_path(pad_type: KeypadType, start: str,
     best_dist = float('inf')
 
     pq = [(0, start, [start], None)]
+    probe = counters.probe(__name__, '_find_shortest_path')
 
     while pq:
         dist, node, path, d = heapq.heappop(pq)
+        probe.pop()
         if (node, d) in visited:
+            probe.skip()
             continue
+        probe.expand()
         if node == target:
             if dist < best_dist:
                 best_paths = [path]
@@ -115,6 +124,7 @@ def _find_shortest_path(pad_type: KeypadType, start: str,
             if new_dist <= distances[neighbor]:
                 distances[neighbor] = new_dist
                 heapq.heappush(pq, (new_dist, neighbor, path + [neighbor], new_dir))
+                probe.push(len(pq))
 
     # convert to the directional symbol
     translated_paths = []
@@ -142,7 +152,7 @@ def _unwind_directional(target_path):
 
     for seq in target_path:
         for entry in seq:
-            paths = _find_shortest_path(KeypadType.DPAD, start, entry, append_A=False)
+            paths = _find_shortest_path(KeypadType.DPAD, start, entry, append_a=False)
             start = entry
             sequence.append(paths)
 
@@ -156,7 +166,7 @@ def _unwind_directional(target_path):
     return sequence_chunks
 
 
-@lru_cache(maxsize=None)
+@memoize
 def _unwind_robot(target_path, n_iters):
     """Recursive function to traverse to highest level robot."""
     if n_iters == 0:
@@ -186,7 +196,12 @@ def _find_base_keypad_path(code):
     return code_path
 
 
-def part2(codes: list[str], n_iters: int) -> int:
+def part1(codes: list[str], n_iters: int = 2) -> int:
+    """Complexity of codes with two directional robots in between."""
+    return part2(codes, n_iters)
+
+
+def part2(codes: list[str], n_iters: int = 25) -> int:
     """
     Primary function to find base keypad shortest path and then provide
     to recursive function in determining shortest path after unwinds.
@@ -210,15 +225,21 @@ def part2(codes: list[str], n_iters: int) -> int:
     return complexity
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day21/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read door codes."""
+    with open(filename, 'r') as f:
         codes = f.readlines()
-    codes = [c.strip() for c in codes]
+
+    return {'codes': [c.strip() for c in codes]}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day21/input.txt')
 
     s = time.time()
     ITERS = 2
-    print(f'Complexity of codes: {part2(codes, ITERS)} in {time.time() - s}')
+    print(f'Complexity of codes: {part2(**puzzle_input, n_iters=ITERS)} in {time.time() - s}')
 
     s = time.time()
     ITERS = 25
-    print(f'Complexity of codes (n={ITERS}): {part2(codes, ITERS)} in {time.time() - s}')
+    print(f'Complexity of codes (n={ITERS}): {part2(**puzzle_input, n_iters=ITERS)} in {time.time() - s}')
@@ -2,10 +2,15 @@
 Advent of Code 2024: Day 22
 Monkey Market
 """
-from functools import lru_cache
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import stream  # pylint: disable=wrong-import-position
+from aoc.memo import memoize  # pylint: disable=wrong-import-position
 
-@lru_cache(maxsize=None)
+
+@memoize
 def generate_secret(secret):
     """Helper function to generate next secret."""
     secret = ((secret * 64) ^ secret) % 16777216
@@ -65,10 +70,29 @@ def part2(buyer_seeds: list[int]) -> int:
     return max_value
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day22/input.txt', 'r') as f:
+def part1_stream(filename: str) -> int:
+    """part1 reading one seed at a time from the file."""
+    return part1(int(line) for line in stream.lines(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """
+    part2 reading one seed at a time from the file. The totals are keyed by
+    four price changes, so there are at most 19**4 of them whatever the input.
+    """
+    return part2(int(line) for line in stream.lines(filename))
+
+
+def parse_input(filename: str) -> dict:
+    """Read initial secret per buyer."""
+    with open(filename, 'r') as f:
         seeds = f.readlines()
-    seeds = [int(i.strip()) for i in seeds]
 
-    print(f'Total sum of secrets: {part1(seeds)}')
-    print(f'Max bananas: {part2(seeds)}')
\ No newline at end of file
+    return {'buyer_seeds': [int(i.strip()) for i in seeds]}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day22/input.txt')
+
+    print(f'Total sum of secrets: {part1(**puzzle_input)}')
+    print(f'Max bananas: {part2(**puzzle_input)}')
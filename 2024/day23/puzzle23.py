@@ -2,7 +2,12 @@
 Advent of Code 2024: Day 23
 LAN Party
 """
+import sys
 from itertools import combinations
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import counters, stream  # pylint: disable=wrong-import-position
 
 
 def _build_lan_map(computer_links: list[tuple[str]]):
@@ -50,8 +55,11 @@ def part2(computer_links: list[tuple[str]]) -> int:
     """Find maximum clique within graph of computers."""
     # need to find largest cluster of connected computers
     lan_map = _build_lan_map(computer_links)
+    probe = counters.probe(__name__, '_bron_kerbosch')
 
     def _bron_kerbosch(R, P, X, G):
+        # R grows by one vertex per level, so its size is the recursion depth
+        probe.expand(len(R))
         if not P and not X:
             yield R
         for v in P.copy():
@@ -68,10 +76,31 @@ def part2(computer_links: list[tuple[str]]) -> int:
     return ','.join(sorted(max_clique))
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day23/input.txt', 'r') as f:
+def _stream_links(filename: str):
+    for line in stream.text_lines(filename):
+        yield tuple(line.split('-'))
+
+
+def part1_stream(filename: str) -> int:
+    """part1 building the LAN map straight from the file, without the list of links."""
+    return part1(_stream_links(filename))
+
+
+def part2_stream(filename: str) -> int:
+    """part2 building the LAN map straight from the file, without the list of links."""
+    return part2(_stream_links(filename))
+
+
+def parse_input(filename: str) -> dict:
+    """Read computer link pairs."""
+    with open(filename, 'r') as f:
         computer_links = f.readlines()
-    computer_links = [tuple(i.strip().split('-')) for i in computer_links]
 
-    print(f'Possible historian trios: {part1(computer_links)}')
-    print(f'LAN password: {part2(computer_links)}')
+    return {'computer_links': [tuple(i.strip().split('-')) for i in computer_links]}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day23/input.txt')
+
+    print(f'Possible historian trios: {part1(**puzzle_input)}')
+    print(f'LAN password: {part2(**puzzle_input)}')
@@ -126,14 +126,21 @@ def part2(gates) -> str:
     return ','.join(sorted(swaps.keys()))
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day24/input.txt', 'r') as f:
+def parse_input(filename: str) -> dict:
+    """Read initial wire values and gate connections."""
+    with open(filename, 'r') as f:
         wires, gates = f.read().split('\n\n')
 
     wires = [tuple(l.split(': ')) for l in wires.split('\n')]
     wires = [tuple([l[0], int(l[1])]) for l in wires]
-    gates = [l.split(' -> ') for l in gates.split('\n')]
+    gates = [l.split(' -> ') for l in gates.strip().split('\n')]
     gates = [[l[0].split(' '), l[1]] for l in gates]
 
-    print(f'Output of wires: {part1(wires, gates)}')
-    print(f'Crossed wires: {part2(gates)}')
+    return {'wires': wires, 'gates': gates}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day24/input.txt')
+
+    print(f'Output of wires: {part1(**puzzle_input)}')
+    print(f'Crossed wires: {part2(puzzle_input["gates"])}')
@@ -29,9 +29,10 @@ def part1(locks: list[list[str]], keys: list[list[str]]) -> int:
     return lock_key_pairs
 
 
-if __name__ == '__main__':
-    with open('advent_of_code/2024/day25/input.txt', 'r') as f:
-        schematics = f.read().split('\n\n')
+def parse_input(filename: str) -> dict:
+    """Split schematics into locks and keys."""
+    with open(filename, 'r') as f:
+        schematics = f.read().strip().split('\n\n')
 
     locks, keys = [], []
     for schema in schematics:
@@ -41,4 +42,10 @@ if __name__ == '__main__':
         else:
             keys.append(grid)
 
-    print(f'Matching locks and keys: {part1(locks, keys)}')
+    return {'locks': locks, 'keys': keys}
+
+
+if __name__ == '__main__':
+    puzzle_input = parse_input('advent_of_code/2024/day25/input.txt')
+
+    print(f'Matching locks and keys: {part1(**puzzle_input)}')
@@ -0,0 +1,3 @@
+"""
+Shared tooling for running, timing and checking the daily puzzle modules.
+"""
@@ -0,0 +1,132 @@
+"""
+Solve one day for many inputs in a single process, sharing memo tables.
+
+Parts run part-major: every input goes through part1, then every input through
+part2, and so on, so a memoized helper that is independent of the input (day21's
+_unwind_robot, day11's dfs) is computed once for the whole batch. --isolated
+clears the tables before each input instead, for comparison.
+
+    python -m aoc.batch 2024 21 team/*/2024/day21/input.txt
+    python -m aoc.batch 2024 11 --generate 20 --scale 1 --isolated
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aoc import generators, memo
+from aoc.bench import clear_caches
+from aoc.puzzles import Puzzle, call_part, discover
+
+
+def run_batch(puzzle: Puzzle, filenames: list[Path | str], parts: list[str] | None = None,
+              share_caches: bool = True) -> dict:
+    """Run the selected parts over every input, returning per input and aggregate results."""
+    module = puzzle.load()
+    available = puzzle.parts(variants=bool(parts))
+    names = parts or list(available)
+    for name in names:
+        if name not in available:
+            raise KeyError(f'{puzzle.name} has no {name}')
+    clear_caches(module)
+
+    inputs = []
+    s = time.perf_counter()
+    for filename in filenames:
+        inputs.append((str(filename), puzzle.parse(filename=filename)))
+    parse_seconds = time.perf_counter() - s
+
+    per_input = {filename: {} for filename, _ in inputs}
+    aggregate = {}
+    for name in names:
+        fn = available[name]
+        total = 0.0
+        for filename, puzzle_input in inputs:
+            if not share_caches:
+                clear_caches(module)
+            s = time.perf_counter()
+            try:
+                answer = call_part(fn, puzzle_input)
+            except Exception as exc:  # pylint: disable=broad-except
+                answer = f'error: {exc!r}'
+            elapsed = time.perf_counter() - s
+            total += elapsed
+            per_input[filename][name] = {'answer': answer, 'seconds': elapsed}
+        aggregate[name] = {
+            'seconds': total,
+            'inputs_per_second': len(inputs) / total if total else float('inf'),
+            'mean_seconds': total / len(inputs) if inputs else 0.0,
+        }
+
+    return {
+        'puzzle': puzzle.name,
+        'shared_caches': share_caches,
+        'n_inputs': len(inputs),
+        'parse_seconds': parse_seconds,
+        'inputs': per_input,
+        'parts': aggregate,
+        'memo': memo.module_stats(module),
+    }
+
+
+def format_report(result: dict) -> str:
+    lines = []
+    for filename, parts in result['inputs'].items():
+        for name, part in parts.items():
+            lines.append(f"{filename:<40} {name:<16} {part['seconds']:>9.4f}s  {part['answer']}")
+    lines.append('')
+    mode = 'shared caches' if result['shared_caches'] else 'isolated caches'
+    lines.append(f"{result['puzzle']} x{result['n_inputs']} inputs, {mode}, "
+                 f"parse {result['parse_seconds']:.3f}s")
+    for name, agg in result['parts'].items():
+        lines.append(f"  {name:<16} total {agg['seconds']:>8.3f}s  mean {agg['mean_seconds']:.4f}s  "
+                     f"{agg['inputs_per_second']:>8.1f} inputs/s")
+    for name, info in result['memo'].items():
+        calls = info['hits'] + info['misses']
+        rate = info['hits'] / calls if calls else 0.0
+        lines.append(f"  memo {name}: {rate:.1%} hit rate, {info['currsize']} entries")
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('year', type=int)
+    parser.add_argument('day', type=int)
+    parser.add_argument('inputs', nargs='*', type=Path, help='input files')
+    parser.add_argument('--part', action='append', help='part function to run (repeatable)')
+    parser.add_argument('--generate', type=int, default=0, metavar='N',
+                        help='add N generated inputs (seeds 0..N-1)')
+    parser.add_argument('--scale', type=float, default=1, help='scale of generated inputs')
+    parser.add_argument('--isolated', action='store_true',
+                        help='clear memo tables before every input')
+    parser.add_argument('--json', type=Path, help='write full results here')
+    args = parser.parse_args(argv)
+
+    puzzles = discover([args.year], [args.day])
+    if not puzzles:
+        parser.error(f'no puzzle module for {args.year} day {args.day}')
+    puzzle = puzzles[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filenames = list(args.inputs)
+        for seed in range(args.generate):
+            path = Path(tmp) / f'seed{seed}.txt'
+            path.write_text(generators.generate(args.year, args.day, args.scale, seed))
+            filenames.append(path)
+        if not filenames:
+            parser.error('no inputs given, pass files or --generate N')
+
+        result = run_batch(puzzle, filenames, args.part, share_caches=not args.isolated)
+
+    print(format_report(result))
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2, default=str))
+
+    return int(any(str(p['answer']).startswith('error:')
+                   for parts in result['inputs'].values() for p in parts.values()))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Benchmark every part function (including alternates such as part2_optimized)
+and gate on regressions against a stored JSON baseline.
+
+    python -m aoc.bench --input-root ~/aoc-inputs --update-baseline
+    python -m aoc.bench --input-root ~/aoc-inputs --threshold 0.25
+    python -m aoc.bench --scale 1 --scale 10 --scale 100 --day 9
+    python -m aoc.bench --counters --year 2024 --day 16 --day 18
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aoc import cache, counters, generators, memo, memtrack
+from aoc.puzzles import REPO_ROOT, Puzzle, bind_args, discover
+
+
+DEFAULT_BASELINE = REPO_ROOT / 'bench_baseline.json'
+
+
+def clear_caches(module):
+    """Reset module level memo tables so each timed call starts cold."""
+    for obj in vars(module).values():
+        if callable(getattr(obj, 'cache_clear', None)):
+            obj.cache_clear()
+
+
+def time_part(fn, puzzle_input: dict, module=None, warmup: int = 1, repeats: int = 5,
+              warm_cache: bool = False) -> dict:
+    """Time a single part function, returning summary statistics in seconds."""
+    samples = []
+    answer = None
+    for i in range(warmup + repeats):
+        kwargs = bind_args(fn, puzzle_input)
+        if module is not None and not warm_cache:
+            clear_caches(module)
+        s = time.perf_counter()
+        answer = fn(**kwargs)
+        elapsed = time.perf_counter() - s
+        if i >= warmup:
+            samples.append(elapsed)
+
+    return {
+        'answer': answer,
+        'repeats': repeats,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def measure_part(fn, puzzle_input: dict, module=None, mode: str = 'tracemalloc',
+                 warm_cache: bool = False) -> dict:
+    """Peak memory of one more call of a part, see aoc.memtrack."""
+    def make_kwargs():
+        if module is not None and not warm_cache:
+            clear_caches(module)
+        return bind_args(fn, puzzle_input)
+
+    return memtrack.measure(fn, make_kwargs, mode)
+
+
+def count_part(fn, puzzle_input: dict, module, warm_cache: bool = False) -> dict:
+    """Search counters from one more, untimed call of a part, see aoc.counters."""
+    kwargs = bind_args(fn, puzzle_input)
+    if not warm_cache:
+        clear_caches(module)
+    with counters.counting(module):
+        fn(**kwargs)
+    return counters.module_stats(module)
+
+
+def bench_puzzle(puzzle: Puzzle, input_root: Path | str = REPO_ROOT,
+                 memory: str | None = None, count: bool = False, **kwargs) -> dict:
+    """
+    Benchmark all part functions of one puzzle. Keys are `YYYY/dayNN:partN`.
+    With `memory` set to a memtrack mode, each part also gets a `memory` report,
+    and with `count` a `counters` report of the work its searches did, both
+    from separate, untimed calls.
+    """
+    results = {}
+    try:
+        module = puzzle.load()
+        puzzle_input = puzzle.parse(input_root)
+    except Exception as exc:  # pylint: disable=broad-except
+        return {f'{puzzle.name}:*': {'error': repr(exc)}}
+
+    for name, fn in puzzle.parts(variants=True).items():
+        try:
+            results[f'{puzzle.name}:{name}'] = time_part(fn, puzzle_input, module, **kwargs)
+            # counters cover the last timed call (or all calls with warm_cache)
+            caches = {k: v for k, v in memo.module_stats(module).items() if v['hits'] or v['misses']}
+            if caches:
+                results[f'{puzzle.name}:{name}']['memo'] = caches
+            if memory:
+                results[f'{puzzle.name}:{name}']['memory'] = measure_part(
+                    fn, puzzle_input, module, memory, kwargs.get('warm_cache', False))
+            if count:
+                searches = count_part(fn, puzzle_input, module, kwargs.get('warm_cache', False))
+                if searches:
+                    results[f'{puzzle.name}:{name}']['counters'] = searches
+        except Exception as exc:  # pylint: disable=broad-except
+            results[f'{puzzle.name}:{name}'] = {'error': repr(exc)}
+
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float = 0.2,
+                     min_seconds: float = 0.005) -> list[tuple[str, float, float]]:
+    """
+    Return (key, baseline median, current median) for parts whose median grew by
+    more than `threshold` as a fraction of baseline. Parts faster than
+    `min_seconds` in both runs are too noisy to gate on.
+    """
+    regressions = []
+    for key, stats in results.items():
+        if 'median' not in stats or 'median' not in baseline.get(key, {}):
+            continue
+        before, after = baseline[key]['median'], stats['median']
+        if max(before, after) < min_seconds:
+            continue
+        if after > before * (1 + threshold):
+            regressions.append((key, before, after))
+    return regressions
+
+
+def find_memory_regressions(results: dict, baseline: dict, threshold: float = 0.2,
+                            min_bytes: int = 1 << 20) -> list[tuple[str, int, int]]:
+    """
+    Return (key, baseline peak, current peak) for parts whose peak memory grew
+    by more than `threshold`. Peaks under `min_bytes` in both runs are ignored.
+    """
+    regressions = []
+    for key, stats in results.items():
+        before = baseline.get(key, {}).get('memory', {})
+        after = stats.get('memory', {})
+        if 'peak_bytes' not in before or 'peak_bytes' not in after:
+            continue
+        if before.get('mode') != after.get('mode'):
+            continue
+        before, after = before['peak_bytes'], after['peak_bytes']
+        if max(before, after) < min_bytes:
+            continue
+        if after > before * (1 + threshold):
+            regressions.append((key, before, after))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--input-root', default=REPO_ROOT, type=Path)
+    parser.add_argument('--year', type=int, action='append')
+    parser.add_argument('--day', type=int, action='append')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='keep lru_cache tables between repeats')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed fractional slowdown of the median (default 0.2)')
+    parser.add_argument('--min-seconds', type=float, default=0.005)
+    parser.add_argument('--scale', type=float, action='append',
+                        help='bench on generated inputs of this scale instead (repeatable)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', type=Path, help='write full results here')
+    parser.add_argument('--memory', choices=memtrack.MODES,
+                        help='also record peak memory per part (extra untimed calls)')
+    parser.add_argument('--memory-threshold', type=float, default=0.2,
+                        help='allowed fractional growth of peak memory (default 0.2)')
+    parser.add_argument('--counters', action='store_true',
+                        help='also record search work counters per part (extra untimed call)')
+    parser.add_argument('--no-cache', action='store_true', help='always re-parse inputs')
+    parser.add_argument('--cache-dir', type=Path, help='parsed input cache location')
+    args = parser.parse_args(argv)
+
+    cache.configure(not args.no_cache, args.cache_dir)
+
+    puzzles = discover(args.year, args.day)
+    bench_kwargs = {'warmup': args.warmup, 'repeats': args.repeats, 'warm_cache': args.warm_cache,
+                    'memory': args.memory, 'count': args.counters}
+    results = {}
+    if args.scale:
+        for scale in args.scale:
+            with tempfile.TemporaryDirectory() as tmp:
+                selected = [(p.year, p.day) for p in puzzles if (p.year, p.day) in generators.GENERATORS]
+                generators.write_inputs(tmp, scale, args.seed, selected)
+                for puzzle in puzzles:
+                    if puzzle.input_path(tmp).exists():
+                        scaled = bench_puzzle(puzzle, tmp, **bench_kwargs)
+                        results.update({f'{k}@x{scale:g}': v for k, v in scaled.items()})
+    else:
+        for puzzle in puzzles:
+            if puzzle.input_path(args.input_root).exists():
+                results.update(bench_puzzle(puzzle, args.input_root, **bench_kwargs))
+
+    for key, stats in results.items():
+        if 'error' in stats:
+            print(f'{key:<30} error {stats["error"]}')
+        else:
+            print(f'{key:<30} median {stats["median"]:>9.4f}s  min {stats["min"]:>9.4f}s  '
+                  f'stdev {stats["stdev"]:.4f}')
+            for fn_name, info in stats.get('memo', {}).items():
+                print(f'{"":<32}{fn_name}: {info["hits"]} hits {info["misses"]} misses '
+                      f'{info["evictions"]} evictions ~{info["nbytes"] / 2 ** 20:.1f} MiB')
+            for fn_name, info in stats.get('counters', {}).items():
+                print(f'{"":<32}{fn_name}: {info["calls"]} calls {info["expanded"]} expanded '
+                      f'{info["pushes"]} pushes {info["pops"]} pops {info["stale"]} stale, '
+                      f'max frontier {info["max_frontier"]} max depth {info["max_depth"]}')
+            if 'memory' in stats:
+                mem = stats['memory']
+                print(f'{"":<32}peak {memtrack.format_bytes(mem["peak_bytes"])}'
+                      f'  retained {memtrack.format_bytes(mem["retained_bytes"])}'
+                      + (f'  {mem["blocks_at_peak"]} blocks near peak' if 'blocks_at_peak' in mem else ''))
+                for line in mem.get('top_lines', [])[:3]:
+                    print(f'{"":<34}{memtrack.format_bytes(line["bytes"]):>10}  {line["line"]}')
+
+    if args.memory:
+        ranked = sorted((k for k in results if 'memory' in results[k]),
+                        key=lambda k: results[k]['memory']['peak_bytes'], reverse=True)
+        print('\nPeak memory ranking:')
+        for key in ranked:
+            print(f'{key:<30} {memtrack.format_bytes(results[key]["memory"]["peak_bytes"]):>10}')
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, default=str))
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update({k: v for k, v in results.items() if 'error' not in v})
+        args.baseline.write_text(json.dumps(baseline, indent=2, default=str, sort_keys=True))
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(results, baseline, args.threshold, args.min_seconds)
+    for key, before, after in regressions:
+        print(f'REGRESSION {key}: {before:.4f}s -> {after:.4f}s ({after / before - 1:+.0%})')
+
+    memory_regressions = find_memory_regressions(results, baseline, args.memory_threshold)
+    for key, before, after in memory_regressions:
+        print(f'MEMORY REGRESSION {key}: {memtrack.format_bytes(before)} -> '
+              f'{memtrack.format_bytes(after)} ({after / before - 1:+.0%})')
+    regressions += memory_regressions
+
+    return int(bool(regressions))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,446 @@
+"""
+On-disk cache of parsed puzzle inputs.
+
+Each day's `parse_input` result is written once to a binary file keyed by the
+SHA-256 of the input file and a fingerprint of the parser: the bytecode of
+`parse_input` and of every repo function and class it reaches through global
+names, including those in aoc modules such as aoc.grid, the plain constants
+those names hold, and this file's format version. Later runs memory-map that
+file instead of re-parsing, and any change to the input or the parser selects a
+fresh key, so stale entries are never read.
+
+File layout, all integers little endian:
+
+    b'AOCP'  u32 header length  JSON header  payload blobs (8 byte aligned)
+
+The header lists one field per keyword argument with its kind, offset and
+length. Kinds:
+
+    grid         aoc.grid.Grid, raw padded cells
+    array        array.array, raw buffer
+    ints         list of int64
+    int_records  list of equal width int rows, struct packed
+    int_rows     ragged list of int rows, offsets + values
+    records      list of equally shaped records (nested lists, tuples and
+                 str keyed dicts of int64 and str), struct packed with each
+                 field as narrow as its values allow
+    strs         list or tuple of str, char offsets + utf-8 text
+    str          a single str
+    ndarray      numpy array, raw buffer (only if the parser returns one)
+    pickle       anything else
+
+Set AOC_CACHE=0 to bypass the cache, AOC_CACHE_DIR to move it
+(default .cache/parsed under the repo root).
+"""
+import hashlib
+import inspect
+import itertools
+import json
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from aoc.grid import Grid
+
+
+FORMAT_VERSION = 1
+MAGIC = b'AOCP'
+ENV_ENABLED = 'AOC_CACHE'
+ENV_DIR = 'AOC_CACHE_DIR'
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'parsed'
+
+_HEADER_LEN = struct.Struct('<I')
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+# globals whose repr is stable across processes and that parsers read as constants
+_PLAIN_TYPES = (type(None), bool, int, float, str, bytes, tuple, frozenset, list, dict, set,
+                re.Pattern)
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_ENABLED, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def configure(use_cache: bool = True, cache_dir: Path | str | None = None):
+    """Set cache options for this process and any workers it starts."""
+    os.environ[ENV_ENABLED] = '1' if use_cache else '0'
+    if cache_dir is not None:
+        os.environ[ENV_DIR] = str(cache_dir)
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get(ENV_DIR, DEFAULT_DIR))
+
+
+def _stable_repr(value) -> str:
+    """repr that does not depend on the string hash seed, for set-like values."""
+    if isinstance(value, (set, frozenset)):
+        return f'{type(value).__name__}({sorted(map(_stable_repr, value))!r})'
+    return repr(value)
+
+
+def _hash_code(code, digest):
+    """Feed a code object's bytecode, names and constants (recursively) into digest."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _hash_code(const, digest)
+        else:
+            digest.update(_stable_repr(const).encode())
+
+
+def _code_names(code) -> list[str]:
+    """Global and attribute names used by a code object and the code nested in it."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names += _code_names(const)
+    return names
+
+
+def _is_local(obj) -> bool:
+    """Whether obj is defined in a file of this repo (puzzle modules and aoc)."""
+    if inspect.isfunction(obj):
+        path = obj.__code__.co_filename
+    else:
+        path = getattr(sys.modules.get(getattr(obj, '__module__', None)), '__file__', None) or ''
+    return path.startswith(_REPO_ROOT) and 'site-packages' not in path
+
+
+def _hash_function(fn, digest, seen: set):
+    """Hash fn's bytecode and everything it reaches through its global names."""
+    if fn.__code__ in seen:
+        return
+    seen.add(fn.__code__)
+    _hash_code(fn.__code__, digest)
+
+    names = _code_names(fn.__code__)
+    # `grid.Grid` or `stream.lines` reach into an aoc module by attribute
+    namespaces = [fn.__globals__] + [
+        vars(value) for value in fn.__globals__.values()
+        if inspect.ismodule(value) and value.__name__.split('.')[0] == 'aoc']
+    for name in dict.fromkeys(names):
+        for namespace in namespaces:
+            if name in namespace:
+                _hash_global(name, namespace[name], digest, seen)
+
+
+def _hash_global(name: str, value, digest, seen: set):
+    # memoized helpers are wrappers around the function that matters
+    target = inspect.unwrap(value) if hasattr(value, '__wrapped__') else value
+    if inspect.isfunction(target):
+        if _is_local(target):
+            digest.update(f'def {name}:'.encode())
+            _hash_function(target, digest, seen)
+    elif inspect.isclass(value):
+        if _is_local(value) and value not in seen:
+            seen.add(value)
+            digest.update(f'class {name}:'.encode())
+            for attr, member in sorted(vars(value).items()):
+                member = getattr(member, '__func__', None) or getattr(member, 'fget', None) or member
+                if inspect.isfunction(member):
+                    digest.update(f'{attr}:'.encode())
+                    _hash_function(member, digest, seen)
+    elif isinstance(value, _PLAIN_TYPES):
+        digest.update(f'{name}={_stable_repr(value)}:'.encode())
+
+
+def parser_fingerprint(module) -> str:
+    """
+    Hash identifying the parser that produced a cached entry: parse_input and
+    the repo functions, classes and constants reachable from it.
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{FORMAT_VERSION}:'.encode())
+    _hash_function(module.parse_input, digest, set())
+    return digest.hexdigest()
+
+
+def input_digest(filename: Path | str) -> str:
+    with open(filename, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def entry_path(module, name: str, filename: Path | str) -> Path:
+    """Cache file for this puzzle, input and parser. `name` is e.g. 2024/day06."""
+    return cache_dir() / name / f'{input_digest(filename)[:20]}-{parser_fingerprint(module)[:12]}.bin'
+
+
+def load_or_parse(module, name: str, filename: Path | str) -> dict:
+    """Return parsed input, reading it from the cache when possible."""
+    if not enabled():
+        return module.parse_input(str(filename))
+
+    path = entry_path(module, name, filename)
+    if path.exists():
+        try:
+            return read(path)
+        except (ValueError, KeyError, IndexError, TypeError, EOFError, OSError, struct.error,
+                pickle.UnpicklingError):
+            # truncated or corrupt: parse again and overwrite it
+            path.unlink(missing_ok=True)
+
+    puzzle_input = module.parse_input(str(filename))
+    write(path, puzzle_input)
+    return puzzle_input
+
+
+def _is_int(x) -> bool:
+    return type(x) is int and _INT64_MIN <= x <= _INT64_MAX
+
+
+def _encode(value) -> tuple[str, dict, list[bytes]]:
+    """Pick the most compact kind for a value. Returns (kind, meta, blobs)."""
+    if isinstance(value, Grid):
+        meta = {'n_rows': value.n_rows, 'n_cols': value.n_cols,
+                'pad': value.pad, 'border': value.border}
+        return 'grid', meta, [bytes(value.cells)]
+
+    if isinstance(value, array):
+        return 'array', {'typecode': value.typecode}, [value.tobytes()]
+
+    if type(value).__module__ == 'numpy' and hasattr(value, 'dtype'):
+        return 'ndarray', {'dtype': value.dtype.str, 'shape': list(value.shape)}, \
+            [value.tobytes(order='C')]
+
+    if isinstance(value, str):
+        return 'str', {}, [value.encode()]
+
+    if type(value) in (list, tuple) and value:
+        container = type(value).__name__
+        if all(_is_int(x) for x in value):
+            return 'ints', {'container': container}, [array('q', value).tobytes()]
+
+        if all(type(x) is str for x in value):
+            offsets = array('Q', [0])
+            for s in value:
+                offsets.append(offsets[-1] + len(s))
+            return 'strs', {'container': container}, \
+                [offsets.tobytes(), ''.join(value).encode()]
+
+        row_type = type(value[0])
+        if row_type in (list, tuple) and all(
+                type(r) is row_type and all(_is_int(x) for x in r) for r in value):
+            meta = {'container': container, 'row': row_type.__name__}
+            width = len(value[0])
+            if width and all(len(r) == width for r in value):
+                meta['format'] = f'<{width}q'
+                packer = struct.Struct(meta['format'])
+                return 'int_records', meta, [b''.join(packer.pack(*r) for r in value)]
+
+            offsets = array('Q', [0])
+            values = array('q')
+            for r in value:
+                values.extend(r)
+                offsets.append(len(values))
+            return 'int_rows', meta, [offsets.tobytes(), values.tobytes()]
+
+        records = _encode_records(value)
+        if records is not None:
+            return 'records', {'container': container, **records[0]}, [records[1]]
+
+    return 'pickle', {}, [pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)]
+
+
+def _shape_of(x):
+    """
+    Template of one record: 'q' for an int64, 's' for a str, ['list', [...]]
+    or ['tuple', [...]] for a container, ['dict', keys, [...]] for a str keyed
+    dict. None when the value cannot be a fixed size record.
+    """
+    t = type(x)
+    if t is int:
+        return 'q' if _is_int(x) else None
+    if t is str:
+        # fields are padded with NUL bytes, which are stripped again on decode
+        return 's' if '\0' not in x else None
+    if t in (list, tuple, dict):
+        if t is dict and not all(type(k) is str for k in x):
+            return None
+        inner = [_shape_of(v) for v in (x.values() if t is dict else x)]
+        if None in inner:
+            return None
+        return ['dict', list(x), inner] if t is dict else [t.__name__, inner]
+    return None
+
+
+def _leaves(x, out: list):
+    """Append the int and str leaves of a record to out, in template order."""
+    if type(x) in (int, str):
+        out.append(x)
+    else:
+        for v in (x.values() if type(x) is dict else x):
+            _leaves(v, out)
+    return out
+
+
+# narrowest struct code holding every value of an int field
+_INT_CODES = [('b', 1 << 7), ('h', 1 << 15), ('i', 1 << 31), ('q', 1 << 63)]
+
+
+def _encode_records(value) -> tuple[dict, bytes] | None:
+    shape = _shape_of(value[0])
+    if shape is None or shape in ('q', 's') or any(_shape_of(r) != shape for r in value):
+        return None
+
+    rows = [_leaves(r, []) for r in value]
+    codes = []
+    for k, leaf in enumerate(rows[0]):
+        if type(leaf) is str:
+            for row in rows:
+                row[k] = row[k].encode()
+            codes.append(f'{max(len(row[k]) for row in rows)}s')
+        else:
+            lo, hi = min(row[k] for row in rows), max(row[k] for row in rows)
+            codes.append(next(c for c, limit in _INT_CODES if -limit <= lo and hi < limit))
+    fmt = '<' + ''.join(codes)
+    packer = struct.Struct(fmt)
+    return {'shape': shape, 'format': fmt}, b''.join(packer.pack(*row) for row in rows)
+
+
+def _record_source(shape, fields) -> str:
+    """Python expression rebuilding a record from the unpacked tuple `f`."""
+    if shape == 'q':
+        return f'f[{next(fields)}]'
+    if shape == 's':
+        return f"f[{next(fields)}].rstrip(b'\\0').decode()"
+    if shape[0] == 'dict':
+        items = ', '.join(f'{key!r}: {_record_source(s, fields)}' for key, s in zip(shape[1], shape[2]))
+        return f'{{{items}}}'
+    if shape[0] not in _CONTAINERS:
+        raise ValueError(f'unknown record container {shape[0]!r}')
+    items = ', '.join(_record_source(s, fields) for s in shape[1])
+    return f'({items},)' if shape[0] == 'tuple' else f'[{items}]'
+
+
+def _record_builder(shape):
+    """Function rebuilding one record from its unpacked fields, compiled once per field."""
+    # keys only reach the source through repr, and containers are checked above
+    return eval(f'lambda f: {_record_source(shape, itertools.count())}')  # pylint: disable=eval-used
+
+
+_CONTAINERS = {'list': list, 'tuple': tuple}
+
+
+def _decode(kind: str, meta: dict, blobs: list[memoryview], buf):
+    if kind == 'grid':
+        return Grid.from_cells(blobs[0], meta['n_rows'], meta['n_cols'],
+                               border=meta['border'], pad=meta['pad'])
+
+    if kind == 'array':
+        values = array(meta['typecode'])
+        values.frombytes(blobs[0])
+        return values
+
+    if kind == 'ndarray':
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        # read-only view straight onto the mapped file
+        return np.frombuffer(buf, dtype=meta['dtype'], count=len(blobs[0]) // np.dtype(
+            meta['dtype']).itemsize, offset=meta['offset']).reshape(meta['shape'])
+
+    if kind == 'str':
+        return bytes(blobs[0]).decode()
+
+    if kind == 'pickle':
+        return pickle.loads(blobs[0])
+
+    container = _CONTAINERS[meta['container']]
+    if kind == 'ints':
+        return container(blobs[0].cast('q').tolist())
+
+    if kind == 'strs':
+        offsets = blobs[0].cast('Q').tolist()
+        text = bytes(blobs[1]).decode()
+        return container(text[a:b] for a, b in zip(offsets, offsets[1:]))
+
+    if kind == 'records':
+        return container(map(_record_builder(meta['shape']),
+                             struct.iter_unpack(meta['format'], blobs[0])))
+
+    row = _CONTAINERS[meta['row']]
+    if kind == 'int_records':
+        unpack = struct.Struct(meta['format']).iter_unpack(blobs[0])
+        return container(unpack if row is tuple else map(list, unpack))
+
+    if kind == 'int_rows':
+        offsets = blobs[0].cast('Q').tolist()
+        values = blobs[1].cast('q').tolist()
+        return container(row(values[a:b]) for a, b in zip(offsets, offsets[1:]))
+
+    raise ValueError(f'unknown cache field kind {kind!r}')
+
+
+def write(path: Path, puzzle_input: dict):
+    """Serialise parsed input atomically, replacing entries from older parsers."""
+    fields = []
+    payload = bytearray()
+    for name, value in puzzle_input.items():
+        kind, meta, blobs = _encode(value)
+        spans = []
+        for blob in blobs:
+            payload += b'\0' * (-len(payload) % 8)
+            spans.append([len(payload), len(blob)])
+            payload += blob
+        fields.append({'name': name, 'kind': kind, 'meta': meta, 'spans': spans})
+
+    header = json.dumps({'format': FORMAT_VERSION, 'fields': fields}).encode()
+    # payload offsets are relative to the 8 byte aligned end of the header
+    prefix = MAGIC + _HEADER_LEN.pack(len(header)) + header
+    prefix += b'\0' * (-len(prefix) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_bytes(prefix + payload)
+    os.replace(tmp, path)
+
+    digest = path.name.split('-')[0]
+    for stale in path.parent.glob(f'{digest}-*.bin'):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def read(path: Path) -> dict:
+    """Memory-map a cache file and rebuild the keyword arguments it holds."""
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buf[:4] != MAGIC:
+        buf.close()
+        raise ValueError(f'{path} is not a parsed input cache file')
+    (header_len,) = _HEADER_LEN.unpack_from(buf, 4)
+    start = 8 + header_len
+    header = json.loads(buf[8:start])
+    if header['format'] != FORMAT_VERSION:
+        buf.close()
+        raise ValueError(f'{path} has cache format {header["format"]}')
+    start += -start % 8
+
+    puzzle_input = {}
+    keep_open = False
+    view = memoryview(buf)
+    for field in header['fields']:
+        if any(start + offset + length > len(buf) for offset, length in field['spans']):
+            view.release()
+            buf.close()
+            raise ValueError(f'{path} is truncated')
+        blobs = [view[start + offset:start + offset + length] for offset, length in field['spans']]
+        meta = field['meta']
+        if field['kind'] == 'ndarray':
+            meta = dict(meta, offset=start + field['spans'][0][0])
+            keep_open = True
+        puzzle_input[field['name']] = _decode(field['kind'], meta, blobs, buf)
+        for blob in blobs:
+            blob.release()
+    view.release()
+
+    # numpy views keep the mapping alive; it is unmapped once they are collected
+    if not keep_open:
+        buf.close()
+    return puzzle_input
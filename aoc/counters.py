@@ -0,0 +1,147 @@
+"""
+Work counters for the search loops in the puzzles.
+
+A search asks for a probe once per call and reports what it does:
+
+    probe = counters.probe(__name__, 'part1')
+    ...
+    heapq.heappush(pq, item)
+    probe.push(len(pq))     # frontier size after the push
+    probe.pop()
+    probe.skip()            # popped an entry that was already settled
+    probe.expand(depth)     # expanded a node, depth for recursive searches
+
+Counting is off by default and `probe` then returns a shared probe whose
+methods do nothing. Set AOC_COUNTERS=1, or use `counting()` (aoc.bench
+--counters does), to record one Probe per call. `module_stats` sums them per
+function: calls, pushes, pops, stale skips and expansions, plus the largest
+frontier and depth reached by any single call. Expansions per call that grow
+with the input point at graph size; pushes or stale skips growing faster than
+expansions point at the algorithm.
+"""
+import contextlib
+import os
+
+
+ENV_COUNTERS = 'AOC_COUNTERS'
+FIELDS = ('pushes', 'pops', 'stale', 'expanded', 'max_frontier', 'max_depth')
+
+# 'module.function' -> Probe per recorded call
+REGISTRY = {}
+
+
+class Probe:
+    """Counts for one call of a search."""
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, 0)
+
+    def push(self, frontier: int = 0):
+        self.pushes += 1
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+
+    def pop(self):
+        self.pops += 1
+
+    def skip(self):
+        self.stale += 1
+
+    def expand(self, depth: int = 0):
+        self.expanded += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in FIELDS}
+
+
+class _NullProbe(Probe):
+    """Handed out while counting is off."""
+    __slots__ = ()
+
+    def push(self, frontier: int = 0):
+        pass
+
+    def pop(self):
+        pass
+
+    def skip(self):
+        pass
+
+    def expand(self, depth: int = 0):
+        pass
+
+    def __bool__(self):
+        return False
+
+
+NULL = _NullProbe()
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_COUNTERS, '').strip() not in ('', '0')
+
+
+def enable(on: bool = True):
+    """Turn counting on or off for this process and any workers it starts."""
+    if on:
+        os.environ[ENV_COUNTERS] = '1'
+    else:
+        os.environ.pop(ENV_COUNTERS, None)
+
+
+def probe(module: str, function: str) -> Probe:
+    """A fresh probe for one call of module.function, or the no-op probe."""
+    if not enabled():
+        return NULL
+    record = Probe()
+    REGISTRY.setdefault(f'{module}.{function}', []).append(record)
+    return record
+
+
+def summarize(records: list[Probe]) -> dict:
+    stats = {'calls': len(records)}
+    for field in FIELDS:
+        values = [getattr(r, field) for r in records]
+        stats[field] = max(values, default=0) if field.startswith('max_') else sum(values)
+    return stats
+
+
+def module_stats(module) -> dict[str, dict]:
+    """Summed counters of the functions in a module, by function name."""
+    prefix = f'{module.__name__}.'
+    return {name[len(prefix):]: summarize(records) for name, records in REGISTRY.items()
+            if name.startswith(prefix)}
+
+
+def stats() -> dict[str, dict]:
+    """Summed counters of every function recorded so far, by module.function."""
+    return {name: summarize(records) for name, records in REGISTRY.items()}
+
+
+def reset(module=None):
+    """Drop the records of one module, or of everything."""
+    if module is None:
+        REGISTRY.clear()
+        return
+    prefix = f'{module.__name__}.'
+    for name in [n for n in REGISTRY if n.startswith(prefix)]:
+        del REGISTRY[name]
+
+
+@contextlib.contextmanager
+def counting(module=None):
+    """Count within the block only, starting from no records for `module`."""
+    previous = os.environ.get(ENV_COUNTERS)
+    reset(module)
+    enable()
+    try:
+        yield
+    finally:
+        if previous is None:
+            enable(False)
+        else:
+            os.environ[ENV_COUNTERS] = previous
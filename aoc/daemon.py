@@ -0,0 +1,230 @@
+"""
+Long running solver that keeps puzzle modules imported and their memo tables
+warm between requests, served over a Unix socket.
+
+    python -m aoc.daemon serve &
+    python -m aoc.daemon solve 2024 11 --input ~/aoc-inputs/2024/day11/input.txt
+    python -m aoc.daemon solve 2024 21 --part part2 --input big.txt
+    python -m aoc.daemon stats
+    python -m aoc.daemon stop
+
+Requests and responses are single JSON lines. Every response carries
+`latency_seconds`, the time the daemon spent on the request, and the client
+also prints the round trip time it observed.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from aoc import cache, memo, profiling
+from aoc.puzzles import REPO_ROOT, discover
+from aoc.runner import run_puzzle
+
+
+ENV_SOCKET = 'AOC_DAEMON_SOCKET'
+
+
+def default_socket() -> Path:
+    return Path(os.environ.get(ENV_SOCKET) or
+                Path(tempfile.gettempdir()) / f'aoc-daemon-{os.getuid()}.sock')
+
+
+class SolverState:
+    """Puzzles loaded so far and request counters, shared by all connections."""
+
+    def __init__(self, input_root: Path | str = REPO_ROOT):
+        self.input_root = Path(input_root)
+        self.puzzles = {(p.year, p.day): p for p in discover()}
+        self.loaded = set()
+        self.started = time.time()
+        self.requests = 0
+
+    def solve(self, year: int, day: int, filename: str | None = None,
+              parts: list[str] | None = None) -> dict:
+        puzzle = self.puzzles.get((year, day))
+        if puzzle is None:
+            return {'status': 'error', 'error': f'no puzzle module for {year} day {day}'}
+
+        warm = puzzle in self.loaded
+        s = time.perf_counter()
+        puzzle.load()
+        import_seconds = time.perf_counter() - s
+        self.loaded.add(puzzle)
+
+        result = run_puzzle(puzzle, self.input_root, filename=filename, parts=parts)
+        result.update({'warm': warm, 'import_seconds': import_seconds,
+                       'memo': memo.module_stats(puzzle.load())})
+        return result
+
+    def stats(self) -> dict:
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': time.time() - self.started,
+            'requests': self.requests,
+            'loaded': sorted(p.name for p in self.loaded),
+            'memo': {p.name: memo.module_stats(p.load()) for p in sorted(self.loaded)},
+        }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            s = time.perf_counter()
+            try:
+                request = json.loads(line)
+                response = self.server.dispatch(request)
+            except Exception as exc:  # pylint: disable=broad-except
+                response = {'status': 'error', 'error': repr(exc)}
+            response['latency_seconds'] = time.perf_counter() - s
+            self.wfile.write(json.dumps(response, default=str).encode() + b'\n')
+            self.wfile.flush()
+            if response.get('stopping'):
+                break
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """
+    Handles one connection at a time: part functions share module level memo
+    tables and are not written to be re-entrant.
+    """
+
+    def __init__(self, path: Path | str, state: SolverState):
+        self.state = state
+        super().__init__(str(path), _Handler)
+
+    def dispatch(self, request: dict) -> dict:
+        op = request.get('op')
+        self.state.requests += 1
+        if op == 'ping':
+            return {'status': 'ok'}
+        if op == 'solve':
+            return self.state.solve(int(request['year']), int(request['day']),
+                                    request.get('input'), request.get('parts'))
+        if op == 'stats':
+            return dict(self.state.stats(), status='ok')
+        if op == 'stop':
+            # shutdown() blocks until serve_forever returns, so ask from another thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'status': 'ok', 'stopping': True}
+        return {'status': 'error', 'error': f'unknown op {op!r}'}
+
+
+def _claim_socket(path: Path):
+    """Remove a socket left behind by a dead daemon, refuse if one is alive."""
+    if not path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            path.unlink(missing_ok=True)
+            return
+    raise RuntimeError(f'a daemon is already listening on {path}')
+
+
+def serve(path: Path | str | None = None, input_root: Path | str = REPO_ROOT,
+          preload: bool = False):
+    """Run the daemon until a stop request arrives."""
+    path = Path(path or default_socket())
+    _claim_socket(path)
+    state = SolverState(input_root)
+    if preload:
+        for puzzle in state.puzzles.values():
+            try:
+                puzzle.load()
+                state.loaded.add(puzzle)
+            except ImportError as exc:
+                print(f'{puzzle.name}: {exc}', file=sys.stderr)
+
+    with SolverServer(path, state) as server:
+        print(f'aoc daemon {os.getpid()} listening on {path}', file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(payload: dict, path: Path | str | None = None, timeout: float | None = None) -> dict:
+    """Send one request to a running daemon and wait for its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path or default_socket()))
+        with sock.makefile('rwb') as stream:
+            stream.write(json.dumps(payload).encode() + b'\n')
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def _print_solve(response: dict, round_trip: float):
+    if response.get('status') != 'ok':
+        print(f"{response.get('puzzle', '')} {response.get('status')}: "
+              f"{response.get('error', '').strip()}")
+    for name, part in response.get('parts', {}).items():
+        print(f"{response['puzzle']:<12} {name:<16} {part['seconds']:>9.3f}s  {part['answer']}")
+    if 'parse_seconds' in response:
+        print(f"{'warm' if response['warm'] else 'cold'} module, "
+              f"import {response['import_seconds']:.4f}s, parse {response['parse_seconds'] or 0:.4f}s")
+    print(f"latency {response['latency_seconds']:.4f}s in daemon, {round_trip:.4f}s round trip")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--socket', type=Path, help=f'socket path (default ${ENV_SOCKET} or tmp)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_cmd = commands.add_parser('serve', help='run the daemon in the foreground')
+    serve_cmd.add_argument('--input-root', default=REPO_ROOT, type=Path)
+    serve_cmd.add_argument('--preload', action='store_true', help='import every puzzle up front')
+    serve_cmd.add_argument('--no-cache', action='store_true', help='always re-parse inputs')
+    serve_cmd.add_argument('--profile', choices=profiling.MODES)
+
+    solve_cmd = commands.add_parser('solve', help='solve one day on the daemon')
+    solve_cmd.add_argument('year', type=int)
+    solve_cmd.add_argument('day', type=int)
+    solve_cmd.add_argument('--input', type=Path, help='input file (default: under the input root)')
+    solve_cmd.add_argument('--part', action='append', help='part function to run (repeatable)')
+    solve_cmd.add_argument('--json', action='store_true', help='print the raw response')
+
+    for name in ('ping', 'stats', 'stop'):
+        commands.add_parser(name)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        cache.configure(not args.no_cache)
+        if args.profile:
+            profiling.enable(args.profile)
+        serve(args.socket, args.input_root, args.preload)
+        return 0
+
+    payload = {'op': args.command}
+    if args.command == 'solve':
+        payload.update({'year': args.year, 'day': args.day, 'parts': args.part,
+                        'input': str(args.input.resolve()) if args.input else None})
+
+    s = time.perf_counter()
+    try:
+        response = request(payload, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f'no daemon listening on {args.socket or default_socket()}', file=sys.stderr)
+        return 2
+    round_trip = time.perf_counter() - s
+
+    if args.command == 'solve' and not args.json:
+        _print_solve(response, round_trip)
+    else:
+        print(json.dumps(response, indent=2, default=str))
+
+    return int(response.get('status') != 'ok')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
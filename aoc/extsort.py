@@ -0,0 +1,136 @@
+"""
+Sorting streams of int64 values that do not fit in memory.
+
+    with ExternalSorter('64M') as sorter:
+        for value in values:
+            sorter.add(value)
+        for value in sorter.merged():
+            ...
+
+Values collect in a typed array until the budget is reached, and are then
+sorted and written to a temporary file as a run. `merged` k-way merges the
+runs with heapq.merge, reading each one back in blocks sized so the blocks
+together stay within the budget. At most `fanin` runs (MERGE_FANIN) are merged
+at once: with more, intermediate passes first merge groups of them into longer
+runs on disk, so the number of open files and the block size stay bounded
+however large the input. Every call to `merged` opens its own cursor over the
+runs, so one sorted column can be walked at two different paces.
+
+The budget defaults to AOC_SORT_BUDGET (K/M/G suffixes, default 64M).
+"""
+import heapq
+import os
+from array import array
+from pathlib import Path
+
+from aoc.memo import parse_bytes
+
+
+ENV_BUDGET = 'AOC_SORT_BUDGET'
+DEFAULT_BUDGET = '64M'
+# bytes per value while a run is being sorted: the array slot, plus the list
+# slot and int object that sorted() creates
+ITEM_COST = 48
+ITEM_SIZE = array('q').itemsize
+# most runs merged at once, and so most files one cursor holds open
+MERGE_FANIN = 64
+
+
+def resolve_budget(budget: int | str | None = None) -> int:
+    """Budget in bytes from an int, a '64M' style string, or AOC_SORT_BUDGET."""
+    if isinstance(budget, str):
+        budget = parse_bytes(budget)
+    return budget or parse_bytes(os.environ.get(ENV_BUDGET) or DEFAULT_BUDGET)
+
+
+def _read_run(path: Path, block: int):
+    # unbuffered: the blocks are the buffer, and a file buffer per run would not fit the budget
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            values = array('q')
+            try:
+                values.fromfile(f, block)
+            except EOFError:
+                # the values that were there have still been read
+                yield from values
+                return
+            yield from values
+
+
+class ExternalSorter:
+    """Sorts int64 values within a memory budget by spilling sorted runs to disk."""
+
+    def __init__(self, budget: int | str | None = None, tmpdir: Path | str | None = None,
+                 fanin: int | None = None):
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        self.budget = resolve_budget(budget)
+        self.run_items = max(1, self.budget // ITEM_COST)
+        self.fanin = max(2, fanin or MERGE_FANIN)
+        self._dir = tempfile.TemporaryDirectory(prefix='aoc-runs-', dir=tmpdir)
+        self._values = array('q')
+        self._n_files = 0
+        self.runs = []
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._dir.cleanup()
+
+    def add(self, value: int):
+        self._values.append(value)
+        self.count += 1
+        if len(self._values) >= self.run_items:
+            self._spill()
+
+    def _spill(self):
+        if not self._values:
+            return
+        run = array('q', sorted(self._values))
+        self._values = array('q')
+        path = self._new_path()
+        with open(path, 'wb') as f:
+            run.tofile(f)
+        self.runs.append(path)
+
+    def _new_path(self) -> Path:
+        self._n_files += 1
+        return Path(self._dir.name) / f'run{self._n_files:05d}.bin'
+
+    def _merge_runs(self, runs: list[Path], budget: int) -> Path:
+        """Merge runs into one run on disk, the readers and the write buffer sharing the budget."""
+        block = max(1, budget // ITEM_SIZE // (len(runs) + 1))
+        path = self._new_path()
+        out = array('q')
+        with open(path, 'wb') as f:
+            for value in heapq.merge(*(_read_run(run, block) for run in runs)):
+                out.append(value)
+                if len(out) >= block:
+                    out.tofile(f)
+                    del out[:]
+            out.tofile(f)
+        for run in runs:
+            # a cursor from an earlier merged() call keeps reading an unlinked run
+            run.unlink()
+        return path
+
+    def _compact(self, budget: int):
+        """Intermediate merge passes until at most `fanin` runs are left."""
+        while len(self.runs) > self.fanin:
+            runs, self.runs = self.runs, []
+            for k in range(0, len(runs), self.fanin):
+                group = runs[k:k + self.fanin]
+                self.runs.append(group[0] if len(group) == 1 else self._merge_runs(group, budget))
+
+    def merged(self, budget: int | None = None):
+        """Iterate all values added so far in ascending order, buffering within `budget` bytes."""
+        budget = budget or self.budget
+        self._spill()
+        self._compact(budget)
+        block = max(1, budget // ITEM_SIZE // max(1, len(self.runs)))
+        return heapq.merge(*(_read_run(path, block) for path in self.runs))
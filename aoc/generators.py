@@ -0,0 +1,601 @@
+"""
+Deterministic synthetic inputs for stress testing each day at larger sizes.
+
+`scale` multiplies the size of a typical shipped input: the record count for
+line oriented days and the cell count (not side length) for grid days. Output
+is laid out as <out>/YYYY/dayNN/input.txt so it can be fed straight to
+`aoc.runner --input-root` or `aoc.bench --input-root`.
+
+    python -m aoc.generators --out /tmp/aoc-x10 --scale 10 --seed 7
+"""
+import argparse
+import math
+import random
+import string
+from collections import deque
+from pathlib import Path
+
+
+GENERATORS = {}
+
+# 2024 day 13 part 2 moves every prize this far along both axes
+PRIZE_OFFSET = 10 ** 13
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+
+def generator(year: int, day: int):
+    """Register an input generator for a given puzzle."""
+    def register(fn):
+        GENERATORS[(year, day)] = fn
+        return fn
+    return register
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+def _side(base: int, scale: float) -> int:
+    return max(5, int(base * math.sqrt(scale)))
+
+
+def _odd(n: int) -> int:
+    return n if n % 2 else n + 1
+
+
+def _render(grid: list[list[str]]) -> str:
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+@generator(2023, 1)
+def calibration_document(rng: random.Random, scale: float = 1) -> str:
+    """Lines of letters, digit words and digits with at least one real digit."""
+    lines = []
+    for _ in range(_count(1000, scale)):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            choice = rng.random()
+            if choice < 0.35:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            elif choice < 0.6:
+                tokens.append(str(rng.randint(1, 9)))
+            else:
+                tokens.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append(''.join(tokens))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 2)
+def cube_games(rng: random.Random, scale: float = 1) -> str:
+    """Games of 1-6 draws of up to 20 cubes per colour."""
+    lines = []
+    for game_id in range(1, _count(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            draws.append(', '.join(f'{rng.randint(1, 20)} {c}' for c in colors))
+        lines.append(f'Game {game_id}: ' + '; '.join(draws))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2023, 3)
+def engine_schematic(rng: random.Random, scale: float = 1) -> str:
+    """Grid of dots, 1-3 digit numbers and symbols, heavy on gears."""
+    side = _side(140, scale)
+    grid = [['.'] * side for _ in range(side)]
+    for row in grid:
+        j = 0
+        while j < side:
+            roll = rng.random()
+            if roll < 0.12 and j + 3 < side:
+                digits = str(rng.randint(1, 999))
+                row[j:j + len(digits)] = digits
+                j += len(digits) + 1
+            elif roll < 0.17:
+                row[j] = rng.choice('*****#+$/=%@&-')
+                j += 2
+            else:
+                j += 1
+    return _render(grid)
+
+
+@generator(2023, 4)
+def scratch_cards(rng: random.Random, scale: float = 1) -> str:
+    """
+    Cards with 10 winners and 25 entries. Match counts average below one so the
+    part2 card total stays bounded as the card count grows.
+    """
+    lines = []
+    n_cards = _count(200, scale)
+    for card_id in range(1, n_cards + 1):
+        n_matches = min(rng.choice([0, 0, 0, 0, 0, 0, 1, 1, 2, 4]), 10, n_cards - card_id)
+        numbers = rng.sample(range(1, 100), 35 - n_matches)
+        winners = numbers[:10]
+        entries = winners[:n_matches] + numbers[10:]
+        rng.shuffle(entries)
+        lines.append(f'Card {card_id:>3}: ' + ' '.join(f'{n:>2}' for n in winners) + ' | '
+                     + ' '.join(f'{n:>2}' for n in entries))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 1)
+def location_lists(rng: random.Random, scale: float = 1) -> str:
+    """Two columns of five digit location ids with plenty of repeats."""
+    pool = [rng.randint(10000, 99999) for _ in range(_count(600, scale))]
+    lines = [f'{rng.choice(pool)}   {rng.choice(pool)}' for _ in range(_count(1000, scale))]
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 2)
+def level_reports(rng: random.Random, scale: float = 1) -> str:
+    """Mostly monotonic reports of 5-8 levels, some with one bad level."""
+    lines = []
+    for _ in range(_count(1000, scale)):
+        step = rng.choice([-1, 1])
+        level = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            level.append(level[-1] + step * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            level[rng.randrange(len(level))] += rng.randint(-4, 4)
+        lines.append(' '.join(str(max(1, l)) for l in level))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 3)
+def corrupted_memory(rng: random.Random, scale: float = 1) -> str:
+    """Noise interleaved with mul(), do() and don't() instructions."""
+    noise = string.ascii_letters + string.punctuation.replace('(', '').replace(')', '') + ' '
+    lines = []
+    for _ in range(_count(6, scale)):
+        chunks = []
+        for _ in range(400):
+            roll = rng.random()
+            if roll < 0.6:
+                chunks.append(f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})')
+            elif roll < 0.7:
+                chunks.append(rng.choice(['do()', "don't()"]))
+            else:
+                chunks.append(f'mul({rng.randint(1, 999)}, {rng.randint(1, 999)}]')
+            chunks.append(''.join(rng.choices(noise, k=rng.randint(0, 6))))
+        lines.append(''.join(chunks))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 4)
+def word_search(rng: random.Random, scale: float = 1) -> str:
+    """Square grid over the letters of XMAS."""
+    side = _side(140, scale)
+    return _render([rng.choices('XMAS', k=side) for _ in range(side)])
+
+
+@generator(2024, 5)
+def print_queue(rng: random.Random, scale: float = 1) -> str:
+    """Total ordering rules over 49 pages and odd length updates."""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f'{a}|{b}' for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(_count(200, scale)):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(str(p) for p in update))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(updates) + '\n'
+
+
+def _guard_exits(grid: list[list[str]], i: int, j: int) -> bool:
+    """Simulate the guard from (i, j) facing up; False if it loops."""
+    n_rows, n_cols = len(grid), len(grid[0])
+    di, dj = -1, 0
+    seen = set()
+    while True:
+        if (i, j, di, dj) in seen:
+            return False
+        seen.add((i, j, di, dj))
+        ni, nj = i + di, j + dj
+        if not (0 <= ni < n_rows and 0 <= nj < n_cols):
+            return True
+        if grid[ni][nj] == '#':
+            di, dj = dj, -di
+        else:
+            i, j = ni, nj
+
+
+@generator(2024, 6)
+def guard_map(rng: random.Random, scale: float = 1) -> str:
+    """Lab map with sparse obstacles on which the guard patrols off the edge."""
+    side = _side(130, scale)
+    while True:
+        grid = [['#' if rng.random() < 0.03 else '.' for _ in range(side)] for _ in range(side)]
+        i, j = rng.randrange(side // 4, 3 * side // 4), rng.randrange(side // 4, 3 * side // 4)
+        grid[i][j] = '^'
+        if _guard_exits(grid, i, j):
+            return _render(grid)
+
+
+@generator(2024, 7)
+def calibration_equations(rng: random.Random, scale: float = 1) -> str:
+    """
+    Equations built from random +, * and || operators, some perturbed. Small
+    operand lists make many results repeat, which day07 must count per line.
+    """
+    lines = []
+    for _ in range(_count(850, scale)):
+        operands = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+        result = operands[0]
+        for n in operands[1:]:
+            op = rng.choice('+*|')
+            result = result + n if op == '+' else result * n if op == '*' else int(f'{result}{n}')
+        if rng.random() < 0.4:
+            result += rng.randint(1, 9)
+        lines.append(f'{result}: ' + ' '.join(str(n) for n in operands))
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 8)
+def antenna_map(rng: random.Random, scale: float = 1) -> str:
+    """
+    Map with four antennas per frequency. Antennas sharing a frequency never
+    share a row or column, which day08 cannot handle.
+    """
+    side = _side(50, scale)
+    grid = [['.'] * side for _ in range(side)]
+    n_antennas = max(4, side * side // 50)
+    frequencies = (string.ascii_letters + string.digits)[:max(1, n_antennas // 4)]
+    for freq in frequencies:
+        rows, cols = rng.sample(range(side), 4), rng.sample(range(side), 4)
+        for i, j in zip(rows, cols):
+            if grid[i][j] == '.':
+                grid[i][j] = freq
+    return _render(grid)
+
+
+@generator(2024, 9)
+def disk_map(rng: random.Random, scale: float = 1) -> str:
+    """Alternating file and free-space lengths, ending on a file."""
+    n_digits = _odd(_count(19999, scale))
+    return ''.join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+                   for i in range(n_digits)) + '\n'
+
+
+@generator(2024, 10)
+def topographic_map(rng: random.Random, scale: float = 1) -> str:
+    """Height map built from smooth random walks so trails actually exist."""
+    side = _side(50, scale)
+    grid = [[0] * side for _ in range(side)]
+    for i in range(side):
+        for j in range(side):
+            neighbours = [grid[i - 1][j]] if i else []
+            neighbours += [grid[i][j - 1]] if j else []
+            base = rng.choice(neighbours) if neighbours else rng.randint(0, 9)
+            grid[i][j] = (base + rng.choice([-1, 1, 1, 0])) % 10
+    return '\n'.join(''.join(str(c) for c in row) for row in grid) + '\n'
+
+
+@generator(2024, 11)
+def stone_line(rng: random.Random, scale: float = 1) -> str:
+    """Space separated engraved stones."""
+    return ' '.join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(_count(8, scale))) + '\n'
+
+
+@generator(2024, 12)
+def garden_plots(rng: random.Random, scale: float = 1) -> str:
+    """Plots that mostly copy a neighbour, forming irregular regions."""
+    side = _side(140, scale)
+    grid = [[''] * side for _ in range(side)]
+    for i in range(side):
+        for j in range(side):
+            neighbours = [grid[i - 1][j]] if i else []
+            neighbours += [grid[i][j - 1]] if j else []
+            if neighbours and rng.random() < 0.85:
+                grid[i][j] = rng.choice(neighbours)
+            else:
+                grid[i][j] = rng.choice(string.ascii_uppercase)
+    return _render(grid)
+
+
+@generator(2024, 13)
+def claw_machines(rng: random.Random, scale: float = 1) -> str:
+    """
+    Claw machines: about half reachable with a few presses, a quarter only once
+    the prize moves out by PRIZE_OFFSET, the rest unreachable. One button moves
+    further in X and the other further in Y, so the diagonal the prizes move
+    along lies between them and press counts are never negative.
+    """
+    blocks = []
+    for _ in range(_count(320, scale)):
+        kind = rng.random()
+        while True:
+            low, other_low = rng.randint(10, 98), rng.randint(10, 98)
+            a = (rng.randint(low + 1, 99), low)
+            b = (other_low, rng.randint(other_low + 1, 99))
+            if rng.random() < 0.5:
+                a, b = b, a
+            det = a[0] * b[1] - a[1] * b[0]
+            # if the offset itself took whole presses, a far prize would be
+            # reachable close by too, with a negative count
+            if kind >= 0.25 or PRIZE_OFFSET * (b[1] - b[0]) % det or \
+                    PRIZE_OFFSET * (a[0] - a[1]) % det:
+                break
+        if kind < 0.25:
+            # the nearest whole press counts to a far prize
+            target = (PRIZE_OFFSET + rng.randint(1000, 20000), PRIZE_OFFSET + rng.randint(1000, 20000))
+            n_a = round((target[0] * b[1] - target[1] * b[0]) / det)
+            n_b = round((a[0] * target[1] - a[1] * target[0]) / det)
+            prize = (n_a * a[0] + n_b * b[0] - PRIZE_OFFSET, n_a * a[1] + n_b * b[1] - PRIZE_OFFSET)
+        else:
+            n_a, n_b = rng.randint(1, 100), rng.randint(1, 100)
+            prize = (n_a * a[0] + n_b * b[0], n_a * a[1] + n_b * b[1])
+            if kind < 0.5:
+                prize = (prize[0] + rng.randint(1, 50), prize[1])
+        blocks.append(f'Button A: X+{a[0]}, Y+{a[1]}\nButton B: X+{b[0]}, Y+{b[1]}\n'
+                      f'Prize: X={prize[0]}, Y={prize[1]}')
+    return '\n\n'.join(blocks) + '\n'
+
+
+@generator(2024, 14)
+def robot_list(rng: random.Random, scale: float = 1) -> str:
+    """Robots on the fixed 101x103 floor."""
+    lines = [f'p={rng.randrange(101)},{rng.randrange(103)} '
+             f'v={rng.randint(-99, 99)},{rng.randint(-99, 99)}'
+             for _ in range(_count(500, scale))]
+    return '\n'.join(lines) + '\n'
+
+
+@generator(2024, 15)
+def warehouse(rng: random.Random, scale: float = 1) -> str:
+    """Walled warehouse with boxes, the robot and its move list."""
+    side = _side(50, scale)
+    grid = [['#'] * side] + [
+        ['#'] + [rng.choices('.O#', weights=[6, 3, 1])[0] for _ in range(side - 2)] + ['#']
+        for _ in range(side - 2)
+    ] + [['#'] * side]
+    grid[side // 2][side // 2] = '@'
+    n_moves = _count(20000, scale)
+    moves = ''.join(rng.choices('<>^v', k=n_moves))
+    move_lines = '\n'.join(moves[i:i + 1000] for i in range(0, n_moves, 1000))
+    return _render(grid) + '\n' + move_lines + '\n'
+
+
+def _carve_maze(rng: random.Random, side: int, loop_chance: float) -> list[list[str]]:
+    """Carve a maze over odd cells with iterative DFS, then knock out extra walls."""
+    side = _odd(side)
+    grid = [['#'] * side for _ in range(side)]
+    stack = [(side - 2, 1)]
+    grid[side - 2][1] = '.'
+    while stack:
+        i, j = stack[-1]
+        options = [(i + di, j + dj, di // 2, dj // 2) for di, dj in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < i + di < side - 1 and 0 < j + dj < side - 1 and grid[i + di][j + dj] == '#']
+        if not options:
+            stack.pop()
+            continue
+        ni, nj, wi, wj = rng.choice(options)
+        grid[i + wi][j + wj] = '.'
+        grid[ni][nj] = '.'
+        stack.append((ni, nj))
+    for i in range(1, side - 1):
+        for j in range(1, side - 1):
+            if grid[i][j] == '#' and (i + j) % 2 and rng.random() < loop_chance:
+                grid[i][j] = '.'
+    return grid
+
+
+@generator(2024, 16)
+def reindeer_maze(rng: random.Random, scale: float = 1) -> str:
+    """Maze with S bottom left and E top right, with some loops."""
+    grid = _carve_maze(rng, _side(141, scale), 0.05)
+    grid[len(grid) - 2][1] = 'S'
+    grid[1][len(grid) - 2] = 'E'
+    return _render(grid)
+
+
+@generator(2024, 17)
+def three_bit_program(rng: random.Random, scale: float = 1) -> str:
+    """
+    A program with the usual shape (shift A by 3 each loop and output a
+    function of its low bits), so part2 can search for the quine.
+    """
+    x, y = rng.randrange(8), rng.randrange(8)
+    program = [2, 4, 1, x, 7, 5, 1, y, 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+    register_a = rng.getrandbits(max(3, int(48 * scale)))
+    return (f'Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\n'
+            f'Program: {",".join(str(p) for p in program)}\n')
+
+
+@generator(2024, 18)
+def falling_bytes(rng: random.Random, scale: float = 1) -> str:
+    """
+    Every cell of the fixed 71x71 memory space in random order, with the first
+    1024 leaving a path open. The grid size is a module constant in day18 so
+    `scale` is ignored.
+    """
+    size = 71
+    cells = [(x, y) for x in range(size) for y in range(size) if (x, y) not in ((0, 0), (70, 70))]
+    while True:
+        rng.shuffle(cells)
+        blocked = set(cells[:1024])
+        seen, frontier = {(0, 0)}, deque([(0, 0)])
+        while frontier:
+            x, y = frontier.popleft()
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < size and 0 <= ny < size and (nx, ny) not in blocked | seen:
+                    seen.add((nx, ny))
+                    frontier.append((nx, ny))
+        if (70, 70) in seen:
+            return '\n'.join(f'{x},{y}' for x, y in cells) + '\n'
+
+
+@generator(2024, 19)
+def towel_patterns(rng: random.Random, scale: float = 1) -> str:
+    """
+    Towels over wubrg (without a single w towel) and designs, most assembled
+    from towels and the rest random so some cannot be made.
+    """
+    towels = sorted({''.join(rng.choices('wubrg', k=rng.randint(1, 8))) for _ in range(450)} - {'w'})
+    designs = []
+    for _ in range(_count(400, scale)):
+        if rng.random() < 0.3:
+            designs.append(''.join(rng.choices('wubrg', k=rng.randint(20, 60))))
+        else:
+            designs.append(''.join(rng.choice(towels) for _ in range(rng.randint(3, 10))))
+    return ', '.join(towels) + '\n\n' + '\n'.join(designs) + '\n'
+
+
+@generator(2024, 20)
+def racetrack(rng: random.Random, scale: float = 1) -> str:
+    """
+    A single branchless track that snakes down the grid: one horizontal run
+    per odd row, joined through the wall row below at the run's end.
+    """
+    side = _odd(_side(141, scale))
+    grid = [['#'] * side for _ in range(side)]
+    col = rng.randrange(1, side - 1, 2)
+    start = (1, col)
+    end = start
+    for row in range(1, side - 1, 2):
+        target = col
+        while target == col:
+            target = rng.randrange(1, side - 1, 2)
+        step = 1 if target > col else -1
+        for j in range(col, target + step, step):
+            grid[row][j] = '.'
+        end = (row, target)
+        if row + 2 < side - 1:
+            grid[row + 1][target] = '.'
+        col = target
+    grid[start[0]][start[1]] = 'S'
+    grid[end[0]][end[1]] = 'E'
+    return _render(grid)
+
+
+@generator(2024, 21)
+def door_codes(rng: random.Random, scale: float = 1) -> str:
+    """Three digit codes followed by A."""
+    return '\n'.join(f'{rng.randint(1, 999):03d}A' for _ in range(_count(5, scale))) + '\n'
+
+
+@generator(2024, 22)
+def buyer_seeds(rng: random.Random, scale: float = 1) -> str:
+    """24 bit initial secrets, one per buyer."""
+    return '\n'.join(str(rng.randrange(1, 1 << 24)) for _ in range(_count(2000, scale))) + '\n'
+
+
+@generator(2024, 23)
+def lan_links(rng: random.Random, scale: float = 1) -> str:
+    """Sparse random network with one planted 13-clique."""
+    n_nodes = _count(520, scale)
+    width = 2 if n_nodes <= 26 * 26 else 3
+    names = set()
+    while len(names) < n_nodes:
+        names.add(''.join(rng.choices(string.ascii_lowercase, k=width)))
+    names = sorted(names)
+    links = set()
+    for name in names:
+        for other in rng.sample(names, 6):
+            if other != name:
+                links.add(tuple(sorted((name, other))))
+    clique = rng.sample(names, 13)
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            links.add(tuple(sorted((a, b))))
+    links = [f'{a}-{b}' for a, b in links]
+    rng.shuffle(links)
+    return '\n'.join(links) + '\n'
+
+
+@generator(2024, 24)
+def adder_netlist(rng: random.Random, scale: float = 1) -> str:
+    """
+    A correct ripple carry adder of 45 * scale bits with shuffled gates and
+    random wire names. day24.part2 assumes 45 bits, so only scale 1 is
+    meaningful there; larger scales stress part1 with deeper netlists.
+    """
+    n_bits = _count(45, scale)
+    used = set()
+
+    def wire():
+        while True:
+            name = ''.join(rng.choices(string.ascii_lowercase, k=3))
+            if name not in used and name[0] not in 'xyz':
+                used.add(name)
+                return name
+
+    def bit(prefix, i):
+        return f'{prefix}{str(i).zfill(2)}'
+
+    gates = [(bit('x', 0), 'XOR', bit('y', 0), bit('z', 0))]
+    carry = wire()
+    gates.append((bit('x', 0), 'AND', bit('y', 0), carry))
+    for i in range(1, n_bits):
+        half, both, through = wire(), wire(), wire()
+        out_carry = bit('z', n_bits) if i == n_bits - 1 else wire()
+        gates += [
+            (bit('x', i), 'XOR', bit('y', i), half),
+            (half, 'XOR', carry, bit('z', i)),
+            (bit('x', i), 'AND', bit('y', i), both),
+            (half, 'AND', carry, through),
+            (both, 'OR', through, out_carry),
+        ]
+        carry = out_carry
+    rng.shuffle(gates)
+
+    wires = [f'{bit(p, i)}: {rng.randint(0, 1)}' for p in 'xy' for i in range(n_bits)]
+    lines = [f'{a} {op} {b} -> {out}' if rng.random() < 0.5 else f'{b} {op} {a} -> {out}'
+             for a, op, b, out in gates]
+    return '\n'.join(wires) + '\n\n' + '\n'.join(lines) + '\n'
+
+
+@generator(2024, 25)
+def lock_and_key_schematics(rng: random.Random, scale: float = 1) -> str:
+    """5x7 lock and key schematics with random pin heights."""
+    schematics = []
+    for _ in range(_count(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for r in range(7):
+            if is_lock:
+                rows.append(''.join('#' if r <= h else '.' for h in heights))
+            else:
+                rows.append(''.join('#' if 6 - r <= h else '.' for h in heights))
+        schematics.append('\n'.join(rows))
+    return '\n\n'.join(schematics) + '\n'
+
+
+def generate(year: int, day: int, scale: float = 1, seed: int = 0) -> str:
+    """Generate the input text for one puzzle."""
+    return GENERATORS[(year, day)](random.Random(f'{year}-{day}-{seed}'), scale)
+
+
+def write_inputs(out: Path | str, scale: float = 1, seed: int = 0,
+                 puzzles: list[tuple[int, int]] | None = None) -> list[Path]:
+    """Write generated inputs under out/YYYY/dayNN/input.txt."""
+    written = []
+    for year, day in puzzles or sorted(GENERATORS):
+        path = Path(out) / str(year) / f'day{day:02d}' / 'input.txt'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate(year, day, scale, seed))
+        written.append(path)
+    return written
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--out', type=Path, required=True)
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--year', type=int, action='append')
+    parser.add_argument('--day', type=int, action='append')
+    args = parser.parse_args(argv)
+
+    selected = [(y, d) for y, d in sorted(GENERATORS)
+                if (not args.year or y in args.year) and (not args.day or d in args.day)]
+    for path in write_inputs(args.out, args.scale, args.seed, selected):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Compact character grid shared by the map based puzzles.
+
+Cells live in a single bytearray, row-major, surrounded by `pad` cells of
+`border` on every side. Neighbours of any real cell are therefore always valid
+indices, so inner loops can step by a precomputed offset without bounds
+checks:
+
+    grid = Grid(lines, border='#')
+    start = grid.find_index('S')
+    for offset in grid.orthogonal:
+        if grid.cells[start + offset] != WALL:
+            ...
+
+Cell values are compared as ints (`ord('#')`) against `grid.cells`.
+"""
+from collections.abc import Iterable, Iterator
+
+
+class Grid:
+    """Padded, flat bytearray backed character grid."""
+
+    __slots__ = ('n_rows', 'n_cols', 'pad', 'stride', 'border', 'cells',
+                 'up', 'down', 'left', 'right', 'orthogonal', 'diagonal', 'surrounding')
+
+    def __init__(self, rows: Iterable, border: str = ' ', pad: int = 1):
+        rows = [r.rstrip('\n') if isinstance(r, str) else ''.join(r) for r in rows]
+        rows = [r for r in rows if r]
+        widths = sorted({len(r) for r in rows})
+        if len(widths) > 1:
+            raise ValueError(f'rows of widths {widths} do not make a grid')
+        self.n_rows = len(rows)
+        self.n_cols = len(rows[0]) if rows else 0
+        self.pad = pad
+        self.stride = self.n_cols + 2 * pad
+        self.border = border
+        fill = border.encode()
+
+        cells = bytearray(fill * (self.stride * pad))
+        side = fill * pad
+        for row in rows:
+            cells += side + row.encode() + side
+        cells += fill * (self.stride * pad)
+        self.cells = cells
+        self._set_offsets()
+
+    def _set_offsets(self):
+        self.up, self.down, self.left, self.right = -self.stride, self.stride, -1, 1
+        # clockwise from up, so turning right is (d + 1) % 4
+        self.orthogonal = (self.up, self.right, self.down, self.left)
+        self.diagonal = (self.up + self.left, self.up + self.right,
+                         self.down + self.right, self.down + self.left)
+        self.surrounding = self.orthogonal + self.diagonal
+
+    @classmethod
+    def blank(cls, n_rows: int, n_cols: int, fill: str = '.', border: str = ' ',
+              pad: int = 1) -> 'Grid':
+        """Grid of a single repeated character."""
+        return cls([fill * n_cols] * n_rows, border=border, pad=pad)
+
+    @classmethod
+    def from_cells(cls, cells, n_rows: int, n_cols: int, border: str = ' ',
+                   pad: int = 1) -> 'Grid':
+        """Rebuild a grid from its padded cell buffer, as stored by aoc.cache."""
+        grid = cls([], border=border, pad=pad)
+        grid.n_rows, grid.n_cols = n_rows, n_cols
+        grid.stride = n_cols + 2 * pad
+        grid.cells = bytearray(cells)
+        if len(grid.cells) != (n_rows + 2 * pad) * grid.stride:
+            raise ValueError(f'{len(grid.cells)} cells do not fit a {n_rows}x{n_cols} grid')
+        grid._set_offsets()
+        return grid
+
+    def index(self, i: int, j: int) -> int:
+        """Flat index of row i, column j."""
+        return (i + self.pad) * self.stride + j + self.pad
+
+    def coords(self, idx: int) -> tuple[int, int]:
+        """Row and column of a flat index."""
+        i, j = divmod(idx, self.stride)
+        return i - self.pad, j - self.pad
+
+    def in_bounds(self, idx: int) -> bool:
+        """True when the flat index is a real (unpadded) cell."""
+        i, j = self.coords(idx)
+        return 0 <= i < self.n_rows and 0 <= j < self.n_cols
+
+    def __getitem__(self, key: tuple[int, int]) -> str:
+        return chr(self.cells[self.index(*key)])
+
+    def __setitem__(self, key: tuple[int, int], value: str):
+        self.cells[self.index(*key)] = ord(value)
+
+    def indices(self, char: str) -> Iterator[int]:
+        """Yield flat indices of every real cell holding `char`, row by row."""
+        target = ord(char)
+        find = self.cells.find
+        for i in range(self.n_rows):
+            pos = self.index(i, 0)
+            end = pos + self.n_cols
+            while (pos := find(target, pos, end)) != -1:
+                yield pos
+                pos += 1
+
+    def find_index(self, char: str) -> int:
+        """Flat index of the first cell holding `char`."""
+        return next(self.indices(char))
+
+    def find(self, char: str) -> tuple[int, int]:
+        """Coordinates of the first cell holding `char`."""
+        return self.coords(self.find_index(char))
+
+    def count(self, char: str) -> int:
+        """Number of real cells holding `char`."""
+        target = ord(char)
+        return sum(row.tobytes().count(target) for row in self.rows())
+
+    def group_by_char(self, skip: str = '') -> dict[str, list[tuple[int, int]]]:
+        """Coordinates of every cell keyed by its character."""
+        groups = {}
+        for i, row in enumerate(self.rows()):
+            for j, c in enumerate(row.tobytes().decode()):
+                if c not in skip:
+                    groups.setdefault(c, []).append((i, j))
+        return groups
+
+    def row(self, i: int) -> memoryview:
+        """Zero-copy view of row i."""
+        start = self.index(i, 0)
+        return memoryview(self.cells)[start:start + self.n_cols]
+
+    def column(self, j: int) -> memoryview:
+        """Zero-copy strided view of column j."""
+        start = self.index(0, j)
+        return memoryview(self.cells)[start:start + self.n_rows * self.stride:self.stride]
+
+    def rows(self) -> Iterator[memoryview]:
+        for i in range(self.n_rows):
+            yield self.row(i)
+
+    def to_numpy(self):
+        """uint8 (n_rows, n_cols) view sharing memory with the grid. Needs NumPy."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        padded = np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.stride)
+        p = self.pad
+        return padded[p:p + self.n_rows, p:p + self.n_cols]
+
+    def copy(self) -> 'Grid':
+        other = object.__new__(Grid)
+        for attr in self.__slots__:
+            setattr(other, attr, getattr(self, attr))
+        other.cells = bytearray(self.cells)
+        return other
+
+    def __deepcopy__(self, memo) -> 'Grid':
+        return self.copy()
+
+    def __str__(self) -> str:
+        return '\n'.join(row.tobytes().decode() for row in self.rows())
+
+    def __repr__(self) -> str:
+        return f'Grid({self.n_rows}x{self.n_cols})'
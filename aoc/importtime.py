@@ -0,0 +1,116 @@
+"""
+Cold start budget for puzzle modules.
+
+Each module is loaded in a fresh interpreter under `python -X importtime`. The
+report gives the wall time of loading it and the imports it pulled in that were
+not already loaded by the harness, heaviest first. Loading any module over
+budget fails the run.
+
+    python -m aoc.importtime --budget-ms 30
+    python -m aoc.importtime --budget 2024/day21=60 --json importtime.json
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from aoc.puzzles import REPO_ROOT, Puzzle, discover
+
+
+DEFAULT_BUDGET_MS = 50.0
+MARKER = '-- aoc.importtime start --'
+# "import time:  self [us] | cumulative | imported package", nesting shown by indentation
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+# runs in the child: import the harness first so only the puzzle's own cost is measured
+_CHILD = '''
+import sys, time
+sys.path.insert(0, {root!r})
+from aoc.puzzles import Puzzle
+from pathlib import Path
+puzzle = Puzzle({year}, {day}, Path({path!r}))
+print({marker!r}, file=sys.stderr, flush=True)
+s = time.perf_counter()
+puzzle.load()
+print(f'{{(time.perf_counter() - s) * 1000:.3f}}', flush=True)
+'''
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Top level imports logged after the marker, as {name, self_us, cumulative_us}."""
+    lines = stderr.split(MARKER, 1)[-1].splitlines()
+    imports = []
+    for line in lines:
+        match = _LINE.match(line)
+        # a single space of indentation means a top level import
+        if match and len(match.group(3)) == 1:
+            imports.append({'name': match.group(4), 'self_us': int(match.group(1)),
+                            'cumulative_us': int(match.group(2))})
+    return imports
+
+
+def measure(puzzle: Puzzle) -> dict:
+    """Load one puzzle module in a fresh interpreter and time it."""
+    code = _CHILD.format(root=str(REPO_ROOT), year=puzzle.year, day=puzzle.day,
+                         path=str(puzzle.path), marker=MARKER)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          capture_output=True, text=True, check=False, cwd=REPO_ROOT)
+    result = {'puzzle': puzzle.name}
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        result.update(status='error', error=error[-1] if error else f'exit {proc.returncode}')
+        return result
+
+    imports = sorted(parse_importtime(proc.stderr), key=lambda i: -i['cumulative_us'])
+    result.update(status='ok', load_ms=float(proc.stdout.split()[-1]), imports=imports,
+                  imports_ms=sum(i['cumulative_us'] for i in imports) / 1000)
+    return result
+
+
+def check(results: list[dict], budget_ms: float, overrides: dict[str, float]) -> list[dict]:
+    """Results whose load time exceeds their budget."""
+    return [r for r in results
+            if r['status'] == 'ok' and r['load_ms'] > overrides.get(r['puzzle'], budget_ms)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--year', type=int, action='append')
+    parser.add_argument('--day', type=int, action='append')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'per module load budget (default {DEFAULT_BUDGET_MS:g}ms)')
+    parser.add_argument('--budget', action='append', default=[], metavar='YYYY/dayNN=MS',
+                        help='budget override for one module (repeatable)')
+    parser.add_argument('--top', type=int, default=3, help='imports listed per module')
+    parser.add_argument('--json', type=Path, help='write full results here')
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for spec in args.budget:
+        name, ms = spec.split('=')
+        overrides[name] = float(ms)
+
+    results = [measure(p) for p in discover(args.year, args.day)]
+    for res in results:
+        if res['status'] != 'ok':
+            print(f"{res['puzzle']:<12} error    {res['error']}")
+            continue
+        budget = overrides.get(res['puzzle'], args.budget_ms)
+        heavy = ', '.join(f"{i['name']} {i['cumulative_us'] / 1000:.1f}ms"
+                          for i in res['imports'][:args.top])
+        flag = 'OVER' if res['load_ms'] > budget else 'ok'
+        print(f"{res['puzzle']:<12} {flag:<8} {res['load_ms']:>7.1f}ms / {budget:g}ms  {heavy}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    over = check(results, args.budget_ms, overrides)
+    for res in over:
+        print(f"IMPORT BUDGET {res['puzzle']}: {res['load_ms']:.1f}ms", file=sys.stderr)
+    return int(bool(over) or any(r['status'] != 'ok' for r in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
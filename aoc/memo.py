@@ -0,0 +1,248 @@
+"""
+Bounded, observable memoization for puzzle helpers.
+
+A drop-in for `functools.lru_cache` that can be capped by entry count and by an
+estimated memory budget, and that counts hits, misses and evictions:
+
+    @memoize                            # unbounded, like lru_cache(maxsize=None)
+    def dfs(stone, blinks): ...
+
+    @memoize(maxsize=1 << 16, policy='fifo')
+    def generate_secret(secret): ...
+
+    dfs.cache_info()   # CacheInfo(hits=..., misses=..., evictions=..., nbytes=...)
+    memo.stats()       # the same for every memoized function, keyed by name
+
+Caches without explicit limits pick up AOC_MEMO_MAXSIZE, AOC_MEMO_MAX_BYTES
+(accepts K/M/G suffixes) and AOC_MEMO_POLICY from the environment when the
+decorated module is imported, so RSS can be capped on big inputs without
+editing the puzzles.
+
+Policies:
+
+    lru   evict the least recently used entry (default)
+    fifo  evict the oldest entry regardless of use
+"""
+import functools
+import itertools
+import os
+import sys
+from collections import OrderedDict, namedtuple
+
+
+POLICIES = ('lru', 'fifo')
+ENV_MAXSIZE = 'AOC_MEMO_MAXSIZE'
+ENV_MAX_BYTES = 'AOC_MEMO_MAX_BYTES'
+ENV_POLICY = 'AOC_MEMO_POLICY'
+
+# rough per-entry cost of the dict slot, hash table slack and ordering links
+ENTRY_OVERHEAD = 100
+# entries measured when estimating the size of an unbudgeted cache
+SAMPLE_SIZE = 64
+
+_UNITS = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+REGISTRY = []
+
+
+# collections.namedtuple rather than typing.NamedTuple: importing typing costs milliseconds
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize evictions nbytes max_bytes policy')
+
+
+def parse_bytes(text: str | None) -> int | None:
+    """'512M' -> 536870912. Empty or None means no budget."""
+    if not text:
+        return None
+    text = text.strip().upper().removesuffix('B')
+    unit = text[-1] if text[-1] in _UNITS else ''
+    return int(float(text[:len(text) - len(unit)]) * _UNITS[unit])
+
+
+def sizeof(obj, depth: int = 3, seen: set | None = None) -> int:
+    """
+    Approximate bytes held by obj, following containers a few levels down.
+    Objects whose id is already in `seen` are not counted again, so passing one
+    set across several entries charges shared arguments (a tuple of towels
+    passed on every call, say) once.
+    """
+    if seen is not None:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if depth == 0:
+        return size
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        size += sum(sizeof(x, depth - 1, seen) for x in obj)
+    elif isinstance(obj, dict):
+        size += sum(sizeof(k, depth - 1, seen) + sizeof(v, depth - 1, seen)
+                    for k, v in obj.items())
+    return size
+
+
+def _key_of(args: tuple, kwargs: dict):
+    """The key object lru_cache stores: a lone int or str argument is its own key."""
+    if not kwargs and len(args) == 1 and type(args[0]) in (int, str):
+        return args[0]
+    return (args, tuple(kwargs.items())) if kwargs else args
+
+
+class Memo:
+    """
+    Configuration and counters of one memoized function. The callable handed
+    back by `memoize` is `memo.wrapper`; it carries `cache_info`, `cache_clear`
+    and a `memo` attribute pointing back here.
+
+    Plain LRU caches bounded only by entry count (or unbounded) sit on
+    functools.lru_cache, so hits cost the same as before. A byte budget or the
+    fifo policy needs per-entry bookkeeping and uses a Python level dict.
+    """
+
+    def __init__(self, fn, maxsize: int | None = None, max_bytes: int | None = None,
+                 policy: str = 'lru'):
+        if policy not in POLICIES:
+            raise ValueError(f'policy {policy!r}, expected one of {POLICIES}')
+        self.fn = fn
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.hits = self.misses = self.evictions = 0
+        self.nbytes = 0
+        self._samples = []
+        self._cache = None
+        self._sizes = None
+
+        if max_bytes is None and policy == 'lru':
+            wrapper = functools.lru_cache(maxsize=maxsize)(self._sampler())
+            self._lru_info, self._lru_clear = wrapper.cache_info, wrapper.cache_clear
+        else:
+            self._lru_info = self._lru_clear = None
+            self._cache = OrderedDict()
+            self._sizes = {} if max_bytes is not None else None
+            wrapper = self._python_wrapper()
+
+        functools.update_wrapper(wrapper, fn)
+        wrapper.cache_info = self.cache_info
+        wrapper.cache_clear = self.cache_clear
+        wrapper.memo = self
+        self.wrapper = wrapper
+
+    def _sampler(self):
+        """Miss path under lru_cache: measure the first few entries for the size estimate."""
+        fn, samples = self.fn, self._samples
+
+        def miss(*args, **kwargs):
+            value = fn(*args, **kwargs)
+            if len(samples) < SAMPLE_SIZE:
+                samples.append((_key_of(args, kwargs), value))
+            return value
+
+        return miss
+
+    def _python_wrapper(self):
+        fn, cache, touch = self.fn, self._cache, self.policy == 'lru'
+        missing = object()
+
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(kwargs.items())) if kwargs else args
+            value = cache.get(key, missing)
+            if value is not missing:
+                self.hits += 1
+                if touch:
+                    cache.move_to_end(key)
+                return value
+
+            self.misses += 1
+            value = fn(*args, **kwargs)
+            cache[key] = value
+            self._admit(key, value)
+            return value
+
+        return wrapper
+
+    def _admit(self, key, value):
+        if self._sizes is not None:
+            size = sizeof(key) + sizeof(value) + ENTRY_OVERHEAD
+            self.nbytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+
+        cache = self._cache
+        while cache and ((self.maxsize is not None and len(cache) > self.maxsize) or
+                         (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            old, _ = cache.popitem(last=False)
+            if self._sizes is not None:
+                self.nbytes -= self._sizes.pop(old)
+            self.evictions += 1
+
+    def estimated_bytes(self, currsize: int) -> int:
+        """
+        Tracked size under a byte budget, otherwise extrapolated from a sample.
+        The budget charges every entry for its whole key, so an argument shared
+        by all calls is counted each time and the figure errs high.
+        """
+        if self._sizes is not None:
+            return self.nbytes
+        samples = self._samples
+        if self._cache is not None:
+            samples = list(itertools.islice(self._cache.items(), SAMPLE_SIZE))
+        if not samples:
+            return 0
+        seen = set()
+        sampled = sum(sizeof(k, seen=seen) + sizeof(v, seen=seen) for k, v in samples)
+        return (sampled // len(samples) + ENTRY_OVERHEAD) * currsize
+
+    def cache_info(self) -> CacheInfo:
+        if self._lru_info is not None:
+            info = self._lru_info()
+            # every miss inserts and only eviction (or cache_clear) removes
+            hits, misses, currsize = info.hits, info.misses, info.currsize
+            evictions = misses - currsize
+        else:
+            hits, misses, currsize, evictions = self.hits, self.misses, len(self._cache), \
+                self.evictions
+        return CacheInfo(hits, misses, self.maxsize, currsize, evictions,
+                         self.estimated_bytes(currsize), self.max_bytes, self.policy)
+
+    def cache_clear(self):
+        if self._lru_clear is not None:
+            self._lru_clear()
+        else:
+            self._cache.clear()
+            if self._sizes is not None:
+                self._sizes.clear()
+        self.hits = self.misses = self.evictions = 0
+        self.nbytes = 0
+
+    @property
+    def name(self) -> str:
+        return f'{self.fn.__module__}.{self.fn.__qualname__}'
+
+
+def memoize(fn=None, *, maxsize: int | None = None, max_bytes: int | str | None = None,
+            policy: str | None = None):
+    """Decorator, usable bare or with limits. See the module docstring."""
+    if isinstance(max_bytes, str):
+        max_bytes = parse_bytes(max_bytes)
+    if maxsize is None and os.environ.get(ENV_MAXSIZE):
+        maxsize = int(os.environ[ENV_MAXSIZE])
+    if max_bytes is None:
+        max_bytes = parse_bytes(os.environ.get(ENV_MAX_BYTES))
+    policy = policy or os.environ.get(ENV_POLICY, 'lru').strip().lower()
+
+    def decorate(func):
+        memo = Memo(func, maxsize, max_bytes, policy)
+        REGISTRY.append(memo)
+        return memo.wrapper
+
+    return decorate(fn) if fn is not None else decorate
+
+
+def module_stats(module) -> dict[str, dict]:
+    """cache_info() of the memoized functions defined at module level, by name."""
+    return {name: obj.memo.cache_info()._asdict() for name, obj in vars(module).items()
+            if isinstance(getattr(obj, 'memo', None), Memo)}
+
+
+def stats() -> dict[str, dict]:
+    """cache_info() of every memoized function imported so far."""
+    return {m.name: m.cache_info()._asdict() for m in REGISTRY}
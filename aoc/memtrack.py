@@ -0,0 +1,148 @@
+"""
+Peak memory and allocation tracking for part functions.
+
+    python -m aoc.bench --memory tracemalloc --input-root ~/aoc-inputs
+    python -m aoc.bench --memory rss --day 9 --scale 10
+
+tracemalloc mode calls the part twice with Python allocation tracing on. The
+first call gives the exact traced peak. The second takes one snapshot as soon as
+traced memory reaches 90% of that peak and reports the lines holding the most
+memory at that point, and how many blocks they hold. The snapshot is taken in
+the second call so that its own memory cannot inflate the measured peak.
+
+rss mode calls the part once and samples the resident set size from a
+background thread. It sees memory allocated outside Python objects (NumPy
+buffers, for instance) but has no per-line breakdown.
+"""
+import gc
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+
+
+MODES = ('tracemalloc', 'rss')
+PEAK_FRACTION = 0.9
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_IGNORE = (tracemalloc.__file__, __file__, threading.__file__)
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, falling back to the high water mark off Linux."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _Poller(threading.Thread):
+    """Calls `poll` every `interval` seconds until stopped."""
+
+    def __init__(self, poll, interval: float):
+        super().__init__(daemon=True)
+        self.poll = poll
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def _call_traced(fn, kwargs: dict, poll=None, interval: float = 0.001):
+    gc.collect()
+    tracemalloc.clear_traces()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    poller = _Poller(poll, interval) if poll else None
+    if poller:
+        poller.start()
+    try:
+        fn(**kwargs)
+    finally:
+        if poller:
+            poller.stop()
+    current, peak = tracemalloc.get_traced_memory()
+    return base, current, peak
+
+
+def _trace(fn, make_kwargs, top: int, interval: float) -> dict:
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        base, current, peak = _call_traced(fn, make_kwargs())
+
+        near_peak = []
+        threshold = base + PEAK_FRACTION * (peak - base)
+
+        def poll():
+            if not near_peak and tracemalloc.get_traced_memory()[0] >= threshold:
+                near_peak.append(tracemalloc.take_snapshot())
+
+        _call_traced(fn, make_kwargs(), poll, interval)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    report = {'mode': 'tracemalloc', 'peak_bytes': peak - base, 'retained_bytes': current - base}
+    if near_peak:
+        snapshot = near_peak[0].filter_traces(
+            [tracemalloc.Filter(False, path) for path in _IGNORE])
+        stats = snapshot.statistics('lineno')
+        report['blocks_at_peak'] = sum(s.count for s in stats)
+        report['top_lines'] = [
+            {'line': f'{s.traceback[0].filename}:{s.traceback[0].lineno}',
+             'bytes': s.size, 'blocks': s.count}
+            for s in stats[:top]
+        ]
+    return report
+
+
+def _rss(fn, make_kwargs, interval: float) -> dict:
+    kwargs = make_kwargs()
+    gc.collect()
+    base = _rss_bytes()
+    peak = [base]
+
+    def poll():
+        peak[0] = max(peak[0], _rss_bytes())
+
+    poller = _Poller(poll, interval)
+    poller.start()
+    try:
+        fn(**kwargs)
+    finally:
+        poller.stop()
+    poll()
+    return {'mode': 'rss', 'peak_bytes': peak[0] - base, 'retained_bytes': _rss_bytes() - base}
+
+
+def measure(fn, make_kwargs, mode: str = 'tracemalloc', top: int = 10,
+            interval: float = 0.001) -> dict:
+    """
+    Memory report for calls of `fn(**make_kwargs())`. `make_kwargs` is called
+    for every run so parts that mutate their input see a fresh copy, and the
+    copy is made before measuring starts.
+    """
+    if mode == 'tracemalloc':
+        return _trace(fn, make_kwargs, top, interval)
+    if mode == 'rss':
+        return _rss(fn, make_kwargs, interval)
+    raise ValueError(f'memory mode {mode!r}, expected one of {MODES}')
+
+
+def format_bytes(n: int) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(n) < 1024:
+            return f'{n:.0f}{unit}' if unit == 'B' else f'{n:.1f}{unit}'
+        n /= 1024
+    return f'{n:.2f}GiB'
@@ -0,0 +1,192 @@
+"""
+Opt-in profiling of part functions.
+
+Set AOC_PROFILE (or pass --profile to aoc.runner / aoc.bench) to one of:
+
+    line      line_profiler per line timings (requires line_profiler)
+    cprofile  cProfile function level stats
+    sample    stdlib sampling profiler, hits per source line
+
+Reports are written to AOC_PROFILE_DIR (default ./profiles), one file per
+profiled function. With AOC_PROFILE unset, `profile` returns the function
+untouched so there is no overhead.
+"""
+import collections
+import functools
+import io
+import os
+import sys
+import threading
+from pathlib import Path
+
+
+MODES = ('line', 'cprofile', 'sample')
+ENV_MODE = 'AOC_PROFILE'
+ENV_DIR = 'AOC_PROFILE_DIR'
+ENV_INTERVAL = 'AOC_PROFILE_INTERVAL'
+
+
+def mode() -> str | None:
+    """Currently requested profiler, or None when profiling is off."""
+    requested = os.environ.get(ENV_MODE, '').strip().lower()
+    if not requested:
+        return None
+    if requested not in MODES:
+        raise ValueError(f'{ENV_MODE}={requested!r}, expected one of {MODES}')
+    return requested
+
+
+def enable(requested: str, report_dir: Path | str | None = None):
+    """Turn profiling on for this process and any workers it starts."""
+    os.environ[ENV_MODE] = requested
+    if report_dir is not None:
+        os.environ[ENV_DIR] = str(report_dir)
+    mode()
+
+
+def _report_path(fn, suffix: str) -> Path:
+    report_dir = Path(os.environ.get(ENV_DIR, 'profiles'))
+    report_dir.mkdir(parents=True, exist_ok=True)
+    return report_dir / f'{fn.__module__}.{fn.__qualname__}.{suffix}.txt'
+
+
+def _line_profile(fn):
+    try:
+        from line_profiler import LineProfiler  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError('line mode needs line_profiler installed; '
+                          'use cprofile or sample instead') from exc
+
+    profiler = LineProfiler()
+    profiled = profiler(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return profiled(*args, **kwargs)
+        finally:
+            stream = io.StringIO()
+            profiler.print_stats(stream=stream)
+            _report_path(fn, 'line').write_text(stream.getvalue())
+
+    return wrapper
+
+
+def _cprofile(fn):
+    # imported here so puzzles decorated with @profile load fast when profiling is off
+    import cProfile  # pylint: disable=import-outside-toplevel
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn, *args, **kwargs)
+        finally:
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(40)
+            _report_path(fn, 'cprofile').write_text(stream.getvalue())
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=4096)
+def _offset_line(code, offset: int) -> int | None:
+    """
+    Line for a bytecode offset. Loop back-edges carry no line number but are
+    where other threads get to run, so attribute them to the loop header.
+    """
+    import dis  # pylint: disable=import-outside-toplevel
+
+    for ins in dis.get_instructions(code):
+        if ins.offset == offset and ins.opname.startswith('JUMP_BACKWARD'):
+            offset = ins.argval
+            break
+    for start, end, lineno in code.co_lines():
+        if start <= offset < end:
+            return lineno
+    return None
+
+
+def _line_of(frame) -> int | None:
+    """Current line of a sampled frame."""
+    if frame.f_lineno is not None:
+        return frame.f_lineno
+    return _offset_line(frame.f_code, frame.f_lasti)
+
+
+class _Sampler(threading.Thread):
+    """Background thread recording the executing line of a target thread."""
+
+    def __init__(self, target_ident: int, interval: float):
+        super().__init__(daemon=True)
+        self.target_ident = target_ident
+        self.interval = interval
+        self.lines = collections.Counter()
+        self.functions = collections.Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_ident)  # pylint: disable=protected-access
+            # the target sets the stop event before joining, so this drops samples of stop() itself
+            if frame is None or self._stop_event.is_set():
+                continue
+            self.samples += 1
+            code = frame.f_code
+            self.lines[(code.co_filename, _line_of(frame), code.co_name)] += 1
+            seen = set()
+            while frame is not None:
+                key = (frame.f_code.co_filename, frame.f_code.co_name)
+                if key not in seen:
+                    self.functions[key] += 1
+                    seen.add(key)
+                frame = frame.f_back
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def report(self, top: int = 30) -> str:
+        total = max(self.samples, 1)
+        out = [f'{self.samples} samples every {self.interval * 1000:g}ms', '', 'Hot lines:']
+        for (filename, lineno, name), hits in self.lines.most_common(top):
+            out.append(f'{hits / total:7.1%} {hits:>8}  {filename}:{lineno} ({name})')
+        out += ['', 'Inclusive by function:']
+        for (filename, name), hits in self.functions.most_common(top):
+            out.append(f'{hits / total:7.1%} {hits:>8}  {name} ({filename})')
+        return '\n'.join(out) + '\n'
+
+
+def _sample(fn):
+    interval = float(os.environ.get(ENV_INTERVAL, '0.001'))
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        sampler = _Sampler(threading.get_ident(), interval)
+        sampler.start()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sampler.stop()
+            _report_path(fn, 'sample').write_text(sampler.report())
+
+    return wrapper
+
+
+_PROFILERS = {'line': _line_profile, 'cprofile': _cprofile, 'sample': _sample}
+
+
+def instrument(fn):
+    """Wrap `fn` with the requested profiler, or return it as is when off."""
+    requested = mode()
+    if requested is None or getattr(fn, '__aoc_profiled__', False):
+        return fn
+    wrapper = _PROFILERS[requested](fn)
+    wrapper.__aoc_profiled__ = True
+    return wrapper
+
+
+# decorator spelling for explicitly marking hot functions in puzzle modules
+profile = instrument
@@ -0,0 +1,93 @@
+"""
+Discovery and invocation of the YYYY/dayNN/puzzleN.py modules.
+
+Every puzzle module exposes `parse_input(filename)` returning a dict of keyword
+arguments, and any number of `partN` functions (plus variants such as
+`part2_optimized`). Part functions are called with the subset of those keyword
+arguments matching their signature. A part that takes `filename` is also given
+the path of the input, so streaming variants can read it themselves (see
+aoc.stream).
+"""
+import copy
+import importlib.util
+import inspect
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import cache
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PART_PATTERN = re.compile(r'^part\d+$')
+VARIANT_PATTERN = re.compile(r'^part\d+(_\w+)?$')
+INPUT_FILENAME = 'input.txt'
+
+_MODULES = {}
+
+
+@dataclass(frozen=True, order=True)
+class Puzzle:
+    """A single day's solution module."""
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f'{self.year}/day{self.day:02d}'
+
+    def input_path(self, input_root: Path | str = REPO_ROOT) -> Path:
+        """Location of the puzzle input under the given root."""
+        return Path(input_root) / str(self.year) / f'day{self.day:02d}' / INPUT_FILENAME
+
+    def load(self):
+        """Import the module once per process."""
+        if self.path not in _MODULES:
+            spec = importlib.util.spec_from_file_location(
+                f'puzzle_{self.year}_{self.day:02d}', self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _MODULES[self.path] = module
+        return _MODULES[self.path]
+
+    def parts(self, variants: bool = False) -> dict:
+        """Return part functions by name, optionally including alternates."""
+        pattern = VARIANT_PATTERN if variants else PART_PATTERN
+        module = self.load()
+        return {
+            name: fn for name, fn in sorted(vars(module).items())
+            if pattern.match(name) and inspect.isfunction(fn)
+        }
+
+    def parse(self, input_root: Path | str = REPO_ROOT, filename: Path | str | None = None) -> dict:
+        """Parse the puzzle input into part keyword arguments, via the parsed-input cache."""
+        filename = filename or self.input_path(input_root)
+        puzzle_input = cache.load_or_parse(self.load(), self.name, filename)
+        return dict(puzzle_input, filename=str(filename))
+
+
+def discover(years: list[int] | None = None, days: list[int] | None = None,
+             root: Path | str = REPO_ROOT) -> list[Puzzle]:
+    """Find all puzzle modules, optionally filtered by year and day."""
+    puzzles = []
+    for path in Path(root).glob('[0-9][0-9][0-9][0-9]/day[0-9][0-9]/puzzle*.py'):
+        year, day = int(path.parent.parent.name), int(path.parent.name[3:])
+        if years and year not in years:
+            continue
+        if days and day not in days:
+            continue
+        puzzles.append(Puzzle(year, day, path))
+
+    return sorted(puzzles)
+
+
+def bind_args(fn, puzzle_input: dict) -> dict:
+    """Select the keyword arguments a part function accepts, copied so parts may mutate them."""
+    params = inspect.signature(inspect.unwrap(fn)).parameters
+    return {k: copy.deepcopy(v) for k, v in puzzle_input.items() if k in params}
+
+
+def call_part(fn, puzzle_input: dict):
+    """Invoke a part function against parsed input."""
+    return fn(**bind_args(fn, puzzle_input))
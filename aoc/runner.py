@@ -0,0 +1,153 @@
+"""
+Run every puzzle concurrently, one process per day, and report answers and timings.
+
+    python -m aoc.runner --input-root ~/aoc-inputs --jobs 8 --timeout 300 --json report.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from aoc import cache, profiling
+from aoc.puzzles import REPO_ROOT, Puzzle, call_part, discover
+
+
+def run_puzzle(puzzle: Puzzle, input_root: Path | str = REPO_ROOT,
+               filename: Path | str | None = None, parts: list[str] | None = None) -> dict:
+    """
+    Parse input and run each part of a single puzzle in this process. `filename`
+    overrides the input found under `input_root`, `parts` restricts which part
+    functions run (alternates such as part2_optimized may be named).
+    """
+    result = {'puzzle': puzzle.name, 'year': puzzle.year, 'day': puzzle.day,
+              'status': 'ok', 'parse_seconds': None, 'parts': {}}
+
+    filename = Path(filename) if filename else puzzle.input_path(input_root)
+    if not filename.exists():
+        result['status'] = 'missing'
+        result['error'] = f'no input at {filename}'
+        return result
+
+    try:
+        s = time.perf_counter()
+        puzzle_input = puzzle.parse(filename=filename)
+        result['parse_seconds'] = time.perf_counter() - s
+
+        available = puzzle.parts(variants=bool(parts))
+        for name in parts or available:
+            if name not in available:
+                raise KeyError(f'{puzzle.name} has no {name}')
+            fn = available[name]
+            s = time.perf_counter()
+            answer = call_part(profiling.instrument(fn), puzzle_input)
+            result['parts'][name] = {'answer': answer, 'seconds': time.perf_counter() - s}
+    except Exception:  # pylint: disable=broad-except
+        result['status'] = 'error'
+        result['error'] = traceback.format_exc(limit=-3)
+
+    return result
+
+
+def _worker(puzzle: Puzzle, input_root: str, results: multiprocessing.Queue):
+    results.put(run_puzzle(puzzle, input_root))
+
+
+def run_all(puzzles: list[Puzzle], input_root: Path | str = REPO_ROOT,
+            jobs: int | None = None, timeout: float | None = None) -> list[dict]:
+    """
+    Run puzzles on up to `jobs` worker processes. A day exceeding `timeout`
+    seconds of wall time is terminated and reported as such.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pending = list(puzzles)
+    running = {}
+    results = {}
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            puzzle = pending.pop(0)
+            result_queue = multiprocessing.Queue()
+            proc = multiprocessing.Process(
+                target=_worker, args=(puzzle, str(input_root), result_queue), daemon=True)
+            proc.start()
+            running[puzzle] = (proc, result_queue, time.perf_counter())
+
+        for puzzle, (proc, result_queue, started) in list(running.items()):
+            elapsed = time.perf_counter() - started
+            try:
+                results[puzzle] = result_queue.get(timeout=0.05 if not proc.is_alive() else 0)
+            except queue.Empty:
+                if proc.is_alive() and not (timeout and elapsed > timeout):
+                    continue
+                if proc.is_alive():
+                    proc.terminate()
+                    status, error = 'timeout', f'exceeded {timeout}s'
+                else:
+                    status, error = 'crashed', f'exit code {proc.exitcode}'
+                results[puzzle] = {'puzzle': puzzle.name, 'year': puzzle.year, 'day': puzzle.day,
+                                   'status': status, 'error': error, 'parts': {}}
+            proc.join()
+            results[puzzle]['wall_seconds'] = elapsed
+            del running[puzzle]
+
+        if running:
+            time.sleep(0.01)
+
+    return [results[p] for p in puzzles]
+
+
+def format_report(results: list[dict]) -> str:
+    """Human readable summary, one line per part."""
+    lines = []
+    for res in results:
+        if res['status'] != 'ok':
+            lines.append(f"{res['puzzle']:<12} {res['status']:<8} {res.get('error', '').strip()}")
+            continue
+        for name, part in res['parts'].items():
+            lines.append(f"{res['puzzle']:<12} {name:<8} {part['seconds']:>9.3f}s  {part['answer']}")
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--input-root', default=REPO_ROOT, type=Path,
+                        help='directory holding YYYY/dayNN/input.txt (default: repo root)')
+    parser.add_argument('--year', type=int, action='append', help='only run this year')
+    parser.add_argument('--day', type=int, action='append', help='only run this day')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='worker processes')
+    parser.add_argument('--timeout', type=float, default=None, help='per-day timeout in seconds')
+    parser.add_argument('--json', type=Path, help='write machine readable report here')
+    parser.add_argument('--profile', choices=profiling.MODES,
+                        help='profile every part, reports go to --profile-dir')
+    parser.add_argument('--profile-dir', type=Path, default=Path('profiles'))
+    parser.add_argument('--no-cache', action='store_true', help='always re-parse inputs')
+    parser.add_argument('--cache-dir', type=Path, help='parsed input cache location')
+    args = parser.parse_args(argv)
+
+    cache.configure(not args.no_cache, args.cache_dir)
+
+    if args.profile:
+        profiling.enable(args.profile, args.profile_dir)
+
+    puzzles = discover(args.year, args.day)
+    s = time.perf_counter()
+    results = run_all(puzzles, args.input_root, args.jobs, args.timeout)
+    total = time.perf_counter() - s
+
+    print(format_report(results))
+    print(f'{len(puzzles)} puzzles in {total:.3f}s')
+
+    if args.json:
+        report = {'input_root': str(args.input_root), 'total_seconds': total, 'results': results}
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+    return int(any(r['status'] not in ('ok', 'missing') for r in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
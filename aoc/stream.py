@@ -0,0 +1,165 @@
+"""
+Memory-mapped input sources for the streaming part variants.
+
+A `partN_stream(filename)` variant reads its input straight from the file
+instead of from parse_input's lists, so its memory use does not grow with the
+input. `Puzzle.parse` passes the input path to any part that takes a
+`filename` argument.
+
+    for line in stream.lines(filename):
+        ...
+
+The file is mapped rather than read, so pages are loaded on demand and can be
+dropped again by the OS. `split` cuts the file into byte ranges that start and
+end on line boundaries, and a worker process can stream just its own range with
+`lines(filename, start, end)`. `map_ranges` does both: it splits the file and
+runs a function over each range on a process pool.
+"""
+import importlib.util
+import mmap
+import os
+from pathlib import Path
+
+
+CHUNK_SIZE = 1 << 20
+
+_WORKER_MODULES = {}
+
+
+class LineSource:
+    """A read-only mapping of a file, or of the byte range [start, end) of it."""
+
+    def __init__(self, filename: Path | str, start: int = 0, end: int | None = None):
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # an empty file cannot be mapped
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.start = min(start, size)
+        self.end = size if end is None else min(end, size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return max(0, self.end - self.start)
+
+    def close(self):
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # a caller still holds a chunk, the mapping goes when it does
+                pass
+            self._mm = None
+
+    def _line_end(self, pos: int) -> int:
+        """Offset just past the line containing byte pos - 1."""
+        if pos >= self.end:
+            return self.end
+        newline = self._mm.find(b'\n', pos - 1, self.end)
+        return self.end if newline < 0 else newline + 1
+
+    def lines(self, keepends: bool = False):
+        """Yield each line as bytes. Only the current line is copied out of the mapping."""
+        mm, pos, end = self._mm, self.start, self.end
+        while pos < end:
+            newline = mm.find(b'\n', pos, end)
+            stop = end if newline < 0 else newline + 1
+            if keepends:
+                yield mm[pos:stop]
+            else:
+                line_end = stop - 1 if newline >= 0 else stop
+                if line_end > pos and mm[line_end - 1] == 13:  # \r
+                    line_end -= 1
+                yield mm[pos:line_end]
+            pos = stop
+
+    def chunks(self, size: int = CHUNK_SIZE):
+        """
+        Yield memoryviews of whole lines, about `size` bytes each, without
+        copying. Release them before the source is closed.
+        """
+        if not len(self):
+            return
+        view = memoryview(self._mm)
+        try:
+            pos = self.start
+            while pos < self.end:
+                stop = self._line_end(min(pos + size, self.end))
+                yield view[pos:stop]
+                pos = stop
+        finally:
+            view.release()
+
+    def split(self, n: int) -> list[tuple[int, int]]:
+        """Cut the range into at most n (start, end) pieces on line boundaries."""
+        if not len(self):
+            return []
+        cuts = [self.start]
+        for k in range(1, n):
+            cut = self._line_end(self.start + len(self) * k // n)
+            if cut > cuts[-1]:
+                cuts.append(cut)
+        if self.end > cuts[-1]:
+            cuts.append(self.end)
+        return list(zip(cuts, cuts[1:]))
+
+
+def lines(filename: Path | str, start: int = 0, end: int | None = None):
+    """Yield the lines of a file (or of a byte range from `split`) as bytes."""
+    with LineSource(filename, start, end) as source:
+        yield from source.lines()
+
+
+def text_lines(filename: Path | str, start: int = 0, end: int | None = None,
+               encoding: str = 'utf-8'):
+    """Yield the lines of a file as str, without line endings."""
+    for line in lines(filename, start, end):
+        yield line.decode(encoding)
+
+
+def split(filename: Path | str, n: int) -> list[tuple[int, int]]:
+    """Byte ranges of a file for n workers, cut on line boundaries."""
+    with LineSource(filename) as source:
+        return source.split(n)
+
+
+def _worker_function(path: str, name: str):
+    # puzzle modules are loaded from their file and are not importable by name
+    if path not in _WORKER_MODULES:
+        spec = importlib.util.spec_from_file_location(f'_stream_worker_{len(_WORKER_MODULES)}', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _WORKER_MODULES[path] = module
+    return getattr(_WORKER_MODULES[path], name)
+
+
+def _run_range(path: str, name: str, filename: str, start: int, end: int):
+    return _worker_function(path, name)(filename, start, end)
+
+
+def map_ranges(fn, filename: Path | str, workers: int | None = None) -> list:
+    """
+    Results of fn(filename, start, end) for line-aligned ranges covering the
+    file, one range per worker process. `fn` must be a module level function.
+    Each worker gets at least CHUNK_SIZE bytes, and a file that only makes one
+    range is processed in this process without starting a pool.
+    """
+    filename = str(filename)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, os.path.getsize(filename) // CHUNK_SIZE))
+    ranges = split(filename, workers)
+    if len(ranges) <= 1:
+        return [fn(filename, start, end) for start, end in ranges]
+
+    # only needed with a pool, and slow to import
+    import inspect  # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    path, name = inspect.getfile(fn), fn.__name__
+    with ProcessPoolExecutor(len(ranges)) as pool:
+        futures = [pool.submit(_run_range, path, name, filename, start, end) for start, end in ranges]
+        return [f.result() for f in futures]
@@ -0,0 +1,149 @@
+"""
+Differential testing of alternate part implementations against the reference.
+
+Any `partN_<suffix>` function next to a `partN` is treated as a candidate
+replacement for it (part2_optimized in 2024 day09, part1_matrix in day13,
+part2_hard in day20, ...). Each pair is run on the real input and on generated
+inputs, answers must match, and the speedup of the candidate is reported.
+
+    python -m aoc.verify --input-root ~/aoc-inputs --scale 0.2 --scale 1 --seed 0 --seed 1
+
+A module can list variants that are known not to agree with the reference in
+a module level KNOWN_DIVERGENT dict of name -> reason. They are skipped unless
+--include-divergent is given, and never fail the run.
+"""
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from aoc import generators
+from aoc.bench import time_part
+from aoc.puzzles import REPO_ROOT, Puzzle, discover
+
+
+def variant_pairs(puzzle: Puzzle) -> list[tuple[str, str]]:
+    """(reference, candidate) names for every variant that has a plain partN."""
+    parts = puzzle.parts(variants=True)
+    pairs = []
+    for name in parts:
+        base = name.split('_', 1)[0]
+        if name != base and base in parts:
+            pairs.append((base, name))
+    return pairs
+
+
+def verify_pair(puzzle: Puzzle, puzzle_input: dict, reference: str, candidate: str,
+                repeats: int = 1) -> dict:
+    """Run both functions cold and compare. Speedup > 1 means the candidate is faster."""
+    module = puzzle.load()
+    parts = puzzle.parts(variants=True)
+    result = {'reference': reference, 'candidate': candidate}
+    timings = {}
+    for role, name in (('reference', reference), ('candidate', candidate)):
+        try:
+            timings[role] = time_part(parts[name], puzzle_input, module, warmup=0, repeats=repeats)
+        except ImportError as exc:
+            result.update(status='skipped', error=f'{name}: {exc}')
+            return result
+        except Exception as exc:  # pylint: disable=broad-except
+            result.update(status='error', error=f'{name}: {exc!r}')
+            return result
+
+    ref, cand = timings['reference'], timings['candidate']
+    result.update({
+        'status': 'ok' if ref['answer'] == cand['answer'] else 'mismatch',
+        'reference_answer': ref['answer'],
+        'candidate_answer': cand['answer'],
+        'reference_seconds': ref['median'],
+        'candidate_seconds': cand['median'],
+        'speedup': ref['median'] / cand['median'] if cand['median'] else float('inf'),
+    })
+    return result
+
+
+def verify_puzzle(puzzle: Puzzle, input_root: Path | str, label: str,
+                  include_divergent: bool = False, repeats: int = 1) -> list[dict]:
+    pairs = variant_pairs(puzzle)
+    if not pairs or not puzzle.input_path(input_root).exists():
+        return []
+
+    divergent = getattr(puzzle.load(), 'KNOWN_DIVERGENT', {})
+    puzzle_input = puzzle.parse(input_root)
+    results = []
+    for reference, candidate in pairs:
+        if candidate in divergent and not include_divergent:
+            result = {'reference': reference, 'candidate': candidate, 'status': 'skipped',
+                      'error': f'known divergent: {divergent[candidate]}'}
+        else:
+            result = verify_pair(puzzle, puzzle_input, reference, candidate, repeats)
+            if candidate in divergent and result['status'] == 'mismatch':
+                result['status'] = 'divergent'
+        results.append(dict(result, puzzle=puzzle.name, input=label))
+    return results
+
+
+def format_report(results: list[dict]) -> str:
+    lines = []
+    for res in results:
+        head = f"{res['puzzle']:<12} {res['input']:<10} {res['candidate']:<18} {res['status']:<9}"
+        if 'speedup' not in res:
+            lines.append(f"{head} {res.get('error', '')}")
+            continue
+        line = (f"{head} ref {res['reference_seconds']:>8.3f}s  cand {res['candidate_seconds']:>8.3f}s"
+                f"  x{res['speedup']:.2f}")
+        if res['status'] != 'ok':
+            line += f"  ({res['reference_answer']!r} != {res['candidate_answer']!r})"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--input-root', default=REPO_ROOT, type=Path,
+                        help='real inputs, skipped for days without one')
+    parser.add_argument('--year', type=int, action='append')
+    parser.add_argument('--day', type=int, action='append')
+    parser.add_argument('--scale', type=float, action='append',
+                        help='also verify on generated inputs of this scale (repeatable)')
+    parser.add_argument('--seed', type=int, action='append',
+                        help='generator seed, repeatable (default 0)')
+    parser.add_argument('--repeats', type=int, default=1, help='timed calls per function')
+    parser.add_argument('--include-divergent', action='store_true',
+                        help='also run variants listed in KNOWN_DIVERGENT')
+    parser.add_argument('--json', type=Path, help='write full results here')
+    args = parser.parse_args(argv)
+
+    puzzles = []
+    results = []
+    for puzzle in discover(args.year, args.day):
+        try:
+            if variant_pairs(puzzle):
+                puzzles.append(puzzle)
+        except ImportError as exc:
+            results.append({'puzzle': puzzle.name, 'input': '-', 'candidate': '*',
+                            'status': 'skipped', 'error': str(exc)})
+    for puzzle in puzzles:
+        results += verify_puzzle(puzzle, args.input_root, 'real', args.include_divergent,
+                                 args.repeats)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scale or []:
+            for seed in args.seed or [0]:
+                root = Path(tmp) / f'x{scale:g}-s{seed}'
+                selected = [(p.year, p.day) for p in puzzles if (p.year, p.day) in generators.GENERATORS]
+                generators.write_inputs(root, scale, seed, selected)
+                for puzzle in puzzles:
+                    results += verify_puzzle(puzzle, root, root.name, args.include_divergent,
+                                             args.repeats)
+
+    print(format_report(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, default=str))
+
+    return int(any(r['status'] in ('mismatch', 'error') for r in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Shared fixtures. Puzzle modules are loaded from their files through
+aoc.puzzles, and hand-written inputs are written to a temporary directory and
+parsed the way the runner parses them, with the parse cache switched off.
+`run_main` runs a module as a script instead, through its __main__ block, and
+`puzzle_tree` builds a small repo of made-up puzzles for the harness tests.
+"""
+import runpy
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc import cache, puzzles  # pylint: disable=wrong-import-position
+
+
+def load_puzzle(year: int, day: int) -> puzzles.Puzzle:
+    (puzzle,) = puzzles.discover([year], [day])
+    return puzzle
+
+
+@pytest.fixture(autouse=True)
+def no_parse_cache(monkeypatch):
+    monkeypatch.setenv(cache.ENV_ENABLED, '0')
+
+
+@pytest.fixture
+def write_input(tmp_path):
+    """write_input(text) -> path of an input file holding text."""
+    def write(text: str, name: str = 'input.txt') -> Path:
+        path = tmp_path / name
+        path.write_bytes(text.encode())
+        return path
+    return write
+
+
+@pytest.fixture
+def solve(write_input):
+    """solve(puzzle, text) -> answers of every part and variant, by name."""
+    def run(puzzle: puzzles.Puzzle, text: str, names: list[str] | None = None) -> dict:
+        puzzle_input = puzzle.parse(filename=write_input(text))
+        parts = puzzle.parts(variants=True)
+        return {name: puzzles.call_part(fn, puzzle_input) for name, fn in parts.items()
+                if names is None or name in names}
+    return run
+
+
+@pytest.fixture
+def run_main(tmp_path, monkeypatch, capsys):
+    """
+    run_main(puzzle, text) -> stdout of the module run as a script, with text
+    at the relative input path its __main__ block reads.
+    """
+    def run(puzzle: puzzles.Puzzle, text: str) -> list[str]:
+        path = tmp_path / 'advent_of_code' / str(puzzle.year) / f'day{puzzle.day:02d}' / 'input.txt'
+        path.parent.mkdir(parents=True)
+        path.write_bytes(text.encode())
+        monkeypatch.chdir(tmp_path)
+        runpy.run_path(str(puzzle.path), run_name='__main__')
+        return capsys.readouterr().out.splitlines()
+    return run
+
+
+TREE_MODULES = {
+    # parses, answers both parts and has a memoized, counted variant
+    1: """
+        from aoc import counters
+        from aoc.memo import memoize
+
+
+        def parse_input(filename):
+            with open(filename) as f:
+                return {'numbers': [int(line) for line in f]}
+
+
+        def part1(numbers):
+            return sum(numbers)
+
+
+        @memoize
+        def square(n):
+            return n * n
+
+
+        def part2(numbers):
+            probe = counters.probe(__name__, 'part2')
+            for n in numbers:
+                probe.expand(n)
+            return sum(square(n) for n in numbers)
+
+
+        def part2_squares(numbers):
+            return sum(n * n for n in numbers)
+    """,
+    2: """
+        def parse_input(filename):
+            return {}
+
+
+        def part1():
+            raise ArithmeticError('no answer')
+    """,
+    3: """
+        import os
+
+
+        def parse_input(filename):
+            return {}
+
+
+        def part1():
+            os._exit(3)
+    """,
+    4: """
+        import time
+
+
+        def parse_input(filename):
+            return {}
+
+
+        def part1():
+            time.sleep(60)
+    """,
+}
+
+
+@pytest.fixture
+def puzzle_tree(tmp_path):
+    """
+    Root of a repo of made-up 2099 puzzles with inputs: day 1 works, day 2
+    raises, day 3 kills its process and day 4 hangs. Returns (root, puzzles by day).
+    """
+    root = tmp_path / 'tree'
+    for day, source in TREE_MODULES.items():
+        folder = root / '2099' / f'day{day:02d}'
+        folder.mkdir(parents=True)
+        (folder / f'puzzle{day}.py').write_text(textwrap.dedent(source))
+        (folder / 'input.txt').write_text('1\n2\n3\n')
+    return root, {p.day: p for p in puzzles.discover(root=root)}
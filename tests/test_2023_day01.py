@@ -0,0 +1,123 @@
+"""2023 day 1: the digit word automaton and the ranged variants against the regex reference."""
+import pytest
+
+from aoc import stream
+from conftest import load_puzzle
+
+
+PUZZLE = load_puzzle(2023, 1)
+day01 = PUZZLE.load()
+
+SAMPLE = """two1nine
+eightwothree
+abcone2threexyz
+xtwone3four
+4nineeightseven2
+zoneight234
+7pqrstsixteen
+"""
+
+# overlapping words at both ends, a lone digit, words only at the edges,
+# a word split across what would be its own prefix, and no trailing newline
+EDGE_CASES = """twone
+oneight
+eightwo
+sevenine
+7
+threeeightwothree4oneightwo
+ninine
+1eighthree
+ffive5fivef
+onetwothreefourfivesixseveneightnine
+zz9zzoneeeeeeight"""
+
+
+@pytest.mark.parametrize('text', [SAMPLE, EDGE_CASES, EDGE_CASES.replace('\n', '\r\n') + '\r\n'],
+                         ids=['sample', 'edge-cases', 'crlf'])
+def test_part2_scan_matches_part2(solve, text):
+    answers = solve(PUZZLE, text, ['part2', 'part2_scan'])
+    assert answers['part2_scan'] == answers['part2']
+
+
+def test_sample_answer(solve):
+    assert solve(PUZZLE, SAMPLE, ['part2_scan'])['part2_scan'] == 281
+
+
+@pytest.mark.parametrize('line, value', [
+    (b'twone', 21), (b'oneight', 18), (b'eightwo', 82), (b'7', 77),
+    (b'nineight', 98), (b'xonex', 11), (b'sevenine\n', 79),
+])
+def test_calibration_sum_single_line(line, value):
+    assert day01._calibration_sum(line, day01.WORD_SCANNER) == value
+
+
+def test_calibration_sum_skips_blank_lines():
+    assert day01._calibration_sum(b'\none\n\n2\n', day01.WORD_SCANNER) == 11 + 22
+
+
+def test_calibration_sum_rejects_line_without_digit():
+    with pytest.raises(ValueError):
+        day01._calibration_sum(b'1\nabc\n', day01.WORD_SCANNER)
+
+
+def test_automaton_reports_longest_match():
+    delta, out = day01._build_automaton({b'ab': 1, b'b': 2, b'bab': 3})
+    matches = []
+    state = 0
+    for b in b'xbabab':
+        state = delta[state << 8 | b]
+        matches.append(out[state] - 1)
+    # 'ab' and 'b' also end where 'bab' does, the longest of them is reported
+    assert matches == [-1, 2, -1, 3, -1, 3]
+
+
+# every line has a real digit, so part1 applies as well
+MIXED = """1abc2
+pqr3stu8vwx
+a1b2c3d4e5f
+treb7uchet
+xtwone3four
+4nineeightseven2
+zoneight234
+eightwo7
+ninine9
+5"""
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Cut LineSource chunks every few bytes, so lines end up split across chunk requests."""
+    monkeypatch.setattr(stream.LineSource.chunks, '__defaults__', (5,))
+
+
+@pytest.mark.parametrize('text', [MIXED, MIXED + '\n'], ids=['no-final-newline', 'final-newline'])
+def test_ranges_sum_to_reference_for_any_split(solve, write_input, small_chunks, text):
+    answers = solve(PUZZLE, text, ['part1', 'part2'])
+    path = write_input(text)
+    for n in range(1, len(text) + 1):
+        ranges = stream.split(path, n)
+        assert sum(day01._digits_range(path, a, b) for a, b in ranges) == answers['part1']
+        assert sum(day01._scan_range(path, a, b) for a, b in ranges) == answers['part2']
+
+
+def test_chunks_end_on_line_boundaries(write_input):
+    # small sizes ask for cuts inside 'eightwo' and 'sevenine'
+    data = b'1eightwo\nxsevenine2\n3\n'
+    path = write_input(data.decode())
+    with stream.LineSource(path) as source:
+        for size in range(1, len(data) + 1):
+            chunks = [chunk.tobytes() for chunk in source.chunks(size)]
+            assert b''.join(chunks) == data
+            assert all(chunk.endswith(b'\n') for chunk in chunks)
+            assert sum(day01._calibration_sum(c, day01.WORD_SCANNER) for c in chunks) == 12 + 72 + 33
+
+
+def test_parallel_variants_on_a_pool(solve, write_input, monkeypatch):
+    # a tiny CHUNK_SIZE lets map_ranges start a pool for a small file
+    monkeypatch.setattr(stream, 'CHUNK_SIZE', 16)
+    text = (MIXED + '\n') * 4
+    answers = solve(PUZZLE, text, ['part1', 'part2'])
+    path = write_input(text)
+    assert len(stream.split(path, 3)) == 3
+    assert day01.part1_parallel(path, workers=3) == answers['part1']
+    assert day01.part2_parallel(path, workers=3) == answers['part2']
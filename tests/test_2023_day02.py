@@ -0,0 +1,106 @@
+"""2023 day 2: games stored as columns of colour maxima, and the bag limit index over them."""
+import random
+from array import array
+
+import pytest
+
+from conftest import load_puzzle
+
+
+PUZZLE = load_puzzle(2023, 2)
+day02 = PUZZLE.load()
+
+SAMPLE = """Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
+"""
+
+# colours never drawn, limits met exactly and exceeded by one, and no final newline
+EDGE_CASES = """Game 7: 12 red, 13 green, 14 blue
+Game 8: 13 red
+Game 9: 2 green; 14 blue
+Game 10: 1 red, 1 green; 15 blue
+Game 11: 3 blue"""
+
+
+def test_game_maxima():
+    assert day02.game_maxima('Game 12: 3 blue; 4 red, 2 blue; 1 green\n') == (12, 4, 1, 3)
+    assert day02.game_maxima('Game 5: 2 red') == (5, 2, 0, 0)
+
+
+def test_parse_columns(write_input):
+    puzzle_input = day02.parse_input(str(write_input(EDGE_CASES)))
+    assert puzzle_input == {'ids': array('q', [7, 8, 9, 10, 11]),
+                            'max_red': array('q', [12, 13, 0, 1, 0]),
+                            'max_green': array('q', [13, 0, 2, 1, 0]),
+                            'max_blue': array('q', [14, 0, 14, 15, 3])}
+
+
+@pytest.mark.parametrize('text, part1, part2', [(SAMPLE, 8, 2286), (EDGE_CASES, 27, 2199)],
+                         ids=['sample', 'edge-cases'])
+def test_column_parts_and_streams(solve, text, part1, part2):
+    answers = solve(PUZZLE, text, ['part1', 'part2', 'part1_stream', 'part2_stream'])
+    assert answers == {'part1': part1, 'part2': part2, 'part1_stream': part1, 'part2_stream': part2}
+
+
+def test_runs_as_script(run_main):
+    assert run_main(PUZZLE, SAMPLE) == ['8', '2286']
+
+
+def possible_ids(columns: dict, red: int, green: int, blue: int) -> int:
+    return sum(i for i, r, g, b in zip(*columns.values()) if r <= red and g <= green and b <= blue)
+
+
+# below every maximum, on them exactly, between them, and above all of them
+BAGS = [(red, green, blue) for red in (0, 1, 12, 13, 20, 99) for green in (0, 2, 13, 99)
+        for blue in (0, 3, 14, 15, 99)]
+
+
+@pytest.fixture(params=['table', 'coarse-8', 'coarse-27'])
+def index_kind(request, monkeypatch):
+    """
+    Build BagIndex over every distinct value, and with budgets that leave one
+    and two boundaries per axis, so most games are answered from the slabs.
+    """
+    if request.param != 'table':
+        monkeypatch.setattr(day02, 'MAX_INDEX_CELLS', int(request.param.split('-')[1]))
+    return request.param
+
+
+@pytest.mark.parametrize('text', [SAMPLE, EDGE_CASES, SAMPLE + EDGE_CASES], ids=['sample', 'edge-cases', 'both'])
+def test_bag_index_matches_scan(write_input, index_kind, text):
+    columns = day02.parse_input(str(write_input(text)))
+    index = day02.BagIndex(*columns.values())
+    assert (index.slabs is None) == (index_kind == 'table')
+    assert index.query_many(BAGS) == [possible_ids(columns, *bag) for bag in BAGS]
+
+
+def test_bag_index_without_games(index_kind):
+    index = day02.BagIndex(array('q'), array('q'), array('q'), array('q'))
+    assert index.query_many([(0, 0, 0), (12, 13, 14)]) == [0, 0]
+
+
+def test_part1_index_matches_part1(solve, index_kind):
+    answers = solve(PUZZLE, SAMPLE + EDGE_CASES, ['part1', 'part1_index'])
+    assert answers['part1_index'] == answers['part1'] == 8 + 27
+
+
+@pytest.mark.parametrize('budget', [8, 64, 1000, 30 ** 3])
+def test_coarse_index_matches_brute_force(monkeypatch, budget):
+    monkeypatch.setattr(day02, 'MAX_INDEX_CELLS', budget)
+    rng = random.Random(budget)
+    n = 400
+    # a heavy value on each axis, so boundaries have to skip repeats
+    columns = {'ids': array('q', range(1, n + 1))}
+    for color in ('max_red', 'max_green', 'max_blue'):
+        columns[color] = array('q', (rng.choice([rng.randrange(60), 7]) for _ in range(n)))
+    index = day02.BagIndex(*columns.values())
+    assert all(len(axis) + 1 <= round(budget ** (1 / 3)) for axis in index.axes)
+
+    # each slab holds the games strictly between two boundaries: at most n/k of them
+    for axis, slabs in zip(index.axes, index.slabs):
+        assert max(len(games) for games, _ in slabs) <= n // len(axis) + 1
+    bags = [tuple(rng.randrange(-1, 65) for _ in range(3)) for _ in range(300)]
+    assert index.query_many(bags) == [possible_ids(columns, *bag) for bag in bags]
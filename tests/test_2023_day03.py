@@ -0,0 +1,92 @@
+"""2023 day 3: part numbers through the symbol mask, gears through the label grid, and both streamed."""
+import pytest
+
+from aoc.grid import Grid
+from conftest import load_puzzle
+
+
+PUZZLE = load_puzzle(2023, 3)
+day03 = PUZZLE.load()
+
+SAMPLE = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+
+# (schematic, part1, part2)
+CASES = {
+    'sample': (SAMPLE, 4361, 467835),
+    # a symbol on the last row, touching a number diagonally
+    'last-row-symbol': ('.....\n.12..\n...$.\n', 12, 0),
+    # gears on the first and the last row, numbers against both edges
+    'edge-rows': ('3*4..\n.....\n12*34\n', 53, 420),
+    # a number ending a row is not next to a symbol starting the next one,
+    # equal numbers make a gear, and a star with three numbers is not one
+    'wrap-and-triples': ('..123\n#....\n5*5..\n.....\n1.1..\n.*...\n1....\n', 13, 25),
+    # one number touching a gear in three cells is counted once
+    'wide-number': ('.....\n.123.\n..*..\n..4..\n', 127, 492),
+}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_part1_mask_matches_part1(solve, case):
+    text, part1, _ = CASES[case]
+    assert solve(PUZZLE, text, ['part1', 'part1_mask']) == {'part1': part1, 'part1_mask': part1}
+
+
+def test_symbol_mask_marks_symbols_and_neighbours():
+    grid = Grid(['.....\n', '..#..\n', '.....\n', '....*\n'], border='.')
+    mask = day03.symbol_mask(grid)
+    rows = [mask[grid.index(i, 0):grid.index(i, 0) + grid.n_cols] for i in range(grid.n_rows)]
+    assert rows == [b'\0\1\1\1\0', b'\0\1\1\1\0', b'\0\1\1\1\1', b'\0\0\0\1\1']
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_part2_labels_matches_part2(solve, case):
+    text, _, part2 = CASES[case]
+    assert solve(PUZZLE, text, ['part2', 'part2_labels']) == {'part2': part2, 'part2_labels': part2}
+
+
+def test_number_labels():
+    grid = Grid(['12.3\n', '..45\n'], border='.')
+    labels, numbers = day03.number_labels(grid)
+    assert numbers == [12, 3, 45]
+    rows = [labels[grid.index(i, 0):grid.index(i, 0) + grid.n_cols].tolist() for i in range(grid.n_rows)]
+    assert rows == [[1, 1, 0, 2], [0, 0, 3, 3]]
+    # the padding holds no labels
+    assert sum(labels) == sum(sum(row) for row in rows)
+
+
+STREAM_CASES = dict(CASES, **{
+    'one-row': ('12*34\n', 46, 408),
+    'two-rows': ('12...\n..*34\n', 46, 408),
+    'no-final-newline': ('5*5..\n.....', 10, 25),
+})
+
+
+@pytest.mark.parametrize('case', STREAM_CASES)
+def test_streams_match_parts(solve, case):
+    text, part1, part2 = STREAM_CASES[case]
+    answers = solve(PUZZLE, text, ['part1', 'part2', 'part1_stream', 'part2_stream'])
+    assert answers == {'part1': part1, 'part2': part2, 'part1_stream': part1, 'part2_stream': part2}
+
+
+def test_stream_rows_yields_each_row_once(write_input):
+    text = CASES['edge-rows'][0]
+    assert list(day03.stream_rows(write_input(text))) == [(7, 12), (0, 0), (46, 408)]
+
+
+def test_stream_rejects_ragged_rows(write_input):
+    with pytest.raises(ValueError):
+        list(day03.stream_rows(write_input('12*..\n34\n')))
+
+
+def test_runs_as_script(run_main):
+    assert run_main(PUZZLE, SAMPLE) == ['Sum of part numbers 4361', 'Gear ratio: 467835']
@@ -0,0 +1,69 @@
+"""2023 day 4: cards as bitmasks, copies through a difference array and a streamed window."""
+import pytest
+
+from conftest import load_puzzle
+
+
+PUZZLE = load_puzzle(2023, 4)
+day04 = PUZZLE.load()
+
+SAMPLE = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
+"""
+
+CASES = {
+    'sample': SAMPLE,
+    'no-matches': 'Card 1: 1 2 | 3 4\nCard 2: 5 6 | 7 8\nCard 3: 9 | 10\n',
+    # the first card wins more cards than follow it
+    'wins-past-end': 'Card 1: 1 2 3 | 1 2 3\nCard 2: 4 | 4\n',
+    # wins running to the last card, number 0, and no final newline
+    'chain': 'Card 1: 0 1 | 0 1\nCard 2: 2 | 2\nCard 3: 3 | 4\nCard 4: 99 5 | 99 5',
+    'single-card': 'Card 1: 7 | 7\n',
+}
+
+
+def copies_by_queue(text: str) -> int:
+    """Card count by handing out every copy one at a time."""
+    wins = []
+    for card in text.splitlines():
+        winners, entries = card.split(':')[1].split('|')
+        wins.append(len(set(winners.split()) & set(entries.split())))
+
+    queue = list(range(len(wins)))
+    for k in queue:
+        queue += range(k + 1, min(len(wins), k + 1 + wins[k]))
+    return len(queue)
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_part2_matches_copying_cards_one_by_one(solve, case):
+    expected = copies_by_queue(CASES[case])
+    assert solve(PUZZLE, CASES[case], ['part2', 'part2_stream']) == \
+        {'part2': expected, 'part2_stream': expected}
+
+
+def test_sample_answer(solve):
+    assert solve(PUZZLE, SAMPLE, ['part2'])['part2'] == 30
+
+
+def test_card_masks():
+    assert day04.card_masks('Card 3: 0 5 | 5 127\n') == (1 | 1 << 5, 1 << 5 | 1 << 127)
+    with pytest.raises(ValueError):
+        day04.card_masks(f'Card 1: {64 * day04.WORDS} | 1')
+
+
+def test_match_counts_across_words(write_input):
+    # matches on both sides of the 64 bit word boundary
+    columns = day04.parse_input(str(write_input('Card 1: 1 63 64 100 | 63 64 100 2\nCard 2: 1 | 2\n')))
+    assert len(columns['winners']) == len(columns['entries']) == 2 * day04.WORDS
+    assert day04.match_counts(**columns) == [3, 0]
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_part1_stream_matches_part1(solve, case):
+    answers = solve(PUZZLE, CASES[case], ['part1', 'part1_stream'])
+    assert answers['part1_stream'] == answers['part1']
@@ -0,0 +1,108 @@
+"""2024 day 1: location lists as sorted typed arrays, and merged from disk within a budget."""
+from array import array
+from collections import Counter
+
+import pytest
+
+from aoc import extsort
+from conftest import load_puzzle
+
+
+PUZZLE = load_puzzle(2024, 1)
+day01 = PUZZLE.load()
+
+SAMPLE = """3   4
+4   3
+2   5
+1   3
+3   9
+3   3
+"""
+
+CASES = {
+    'sample': SAMPLE,
+    'single-pair': '5   5\n',
+    # repeated ids on both sides, ids missing on the other side, no final newline
+    'repeats': '7   1\n7   7\n1   7\n9   7\n7   2\n2   8',
+    'disjoint': '1   4\n2   5\n3   6\n',
+    'large-ids': '99999   10000\n10000   99999\n50000   50000\n',
+}
+
+
+def reference(text: str) -> tuple[int, int]:
+    left, right = zip(*(map(int, line.split()) for line in text.splitlines()))
+    counts = Counter(right)
+    return (sum(abs(l - r) for l, r in zip(sorted(left), sorted(right))),
+            sum(l * counts[l] for l in left))
+
+
+def test_parse_sorted_columns(write_input):
+    assert day01.parse_input(str(write_input(SAMPLE))) == {'left': array('q', [1, 2, 3, 3, 3, 4]),
+                                                           'right': array('q', [3, 3, 3, 4, 5, 9])}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_parts_match_reference(solve, case):
+    part1, part2 = reference(CASES[case])
+    answers = solve(PUZZLE, CASES[case], ['part1', 'part2', 'part1_stream', 'part2_stream'])
+    assert answers == {'part1': part1, 'part2': part2, 'part1_stream': part1, 'part2_stream': part2}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_numpy_variants_match_reference(solve, case):
+    pytest.importorskip('numpy')
+    part1, part2 = reference(CASES[case])
+    assert solve(PUZZLE, CASES[case], ['part1_numpy', 'part2_numpy']) == \
+        {'part1_numpy': part1, 'part2_numpy': part2}
+
+
+# below one value, a few values per run, and the AOC_SORT_BUDGET default
+@pytest.mark.parametrize('budget', [1, 200, '1K', None])
+@pytest.mark.parametrize('case', CASES)
+def test_merge_pass_matches_reference(write_input, case, budget):
+    assert day01.merge_pass(write_input(CASES[case]), budget) == reference(CASES[case])
+
+
+def test_external_variants(solve, monkeypatch):
+    # a budget smaller than one run spills every value to its own run
+    monkeypatch.setenv('AOC_SORT_BUDGET', '64')
+    part1, part2 = reference(CASES['repeats'])
+    assert solve(PUZZLE, CASES['repeats'], ['part1_external', 'part2_external']) == \
+        {'part1_external': part1, 'part2_external': part2}
+
+
+@pytest.fixture
+def sorters(monkeypatch):
+    """ExternalSorters created while the test runs, kept for inspection."""
+    created = []
+
+    class Recording(extsort.ExternalSorter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(extsort, 'ExternalSorter', Recording)
+    return created
+
+
+@pytest.mark.parametrize('budget', [1, 2, 5])
+def test_merge_pass_keeps_tiny_budgets(write_input, sorters, budget):
+    text = CASES['repeats']
+    assert day01.merge_pass(write_input(text), budget) == reference(text)
+    # each column sorter gets half the budget, at least a byte, and so one value per run
+    assert [(s.budget, len(s.runs)) for s in sorters] == [(max(1, budget // 2), 6)] * 2
+
+
+def test_merge_pass_with_more_runs_than_fanin(write_input, sorters, monkeypatch):
+    monkeypatch.setattr(extsort, 'MERGE_FANIN', 3)
+    text = ''.join(f'{(7 * k) % 101}   {(13 * k) % 97}\n' for k in range(200))
+    assert day01.merge_pass(write_input(text), 1) == reference(text)
+    # every value was its own run, merged down to at most three per cursor
+    assert [(s.fanin, s.count, len(s.runs) <= 3) for s in sorters] == [(3, 200, True)] * 2
+
+
+def test_external_parts_share_one_pass(solve, sorters):
+    part1, part2 = reference(SAMPLE)
+    assert solve(PUZZLE, SAMPLE, ['part1_external', 'part2_external']) == \
+        {'part1_external': part1, 'part2_external': part2}
+    assert len(sorters) == 2
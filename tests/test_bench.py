@@ -0,0 +1,100 @@
+"""aoc.bench: part timings, memo and counter reports, and the regression gates."""
+import json
+
+import pytest
+
+from aoc import bench
+
+
+def test_time_part_clears_memo_tables(puzzle_tree):
+    root, puzzles = puzzle_tree
+    module = puzzles[1].load()
+    puzzle_input = puzzles[1].parse(root)
+    stats = bench.time_part(module.part2, puzzle_input, module, warmup=1, repeats=3)
+    assert stats['answer'] == 14
+    assert stats['repeats'] == 3
+    assert 0 <= stats['min'] <= stats['median'] and stats['stdev'] >= 0
+    # cleared before every call, so only the last call's misses remain
+    assert module.square.cache_info()[:2] == (0, 3)
+
+    # kept warm, both calls hit the table the last call left
+    bench.time_part(module.part2, puzzle_input, module, warmup=0, repeats=2, warm_cache=True)
+    assert module.square.cache_info()[:2] == (6, 3)
+
+
+def test_bench_puzzle(puzzle_tree):
+    root, puzzles = puzzle_tree
+    results = bench.bench_puzzle(puzzles[1], root, memory='tracemalloc', count=True,
+                                 warmup=0, repeats=2)
+    assert sorted(results) == ['2099/day01:part1', '2099/day01:part2', '2099/day01:part2_squares']
+    assert [results[key]['answer'] for key in sorted(results)] == [6, 14, 14]
+    part2 = results['2099/day01:part2']
+    assert part2['memo']['square']['misses'] == 3
+    assert part2['counters']['part2'] == {'calls': 1, 'pushes': 0, 'pops': 0, 'stale': 0,
+                                          'expanded': 3, 'max_frontier': 0, 'max_depth': 3}
+    assert part2['memory']['peak_bytes'] >= 0
+    assert 'memo' not in results['2099/day01:part1']
+    assert 'counters' not in results['2099/day01:part1']
+
+
+def test_bench_puzzle_errors(puzzle_tree, tmp_path):
+    root, puzzles = puzzle_tree
+    assert bench.bench_puzzle(puzzles[2], root, warmup=0, repeats=1) == \
+        {'2099/day02:part1': {'error': "ArithmeticError('no answer')"}}
+    assert list(bench.bench_puzzle(puzzles[1], tmp_path / 'elsewhere')) == ['2099/day01:*']
+
+
+BASELINE = {'a:part1': {'median': 1.0}, 'a:part2': {'median': 0.001},
+            'a:part3': {'median': 1.0, 'memory': {'mode': 'tracemalloc', 'peak_bytes': 10 << 20}},
+            'a:part4': {'median': 1.0, 'memory': {'mode': 'rss', 'peak_bytes': 10 << 20}}}
+
+
+def test_find_regressions():
+    results = {'a:part1': {'median': 1.3}, 'a:part2': {'median': 0.004},
+               'a:part3': {'median': 1.1}, 'new:part1': {'median': 9.0}, 'a:part4': {'error': 'x'}}
+    assert bench.find_regressions(results, BASELINE) == [('a:part1', 1.0, 1.3)]
+    assert bench.find_regressions(results, BASELINE, threshold=0.05) == \
+        [('a:part1', 1.0, 1.3), ('a:part3', 1.0, 1.1)]
+    # too fast to gate on unless the floor is lowered
+    assert bench.find_regressions(results, BASELINE, min_seconds=0.0001)[-1] == \
+        ('a:part2', 0.001, 0.004)
+
+
+def test_find_memory_regressions():
+    results = {'a:part3': {'memory': {'mode': 'tracemalloc', 'peak_bytes': 13 << 20}},
+               'a:part4': {'memory': {'mode': 'tracemalloc', 'peak_bytes': 90 << 20}},
+               'a:part1': {'memory': {'mode': 'tracemalloc', 'peak_bytes': 90 << 20}}}
+    # part4 was measured another way and part1 has no memory baseline
+    assert bench.find_memory_regressions(results, BASELINE) == [('a:part3', 10 << 20, 13 << 20)]
+    assert bench.find_memory_regressions(results, BASELINE, threshold=0.5) == []
+    assert bench.find_memory_regressions(results, BASELINE, min_bytes=100 << 20) == []
+
+
+@pytest.fixture
+def bench_main(puzzle_tree, monkeypatch, tmp_path):
+    root, puzzles = puzzle_tree
+    monkeypatch.setattr(bench, 'discover', lambda years, days: [puzzles[1]])
+    baseline = tmp_path / 'baseline.json'
+
+    def run(*args) -> int:
+        return bench.main(['--input-root', str(root), '--baseline', str(baseline), '--warmup', '0',
+                           '--repeats', '1', '--no-cache', *args])
+    return run, baseline
+
+
+def test_main_baseline_round_trip(bench_main, capsys):
+    run, baseline = bench_main
+    assert run() == 0
+    assert not baseline.exists()
+    assert run('--update-baseline') == 0
+    assert sorted(json.loads(baseline.read_text())) == \
+        ['2099/day01:part1', '2099/day01:part2', '2099/day01:part2_squares']
+    assert 'median' in capsys.readouterr().out
+
+    # a baseline faster than any part can run
+    stored = json.loads(baseline.read_text())
+    for stats in stored.values():
+        stats['median'] = 1e-9
+    baseline.write_text(json.dumps(stored))
+    assert run('--min-seconds', '0') == 1
+    assert capsys.readouterr().out.count('REGRESSION') == 3
@@ -0,0 +1,184 @@
+"""aoc.cache: field encodings, damaged cache files, and parser fingerprints."""
+import importlib.util
+from array import array
+
+import pytest
+
+from aoc import cache
+from aoc.grid import Grid
+from conftest import load_puzzle
+
+
+FIELDS = {
+    'grid': (Grid(['#.S', '.#.'], border='#'), 'grid'),
+    'array': (array('Q', [0, 2 ** 64 - 1, 7]), 'array'),
+    'ints': ([3, -1, 2 ** 63 - 1, -2 ** 63], 'ints'),
+    'int_tuple': ((4, 5, 6), 'ints'),
+    'strs': (['ab', '', 'ünï', 'x\ny'], 'strs'),
+    'str': ('some text\n', 'str'),
+    'int_records': ([(1, 2), (3, -4), (5, 6)], 'int_records'),
+    'int_rows': ([[1], [2, 3, 4], []], 'int_rows'),
+    # 2024 day 14 robots: position and velocity pairs
+    'robots': ([[(0, 4), (3, -3)], [(6, 3), (-1, -3)], [(100, 102), (99, -99)]], 'records'),
+    # 2024 day 24 wires and gates
+    'wires': ([('x00', 1), ('y01', 0), ('x10', 1)], 'records'),
+    'gates': ([[['x00', 'AND', 'y00'], 'z00'], [['ntg', 'XOR', 'fgs'], 'mjb'],
+               [['a', 'OR', 'bb'], 'z12']], 'records'),
+    # 2024 day 13 claw machines, day 23 links and day 25 schematics
+    'machines': ([{'A': (94, 34), 'B': (22, 67), 'prize': (8400, 5400)},
+                  {'A': (26, 66), 'B': (67, 21), 'prize': (10 ** 13, 12748)}], 'records'),
+    'links': ([('kh', 'tc'), ('qp', 'kh')], 'records'),
+    'schematics': ([['#####', '.####'], ['#####', '##.##']], 'records'),
+    'wide_ints': ([(1, 2 ** 40), (-2 ** 62, 3)], 'int_records'),
+    'mixed_widths': ([(1, 'a', -2 ** 40), (-129, 'long name', 2)], 'records'),
+    # 2024 day 7 equations are ragged, and None has no binary form
+    'equations': ([(190, [10, 19]), (3267, [81, 40, 27])], 'pickle'),
+    'nul_strs': ([('a\0', 1), ('b', 2)], 'pickle'),
+    'bools': ([(True, 1), (False, 2)], 'pickle'),
+    'none': (None, 'pickle'),
+    'empty': ([], 'pickle'),
+}
+
+
+@pytest.mark.parametrize('name', FIELDS)
+def test_round_trip(tmp_path, name):
+    value, kind = FIELDS[name]
+    assert cache._encode(value)[0] == kind
+    path = tmp_path / 'entry.bin'
+    cache.write(path, {name: value})
+    loaded = cache.read(path)[name]
+    if isinstance(value, Grid):
+        assert (str(loaded), loaded.border, loaded.stride) == (str(value), value.border, value.stride)
+    else:
+        assert loaded == value
+        assert type(loaded) is type(value)
+
+
+def test_records_use_narrow_fields():
+    meta = cache._encode(FIELDS['mixed_widths'][0])[1]
+    assert meta['format'] == '<h9sq'
+    assert cache._encode(FIELDS['robots'][0])[1]['format'] == '<bbbb'
+
+
+def test_ndarray_round_trip(tmp_path):
+    np = pytest.importorskip('numpy')
+    value = np.arange(12, dtype=np.int32).reshape(3, 4)
+    path = tmp_path / 'entry.bin'
+    cache.write(path, {'a': value})
+    assert (cache.read(path)['a'] == value).all()
+
+
+@pytest.fixture
+def enable_cache(tmp_path, monkeypatch):
+    """Cache turned on under tmp_path; returns the paths of the entries written."""
+    monkeypatch.setenv(cache.ENV_ENABLED, '1')
+    monkeypatch.setenv(cache.ENV_DIR, str(tmp_path / 'cache'))
+    written = []
+
+    def recording(path, puzzle_input, write=cache.write):
+        written.append(path)
+        write(path, puzzle_input)
+
+    # an entry is written exactly when the input had to be parsed
+    monkeypatch.setattr(cache, 'write', recording)
+    return written
+
+
+ROBOTS = 'p=0,4 v=3,-3\np=6,3 v=-1,-3\np=10,3 v=-1,2\n'
+WIRES = 'x00: 1\nx01: 0\ny00: 1\n\nx00 AND y00 -> z00\nx01 XOR y00 -> z01\n'
+
+
+@pytest.mark.parametrize('year, day, text', [(2024, 14, ROBOTS), (2024, 24, WIRES)])
+def test_second_load_reads_the_entry(write_input, enable_cache, year, day, text):
+    module = load_puzzle(year, day).load()
+    filename = write_input(text)
+    name = f'{year}/day{day:02}'
+    first = cache.load_or_parse(module, name, filename)
+    assert first == module.parse_input(str(filename))
+    assert cache.load_or_parse(module, name, filename) == first
+    assert enable_cache == [cache.entry_path(module, name, filename)]
+    # stored as binary records rather than pickled
+    assert {cache._encode(value)[0] for value in first.values()} == {'records'}
+
+
+DAMAGE = {
+    'truncated-payload': lambda data: data[:-5],
+    'truncated-header': lambda data: data[:20],
+    'header-only': lambda data: data[:12],
+    'empty': lambda data: b'',
+    'bad-magic': lambda data: b'XXXX' + data[4:],
+    'bad-header': lambda data: data[:8] + b'}' + data[9:],
+    'old-format': lambda data: data.replace(b'"format": 1', b'"format": 0', 1),
+}
+
+
+@pytest.mark.parametrize('damage', DAMAGE)
+def test_damaged_entry_is_parsed_again(write_input, enable_cache, damage):
+    module = load_puzzle(2024, 14).load()
+    filename = write_input(ROBOTS)
+    expected = cache.load_or_parse(module, '2024/day14', filename)
+    path = enable_cache[0]
+    path.write_bytes(DAMAGE[damage](path.read_bytes()))
+
+    assert cache.load_or_parse(module, '2024/day14', filename) == expected
+    assert enable_cache == [path, path]
+    # the entry was rewritten whole
+    assert cache.read(path) == expected
+
+
+PARSER = '''
+SCALE = 1
+
+
+def numbers(line):
+    return [SCALE * int(x) for x in line.split(',')]
+
+
+def parse_input(filename):
+    with open(filename) as f:
+        return {'rows': [numbers(line) for line in f]}
+'''
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    """A puzzle module whose parser calls a helper that reads a constant."""
+    path = tmp_path / 'parser.py'
+    path.write_text(PARSER)
+    spec = importlib.util.spec_from_file_location('parser_under_test', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # only code in the repo is fingerprinted, and this module is outside it
+    monkeypatch.setattr(cache, '_REPO_ROOT', str(tmp_path))
+    return module
+
+
+def test_unchanged_parser_hits(write_input, enable_cache, parser):
+    filename = write_input('1,2\n3,4\n')
+    fingerprint = cache.parser_fingerprint(parser)
+    for _ in range(2):
+        assert cache.load_or_parse(parser, 'test', filename) == {'rows': [[1, 2], [3, 4]]}
+    assert cache.parser_fingerprint(parser) == fingerprint
+    assert len(enable_cache) == 1
+
+
+@pytest.mark.parametrize('change', ['helper', 'constant', 'parse_input'])
+def test_changed_parser_misses(write_input, enable_cache, parser, change):
+    filename = write_input('1,2\n3,4\n')
+    cache.load_or_parse(parser, 'test', filename)
+    old = enable_cache[0]
+
+    if change == 'helper':
+        parser.numbers.__code__ = (lambda line: [-int(x) for x in line.split(',')]).__code__
+        expected = {'rows': [[-1, -2], [-3, -4]]}
+    elif change == 'constant':
+        parser.SCALE = 10
+        expected = {'rows': [[10, 20], [30, 40]]}
+    else:
+        parser.parse_input = lambda filename: {'rows': []}
+        expected = {'rows': []}
+
+    assert cache.load_or_parse(parser, 'test', filename) == expected
+    assert enable_cache[1] != old
+    # the entry from the old parser is replaced
+    assert not old.exists()
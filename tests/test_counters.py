@@ -0,0 +1,86 @@
+"""aoc.counters: opt-in work counters for the search loops."""
+import types
+
+import pytest
+
+from aoc import counters
+
+
+@pytest.fixture(autouse=True)
+def no_records(monkeypatch):
+    # set first so that whatever the tests enable is undone afterwards
+    monkeypatch.setenv(counters.ENV_COUNTERS, '0')
+    monkeypatch.delenv(counters.ENV_COUNTERS)
+    monkeypatch.setattr(counters, 'REGISTRY', {})
+
+
+def search(module: str, pushes: int, depth: int):
+    probe = counters.probe(module, 'search')
+    for k in range(pushes):
+        probe.push(k + 1)
+    probe.pop()
+    probe.skip()
+    probe.expand(depth)
+    return probe
+
+
+def test_off_by_default():
+    probe = search('m', 3, 2)
+    assert probe is counters.NULL
+    assert not probe
+    assert probe.as_dict() == dict.fromkeys(counters.FIELDS, 0)
+    assert counters.stats() == {}
+
+
+@pytest.mark.parametrize('value, on', [('1', True), ('yes', True), ('0', False), ('', False)])
+def test_environment(monkeypatch, value, on):
+    monkeypatch.setenv(counters.ENV_COUNTERS, value)
+    assert counters.enabled() is on
+
+
+def test_probe_counts():
+    counters.enable()
+    probe = search('m', 3, 2)
+    assert probe.as_dict() == {'pushes': 3, 'pops': 1, 'stale': 1, 'expanded': 1,
+                               'max_frontier': 3, 'max_depth': 2}
+
+
+def test_summaries_sum_counts_and_take_maxima():
+    counters.enable()
+    search('pkg.a', 3, 5)
+    search('pkg.a', 1, 9)
+    search('pkg.ab', 7, 1)
+    expected = {'calls': 2, 'pushes': 4, 'pops': 2, 'stale': 2, 'expanded': 2,
+                'max_frontier': 3, 'max_depth': 9}
+    assert counters.stats()['pkg.a.search'] == expected
+    # a module name that prefixes another one does not take its records
+    assert counters.module_stats(types.ModuleType('pkg.a')) == {'search': expected}
+    assert counters.summarize([]) == dict.fromkeys(('calls',) + counters.FIELDS, 0)
+
+
+def test_reset():
+    counters.enable()
+    search('pkg.a', 1, 1)
+    search('pkg.b', 1, 1)
+    counters.reset(types.ModuleType('pkg.a'))
+    assert list(counters.stats()) == ['pkg.b.search']
+    counters.reset()
+    assert counters.stats() == {}
+
+
+def test_counting_block(monkeypatch):
+    module = types.ModuleType('pkg.a')
+    search('pkg.a', 1, 1)
+    with counters.counting(module):
+        assert counters.enabled()
+        search('pkg.a', 2, 1)
+    assert not counters.enabled()
+    search('pkg.a', 4, 1)
+    assert counters.module_stats(module)['search']['pushes'] == 2
+
+    # an explicit setting is restored afterwards
+    monkeypatch.setenv(counters.ENV_COUNTERS, '1')
+    with counters.counting(module):
+        search('pkg.a', 3, 1)
+    assert counters.enabled()
+    assert counters.module_stats(module)['search']['calls'] == 1
@@ -0,0 +1,96 @@
+"""aoc.daemon: warm modules and memo tables served over a Unix socket."""
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from aoc import daemon
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about a hundred bytes, too few for tmp_path
+    with tempfile.TemporaryDirectory(prefix='aoc') as tmp:
+        yield Path(tmp) / 'daemon.sock'
+
+
+@pytest.fixture
+def server(puzzle_tree, socket_path):
+    """A daemon serving the made-up puzzles on a thread."""
+    root, puzzles = puzzle_tree
+    state = daemon.SolverState(root)
+    state.puzzles = {(p.year, p.day): p for p in puzzles.values()}
+    with daemon.SolverServer(socket_path, state) as srv:
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        yield srv
+        srv.shutdown()
+        thread.join()
+
+
+def ask(server, **payload) -> dict:
+    return daemon.request(payload, server.server_address, timeout=10)
+
+
+def test_solve_keeps_the_module_warm(server, write_input):
+    first = ask(server, op='solve', year=2099, day=1)
+    assert (first['status'], first['warm']) == ('ok', False)
+    assert {name: part['answer'] for name, part in first['parts'].items()} == \
+        {'part1': 6, 'part2': 14}
+    assert first['memo']['square']['misses'] == 3
+    assert first['latency_seconds'] >= 0
+
+    again = ask(server, op='solve', year=2099, day=1, input=str(write_input('2\n4\n')),
+                parts=['part2'])
+    assert again['warm']
+    assert again['parts']['part2']['answer'] == 20
+    # 2 was squared on the first request
+    assert (again['memo']['square']['hits'], again['memo']['square']['misses']) == (1, 4)
+
+
+def test_errors_are_responses(server):
+    assert ask(server, op='solve', year=2099, day=2)['status'] == 'error'
+    assert 'no puzzle module' in ask(server, op='solve', year=1999, day=1)['error']
+    assert ask(server, op='dance') == {'status': 'error', 'error': "unknown op 'dance'",
+                                       'latency_seconds': pytest.approx(0, abs=1)}
+    # a malformed request does not take the daemon down
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.server_address)
+        with sock.makefile('rwb') as stream:
+            stream.write(b'not json\n{"op": "ping"}\n')
+            stream.flush()
+            assert b'JSONDecodeError' in stream.readline()
+            assert b'"ok"' in stream.readline()
+
+
+def test_stats_and_stop(server):
+    assert ask(server, op='ping')['status'] == 'ok'
+    ask(server, op='solve', year=2099, day=1)
+    stats = ask(server, op='stats')
+    assert stats['loaded'] == ['2099/day01']
+    assert stats['requests'] == 3
+    assert stats['memo']['2099/day01']['square']['currsize'] == 3
+
+    assert ask(server, op='stop') == {'status': 'ok', 'stopping': True,
+                                      'latency_seconds': pytest.approx(0, abs=1)}
+
+
+def test_claim_socket(socket_path):
+    # a socket file left behind by a daemon that died is removed
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+        dead.bind(str(socket_path))
+    daemon._claim_socket(socket_path)
+    assert not socket_path.exists()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as alive:
+        alive.bind(str(socket_path))
+        alive.listen()
+        with pytest.raises(RuntimeError, match='already listening'):
+            daemon._claim_socket(socket_path)
+
+
+def test_client_without_daemon(socket_path, capsys):
+    assert daemon.main(['--socket', str(socket_path), 'ping']) == 2
+    assert 'no daemon listening' in capsys.readouterr().err
@@ -0,0 +1,112 @@
+"""aoc.extsort: sorted runs on disk merged back within a budget."""
+import itertools
+import random
+from pathlib import Path
+
+import pytest
+
+from aoc import extsort
+
+
+VALUES = [5, -3, 2 ** 62, 0, 5, -2 ** 63, 7, 7, 7, 1, -1, 42]
+
+
+def test_resolve_budget(monkeypatch):
+    monkeypatch.setenv(extsort.ENV_BUDGET, '2K')
+    assert extsort.resolve_budget() == 2048
+    assert extsort.resolve_budget('1M') == 1 << 20
+    assert extsort.resolve_budget(300) == 300
+    monkeypatch.delenv(extsort.ENV_BUDGET)
+    assert extsort.resolve_budget() == 64 << 20
+
+
+@pytest.mark.parametrize('budget', [1, extsort.ITEM_COST * 3, '1K', None])
+def test_merged_is_sorted(tmp_path, budget):
+    with extsort.ExternalSorter(budget, tmpdir=tmp_path) as sorter:
+        for value in VALUES:
+            sorter.add(value)
+        assert list(sorter.merged()) == sorted(VALUES)
+        assert sorter.count == len(VALUES)
+
+
+def test_budget_below_one_value_spills_every_value(tmp_path):
+    with extsort.ExternalSorter(1, tmpdir=tmp_path) as sorter:
+        for value in VALUES:
+            sorter.add(value)
+        assert sorter.run_items == 1
+        assert len(sorter.runs) == len(VALUES)
+        # a merge budget below one value still reads one value per block
+        assert list(sorter.merged(1)) == sorted(VALUES)
+
+
+def test_independent_cursors(tmp_path):
+    values = random.Random(3).choices(range(-1000, 1000), k=500)
+    with extsort.ExternalSorter(extsort.ITEM_COST * 40, tmpdir=tmp_path) as sorter:
+        for value in values:
+            sorter.add(value)
+        fast, slow = sorter.merged(), sorter.merged()
+        # the fast cursor runs two values ahead for each one the slow cursor reads
+        seen_fast, seen_slow = [], []
+        for value in slow:
+            seen_slow.append(value)
+            seen_fast += itertools.islice(fast, 2)
+        seen_fast += list(fast)
+    assert seen_fast == seen_slow == sorted(values)
+
+
+def test_add_after_merge(tmp_path):
+    with extsort.ExternalSorter(extsort.ITEM_COST * 2, tmpdir=tmp_path) as sorter:
+        for value in (3, 1, 2):
+            sorter.add(value)
+        assert list(sorter.merged()) == [1, 2, 3]
+        for value in (0, 4):
+            sorter.add(value)
+        assert list(sorter.merged()) == [0, 1, 2, 3, 4]
+
+
+def test_empty(tmp_path):
+    with extsort.ExternalSorter(tmpdir=tmp_path) as sorter:
+        assert list(sorter.merged()) == []
+        assert sorter.runs == []
+
+
+def test_close_removes_runs(tmp_path):
+    with extsort.ExternalSorter(1, tmpdir=tmp_path) as sorter:
+        for value in VALUES:
+            sorter.add(value)
+        list(sorter.merged())
+        assert all(Path(run).exists() for run in sorter.runs)
+    assert not any(Path(run).exists() for run in sorter.runs)
+    assert list(tmp_path.iterdir()) == []
+
+
+def open_runs(tmp_path) -> int:
+    """Files under tmp_path this process holds open."""
+    fds = Path('/proc/self/fd')
+    return sum(1 for fd in fds.iterdir() if str(tmp_path) in str(fd.resolve(strict=False)))
+
+
+@pytest.mark.parametrize('fanin', [2, 3, 7])
+def test_more_runs_than_fanin(tmp_path, fanin):
+    values = random.Random(fanin).choices(range(-10 ** 6, 10 ** 6), k=400)
+    with extsort.ExternalSorter(extsort.ITEM_COST * 3, tmpdir=tmp_path, fanin=fanin) as sorter:
+        for value in values:
+            sorter.add(value)
+        # the last value is still in memory until merged() spills it
+        assert len(sorter.runs) == 400 // 3
+        merged = sorter.merged()
+        # intermediate passes leave at most fanin runs, and only those files
+        assert len(sorter.runs) <= fanin
+        assert len(list(Path(sorter.runs[0]).parent.iterdir())) == len(sorter.runs)
+        assert list(merged) == sorted(values)
+
+
+@pytest.mark.skipif(not Path('/proc/self/fd').is_dir(), reason='needs /proc/self/fd')
+def test_open_files_bounded_by_fanin(tmp_path):
+    with extsort.ExternalSorter(1, tmpdir=tmp_path, fanin=4) as sorter:
+        for value in range(300, 0, -1):
+            sorter.add(value)
+        cursors = [sorter.merged(), sorter.merged()]
+        assert [next(c) for c in cursors] == [1, 1]
+        assert open_runs(tmp_path) <= 2 * 4
+        assert list(cursors[0]) == list(range(2, 301))
@@ -0,0 +1,44 @@
+"""aoc.generators: synthetic inputs that the puzzles can actually solve."""
+import re
+from fractions import Fraction
+
+import pytest
+
+from aoc import generators
+from conftest import load_puzzle
+
+
+def presses(machine: str, offset: int) -> tuple[Fraction, Fraction]:
+    """Exact button press counts reaching a claw machine's prize moved out by offset."""
+    a0, a1, b0, b1, p0, p1 = map(int, re.findall(r'\d+', machine))
+    p0, p1 = p0 + offset, p1 + offset
+    det = a0 * b1 - a1 * b0
+    return Fraction(p0 * b1 - b0 * p1, det), Fraction(a0 * p1 - p0 * a1, det)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_claw_machine_presses_are_never_negative(seed):
+    machines = generators.generate(2024, 13, scale=2, seed=seed).strip().split('\n\n')
+    reachable = {0: 0, generators.PRIZE_OFFSET: 0}
+    for machine in machines:
+        for offset in reachable:
+            n_a, n_b = presses(machine, offset)
+            if n_a.denominator == n_b.denominator == 1:
+                assert n_a >= 0 and n_b >= 0, machine
+                reachable[offset] += 1
+    # both parts have something to find, and not everything is reachable
+    assert all(0.1 * len(machines) < count < 0.9 * len(machines) for count in reachable.values())
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_claw_machine_answers(solve, seed):
+    answers = solve(load_puzzle(2024, 13), generators.generate(2024, 13, seed=seed),
+                    ['part1', 'part2'])
+    assert answers['part1'] > 0
+    # part 2 prizes take around 10^11 presses
+    assert answers['part2'] > 10 ** 11
+
+
+def test_deterministic():
+    assert generators.generate(2024, 13, seed=3) == generators.generate(2024, 13, seed=3)
+    assert generators.generate(2024, 13, seed=3) != generators.generate(2024, 13, seed=4)
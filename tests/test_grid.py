@@ -0,0 +1,126 @@
+"""aoc.grid: the padded bytearray grid shared by the map puzzles."""
+import copy
+
+import pytest
+
+from aoc.grid import Grid
+
+
+ROWS = ['#.S\n', '.##\n', 'E..\n', '...\n']
+
+
+@pytest.fixture
+def grid():
+    return Grid(ROWS, border='*')
+
+
+def test_shape_and_padding(grid):
+    assert (grid.n_rows, grid.n_cols, grid.pad, grid.stride) == (4, 3, 1, 5)
+    assert bytes(grid.cells) == b'*****' b'*#.S*' b'*.##*' b'*E..*' b'*...*' b'*****'
+    assert str(grid) == '#.S\n.##\nE..\n...'
+    assert repr(grid) == 'Grid(4x3)'
+
+
+def test_wider_padding():
+    grid = Grid(['ab', 'cd'], border='#', pad=2)
+    assert grid.stride == 6
+    assert bytes(grid.cells) == b'#' * 12 + b'##ab##' b'##cd##' + b'#' * 12
+    assert grid.index(0, 0) == 14
+    assert grid.cells[grid.index(0, 0) + 2 * grid.up] == ord('#')
+
+
+def test_blank_lines_and_ragged_rows():
+    assert str(Grid(['ab\n', '\n', 'cd\n', ''])) == 'ab\ncd'
+    assert Grid([]).n_rows == Grid([]).n_cols == 0
+    with pytest.raises(ValueError):
+        Grid(['abc', 'ab', 'abcd'])
+
+
+def test_index_and_coords_round_trip(grid):
+    for i in range(grid.n_rows):
+        for j in range(grid.n_cols):
+            idx = grid.index(i, j)
+            assert grid.coords(idx) == (i, j)
+            assert grid.in_bounds(idx)
+            assert grid[i, j] == ROWS[i][j]
+    # the padding is addressable but not in bounds
+    assert grid.coords(0) == (-1, -1)
+    assert not grid.in_bounds(0)
+    assert not grid.in_bounds(grid.index(0, 0) + grid.left)
+    assert not grid.in_bounds(grid.index(3, 2) + grid.right)
+    assert not grid.in_bounds(grid.index(3, 2) + grid.down)
+
+
+def test_offsets(grid):
+    start = grid.index(1, 1)
+    assert [grid.coords(start + offset) for offset in grid.orthogonal] == \
+        [(0, 1), (1, 2), (2, 1), (1, 0)]
+    assert [grid.coords(start + offset) for offset in grid.diagonal] == \
+        [(0, 0), (0, 2), (2, 2), (2, 0)]
+    assert len(set(grid.surrounding)) == 8
+
+
+def test_setitem(grid):
+    grid[2, 1] = 'X'
+    assert grid[2, 1] == 'X'
+    assert grid.row(2).tobytes() == b'EX.'
+
+
+def test_indices_and_find(grid):
+    assert [grid.coords(idx) for idx in grid.indices('#')] == [(0, 0), (1, 1), (1, 2)]
+    # the '*' border is never reported
+    assert list(grid.indices('*')) == []
+    assert grid.find_index('S') == grid.index(0, 2)
+    assert grid.find('E') == (2, 0)
+    with pytest.raises(StopIteration):
+        grid.find_index('Z')
+
+
+def test_count(grid):
+    assert [grid.count(c) for c in '#.SE*'] == [3, 7, 1, 1, 0]
+
+
+def test_group_by_char(grid):
+    assert grid.group_by_char(skip='.') == {'#': [(0, 0), (1, 1), (1, 2)], 'S': [(0, 2)],
+                                            'E': [(2, 0)]}
+
+
+def test_rows_and_columns(grid):
+    assert [row.tobytes() for row in grid.rows()] == [r.strip().encode() for r in ROWS]
+    assert [grid.column(j).tobytes() for j in range(grid.n_cols)] == [b'#.E.', b'.#..', b'S#..']
+    # views share memory with the grid
+    grid.column(1)[3] = ord('Y')
+    assert grid[3, 1] == 'Y'
+
+
+def test_copy_is_independent(grid):
+    for other in (grid.copy(), copy.deepcopy(grid)):
+        other[0, 0] = 'Z'
+        assert grid[0, 0] == '#'
+        assert (other.n_rows, other.n_cols, other.orthogonal) == \
+            (grid.n_rows, grid.n_cols, grid.orthogonal)
+
+
+def test_blank():
+    grid = Grid.blank(2, 3, fill='o', border='#')
+    assert str(grid) == 'ooo\nooo'
+    assert grid.cells[0] == ord('#')
+
+
+def test_from_cells_round_trip(grid):
+    other = Grid.from_cells(bytes(grid.cells), grid.n_rows, grid.n_cols, border='*')
+    assert str(other) == str(grid)
+    assert other.surrounding == grid.surrounding
+    with pytest.raises(ValueError):
+        Grid.from_cells(bytes(grid.cells)[:-1], grid.n_rows, grid.n_cols, border='*')
+
+
+def test_to_numpy(grid):
+    np = pytest.importorskip('numpy')
+    view = grid.to_numpy()
+    assert view.shape == (4, 3)
+    assert view.dtype == np.uint8
+    assert bytes(view[0]) == b'#.S'
+    # a view, not a copy
+    view[1, 0] = ord('Q')
+    assert grid[1, 0] == 'Q'
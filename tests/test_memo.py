@@ -0,0 +1,139 @@
+"""aoc.memo: lru_cache compatible memoization with limits and counters."""
+import sys
+
+import pytest
+
+from aoc import memo
+from aoc.memo import memoize
+
+
+@pytest.fixture(autouse=True)
+def no_memo_env(monkeypatch):
+    for name in (memo.ENV_MAXSIZE, memo.ENV_MAX_BYTES, memo.ENV_POLICY):
+        monkeypatch.delenv(name, raising=False)
+
+
+def counted(**limits):
+    """A memoized square that records the arguments it was really called with."""
+    calls = []
+
+    @memoize(**limits)
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+
+    return square, calls
+
+
+def test_parse_bytes():
+    assert memo.parse_bytes('512') == 512
+    assert memo.parse_bytes('2K') == 2048
+    assert memo.parse_bytes('1.5mb') == 3 << 19
+    assert memo.parse_bytes(' 1G ') == 1 << 30
+    assert memo.parse_bytes('') is memo.parse_bytes(None) is None
+
+
+def test_sizeof_counts_shared_objects_once():
+    shared = tuple(range(100))
+    seen = set()
+    first = memo.sizeof((shared, 1), seen=seen)
+    assert memo.sizeof((shared, 2), seen=seen) < first
+    assert memo.sizeof([shared]) > sys.getsizeof(shared)
+
+
+def test_unbounded_sits_on_lru_cache():
+    square, calls = counted()
+    assert square.memo._lru_info is not None
+    assert [square(x) for x in (2, 3, 2, 2, 3)] == [4, 9, 4, 4, 9]
+    assert square(2, offset=1) == 5
+    assert calls == [2, 3, 2]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.evictions) == (3, 3, 3, 0)
+    assert (info.maxsize, info.max_bytes, info.policy) == (None, None, 'lru')
+    # extrapolated from the sampled entries
+    assert info.nbytes >= 3 * memo.ENTRY_OVERHEAD
+    assert square.__name__ == 'square'
+
+
+def test_lru_maxsize_evicts_least_recently_used():
+    square, calls = counted(maxsize=2)
+    for x in (1, 2, 1, 3, 1, 2):
+        square(x)
+    # 2 was evicted by 3 because 1 had been used since
+    assert calls == [1, 2, 3, 2]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.evictions) == (2, 4, 2, 2)
+
+
+def test_fifo_evicts_oldest_regardless_of_use():
+    square, calls = counted(maxsize=2, policy='fifo')
+    assert square.memo._cache is not None
+    for x in (1, 2, 1, 3, 1):
+        square(x)
+    # 1 was the oldest entry when 3 came in
+    assert calls == [1, 2, 3, 1]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.evictions, info.policy) == \
+        (1, 4, 2, 2, 'fifo')
+
+
+def test_max_bytes_budget():
+    entry = memo.sizeof((0,)) + memo.sizeof(0) + memo.ENTRY_OVERHEAD
+    square, calls = counted(max_bytes=3 * entry)
+    for x in range(10):
+        square(x)
+    info = square.cache_info()
+    assert info.nbytes <= info.max_bytes == 3 * entry
+    assert info.currsize == 3
+    assert info.evictions == 7
+    assert info.nbytes == sum(square.memo._sizes.values())
+    # the most recent entries survive
+    square(9)
+    assert calls == list(range(10))
+    square(0)
+    assert calls[-1] == 0
+
+
+def test_max_bytes_accepts_suffixes():
+    square, _ = counted(max_bytes='1K')
+    assert square.cache_info().max_bytes == 1024
+
+
+@pytest.mark.parametrize('limits', [{}, {'maxsize': 2}, {'max_bytes': 1 << 20},
+                                    {'policy': 'fifo'}])
+def test_cache_clear_resets_counters(limits):
+    square, calls = counted(**limits)
+    for x in (1, 2, 3, 1, 3):
+        square(x)
+    square.cache_clear()
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.evictions, info.nbytes) == (0, 0, 0, 0, 0)
+    square(1)
+    assert calls[-1] == 1
+    assert square.cache_info().misses == 1
+
+
+def test_environment_limits(monkeypatch):
+    monkeypatch.setenv(memo.ENV_MAXSIZE, '5')
+    monkeypatch.setenv(memo.ENV_MAX_BYTES, '2K')
+    monkeypatch.setenv(memo.ENV_POLICY, 'FIFO')
+    square, _ = counted()
+    assert square.cache_info()[2:] == (5, 0, 0, 0, 2048, 'fifo')
+    # explicit limits win over the environment
+    square, _ = counted(maxsize=7, policy='lru')
+    assert (square.memo.maxsize, square.memo.policy) == (7, 'lru')
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        counted(policy='random')
+
+
+def test_stats():
+    square, _ = counted(maxsize=4)
+    square(3)
+    module = type(sys)('memoized')
+    module.square = square
+    module.plain = abs
+    assert memo.module_stats(module) == {'square': square.cache_info()._asdict()}
+    assert memo.stats()[square.memo.name]['misses'] == 1
@@ -0,0 +1,69 @@
+"""aoc.runner: every puzzle on its own process, with timeouts and crash reports."""
+import json
+
+from aoc import runner
+
+
+def test_run_puzzle(puzzle_tree):
+    root, puzzles = puzzle_tree
+    result = runner.run_puzzle(puzzles[1], root)
+    assert (result['puzzle'], result['status']) == ('2099/day01', 'ok')
+    assert {name: part['answer'] for name, part in result['parts'].items()} == \
+        {'part1': 6, 'part2': 14}
+    assert result['parse_seconds'] >= 0
+
+
+def test_run_puzzle_selected_parts_and_filename(puzzle_tree, write_input):
+    root, puzzles = puzzle_tree
+    result = runner.run_puzzle(puzzles[1], root, filename=write_input('5\n'),
+                               parts=['part2_squares'])
+    assert {name: part['answer'] for name, part in result['parts'].items()} == \
+        {'part2_squares': 25}
+
+    result = runner.run_puzzle(puzzles[1], root, parts=['part3'])
+    assert result['status'] == 'error'
+    assert 'has no part3' in result['error']
+
+
+def test_run_puzzle_errors(puzzle_tree, tmp_path):
+    root, puzzles = puzzle_tree
+    result = runner.run_puzzle(puzzles[2], root)
+    assert result['status'] == 'error'
+    assert 'ArithmeticError: no answer' in result['error']
+
+    result = runner.run_puzzle(puzzles[1], tmp_path / 'elsewhere')
+    assert result['status'] == 'missing'
+    assert result['parts'] == {}
+
+
+def test_run_all_isolates_crashes_and_timeouts(puzzle_tree):
+    root, puzzles = puzzle_tree
+    results = runner.run_all([puzzles[day] for day in (4, 3, 2, 1)], root, jobs=2, timeout=1)
+    # reported in the order asked for, whatever order they finished in
+    assert [(r['day'], r['status']) for r in results] == \
+        [(4, 'timeout'), (3, 'crashed'), (2, 'error'), (1, 'ok')]
+    assert results[1]['error'] == 'exit code 3'
+    assert 1 <= results[0]['wall_seconds'] < 10
+    assert results[3]['parts']['part2']['answer'] == 14
+
+
+def test_format_report(puzzle_tree):
+    root, puzzles = puzzle_tree
+    lines = runner.format_report([runner.run_puzzle(puzzles[day], root) for day in (1, 2)])
+    lines = lines.splitlines()
+    # the error line is followed by the rest of its traceback
+    assert [line.split()[:2] for line in lines[:3]] == \
+        [['2099/day01', 'part1'], ['2099/day01', 'part2'], ['2099/day02', 'error']]
+    assert lines[0].endswith(' 6')
+    assert lines[-1] == 'ArithmeticError: no answer'
+
+
+def test_main_exit_code_and_json(puzzle_tree, monkeypatch, tmp_path, capsys):
+    root, puzzles = puzzle_tree
+    monkeypatch.setattr(runner, 'discover', lambda years, days: [puzzles[d] for d in days])
+    report = tmp_path / 'report.json'
+    assert runner.main(['--input-root', str(root), '--day', '1', '--json', str(report),
+                        '--no-cache']) == 0
+    assert json.loads(report.read_text())['results'][0]['parts']['part1']['answer'] == 6
+    assert runner.main(['--input-root', str(root), '--day', '1', '--day', '2', '--no-cache']) == 1
+    assert '2 puzzles in' in capsys.readouterr().out
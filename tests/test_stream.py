@@ -0,0 +1,79 @@
+"""aoc.stream: lines and line-aligned byte ranges of a memory-mapped file."""
+import pytest
+
+from aoc import stream
+
+
+TEXT = b'alpha\nbeta\r\n\ngamma delta\nepsilon'
+
+
+def line_count(filename, start, end):
+    """Module level, so map_ranges can run it on worker processes."""
+    return sum(1 for _ in stream.lines(filename, start, end))
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_bytes(TEXT)
+    return path
+
+
+def test_lines(text_file):
+    # \r\n endings are trimmed, blank lines kept, and the last line needs no newline
+    assert list(stream.lines(text_file)) == [b'alpha', b'beta', b'', b'gamma delta', b'epsilon']
+    assert list(stream.text_lines(text_file))[-2:] == ['gamma delta', 'epsilon']
+    with stream.LineSource(text_file) as source:
+        assert b''.join(source.lines(keepends=True)) == TEXT
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    with stream.LineSource(path) as source:
+        assert len(source) == 0
+        assert list(source.lines()) == list(source.chunks()) == source.split(4) == []
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5, 50])
+def test_split_covers_the_file_on_line_boundaries(text_file, n):
+    ranges = stream.split(text_file, n)
+    assert 1 <= len(ranges) <= n
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(TEXT)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(TEXT[start - 1:start] == b'\n' for start, _ in ranges[1:])
+    assert [line for start, end in ranges for line in stream.lines(text_file, start, end)] == \
+        list(stream.lines(text_file))
+
+
+def test_range_past_the_end(text_file):
+    assert list(stream.lines(text_file, 6, 10 ** 6)) == [b'beta', b'', b'gamma delta', b'epsilon']
+    assert list(stream.lines(text_file, 10 ** 6)) == []
+
+
+@pytest.mark.parametrize('size', [1, 7, 1 << 20])
+def test_chunks_are_whole_lines(text_file, size):
+    with stream.LineSource(text_file) as source:
+        chunks = []
+        for chunk in source.chunks(size):
+            chunks.append(bytes(chunk))
+            chunk.release()
+    assert b''.join(chunks) == TEXT
+    assert all(chunk.endswith(b'\n') for chunk in chunks[:-1])
+
+
+def test_close_while_a_chunk_is_held(text_file):
+    source = stream.LineSource(text_file)
+    chunk = next(source.chunks())
+    source.close()
+    assert bytes(chunk[:5]) == b'alpha'
+
+
+def test_map_ranges(text_file, monkeypatch):
+    # a small file is one range, done in this process
+    assert stream.map_ranges(line_count, text_file, workers=4) == [5]
+
+    monkeypatch.setattr(stream, 'CHUNK_SIZE', 8)
+    counts = stream.map_ranges(line_count, text_file, workers=3)
+    assert len(counts) == 3
+    assert sum(counts) == 5